@@ -19,9 +19,11 @@ import docstring_parser
 from natsort import os_sorted
 
 import cdxev.amend.command as amend
+import cdxev.build_public_bom
 import cdxev.set
 from cdxev import pkg
 from cdxev.amend.operations import Operation
+from cdxev.auxiliary.cache import default_cache_dir
 from cdxev.auxiliary.identity import Key, KeyType
 from cdxev.auxiliary.io_processing import (
     add_input_argument,
@@ -35,7 +37,8 @@ from cdxev.initialize_sbom import initialize_sbom
 from cdxev.list_command import list_command
 from cdxev.log import configure_logging
 from cdxev.merge import merge
-from cdxev.validator import validate_sbom
+from cdxev.validator import SchemaSource, validate_sbom
+from cdxev.validator.profiling import ValidationProfile
 from cdxev.vex import vex
 
 logger: logging.Logger
@@ -382,6 +385,18 @@ def create_amend_parser(
         choices=list(operations_by_name.keys()),
         metavar="<operation>",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        metavar="<n>",
+        help=(
+            "The number of processes to run component-local operations in. The top-level "
+            "components and their subcomponents are divided among them. Other operations run "
+            "serially. Defaults to 1."
+        ),
+        type=int,
+        default=1,
+    )
 
     # Add arguments for operation options
     for group, args in argument_groups.items():
@@ -496,6 +511,24 @@ def create_vex_parser(
     return parser
 
 
+class _AppendSchemaSource(argparse.Action):
+    """
+    Appends the value to the list of the option and records it as a :py:class:`SchemaSource` in
+    ``schemas``, which keeps the order of --schema-type and --schema-path on the command line.
+    """
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: t.Any,
+        option_string: t.Optional[str] = None,
+    ) -> None:
+        # New lists, so the defaults are never modified
+        for dest, value in ((self.dest, values), ("schemas", SchemaSource(**{self.dest: values}))):
+            setattr(namespace, dest, [*(getattr(namespace, dest, None) or []), value])
+
+
 # noinspection PyUnresolvedReferences,PyProtectedMember
 def create_validation_parser(
     subparsers: argparse._SubParsersAction,
@@ -505,17 +538,24 @@ def create_validation_parser(
     )
     add_input_argument(parser)
 
-    group = parser.add_mutually_exclusive_group()
-    group.add_argument(
+    parser.add_argument(
         "--schema-type",
-        help="Use a built-in schema for validation.",
+        help=(
+            "Use a built-in schema for validation. Can be given multiple times and combined with "
+            "--schema-path to validate against several schemas in a single run."
+        ),
         choices=["default", "strict", "custom"],
+        action=_AppendSchemaSource,
     )
-    group.add_argument(
+    parser.add_argument(
         "--schema-path",
         metavar="<schema-path>",
-        help="Path to the JSON schema file to validate against.",
+        help=(
+            "Path to the JSON schema file to validate against. Can be given multiple times and "
+            "combined with --schema-type to validate against several schemas in a single run."
+        ),
         type=Path,
+        action=_AppendSchemaSource,
     )
 
     group = parser.add_mutually_exclusive_group()
@@ -551,8 +591,60 @@ def create_validation_parser(
         ),
         type=Path,
     )
+    parser.add_argument(
+        "--report-max-issues",
+        metavar="<n>",
+        help=(
+            "Write at most this many issues to the report file. Further issues are only logged. "
+            "Use this to keep huge reports from overwhelming CI dashboards."
+        ),
+        type=int,
+    )
+    parser.add_argument(
+        "--no-cache",
+        help=(
+            "Do not look up or store validation results in the cache. By default, results are "
+            "cached, so validating an unchanged SBOM against the same schema again is instant."
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="<baseline>",
+        help=(
+            "Path to a previous version of the SBOM which has already been validated against the "
+            "same schema. Only components which changed since then are validated again, the "
+            "cached results are reused for all others. Cannot be combined with --no-cache."
+        ),
+        type=Path,
+    )
+    parser.add_argument(
+        "--profile",
+        help=(
+            "Measure where the time of the validation goes and print a breakdown by phase and "
+            "the schema keywords and locations with the highest cumulative evaluation times to "
+            "stderr. Slows down the validation itself."
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--profile-path",
+        metavar="<file>",
+        help="Write the profile as JSON to this file instead of stderr. Implies --profile.",
+        type=Path,
+    )
+    parser.add_argument(
+        "--profile-top",
+        metavar="<n>",
+        help=(
+            "The number of keywords and schema locations to include in the profile. Must be at "
+            "least 1."
+        ),
+        type=int,
+        default=10,
+    )
 
-    parser.set_defaults(cmd_handler=invoke_validate, parser=parser)
+    parser.set_defaults(cmd_handler=invoke_validate, parser=parser, schemas=[])
     return parser
 
 
@@ -574,13 +666,38 @@ def create_set_parser(
             "the input SBOM, the new value will be appended to the array."
         ),
         usage=(
-            "cdx-ev set [-h] [--output <file>] [--force] "
-            "(--from-file <file> | <target> --key <key> --value <value>) <input>"
+            "cdx-ev set [-h] [--output <file>] [--force] [--plan-only] "
+            "[--from-folder <from-folder>] [--jobs <n>] "
+            "(--from-file <file> | <target> --key <key> --value <value>) [<input> ...]"
+        ),
+    )
+    add_input_argument(
+        parser,
+        nargs="*",
+        help=(
+            "Paths to the SBOM files. If more than one SBOM is given, --output must be a "
+            "directory."
         ),
     )
-    add_input_argument(parser)
     add_output_argument(parser)
 
+    parser.add_argument(
+        "--from-folder",
+        metavar="<from-folder>",
+        help=(
+            "Path to a folder with SBOMs to update in addition to the inputs. The same updates "
+            "are applied to every SBOM and --output must be a directory."
+        ),
+        type=Path,
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        metavar="<n>",
+        help="The maximum number of SBOMs to update in parallel. Defaults to 1.",
+        type=int,
+        default=1,
+    )
     parser.add_argument(
         "--from-file",
         metavar="<file>",
@@ -627,6 +744,14 @@ def create_set_parser(
         help="Suppress warnings that a component is not present when using '--from-file' ",
         action="store_true",
     )
+    parser.add_argument(
+        "--plan-only",
+        help=(
+            "Resolve the target components of all updates and print how many components each "
+            "update targets, without modifying the SBOM. No output is written."
+        ),
+        action="store_true",
+    )
 
     identifiers = parser.add_argument_group(
         "target",
@@ -716,7 +841,14 @@ def create_build_public_bom_parser(
             "and resolves the dependencies."
         ),
     )
-    add_input_argument(parser)
+    add_input_argument(
+        parser,
+        nargs="*",
+        help=(
+            "Paths to the SBOM files. If more than one SBOM is given, --output must be a "
+            "directory."
+        ),
+    )
 
     parser.add_argument(
         "--schema-path",
@@ -735,6 +867,23 @@ def create_build_public_bom_parser(
         default=None,
         type=str,
     )
+    parser.add_argument(
+        "--from-folder",
+        metavar="<from-folder>",
+        help=(
+            "Path to a folder with SBOMs to process in addition to the inputs. --output must be "
+            "a directory."
+        ),
+        type=Path,
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        metavar="<n>",
+        help="The maximum number of SBOMs to process in parallel. Defaults to 1.",
+        type=int,
+        default=1,
+    )
     add_output_argument(parser)
     parser.set_defaults(cmd_handler=invoke_build_public_bom, parser=parser)
     return parser
@@ -842,6 +991,9 @@ def invoke_amend(args: argparse.Namespace) -> int:
     if not args.input:
         usage_error("<input> argument missing.", args.parser)
 
+    if args.jobs < 1:
+        usage_error("--jobs must be at least 1.", args.parser)
+
     # Prepare the operation options that were passed on the command-line
     config = {}
     operations = []
@@ -863,38 +1015,41 @@ def invoke_amend(args: argparse.Namespace) -> int:
 
     sbom, _ = read_sbom(args.input)
 
-    amend.run(sbom, operations, config)
+    amend.run(sbom, operations, config, args.jobs)
     write_sbom(sbom, args.output)
     return Status.OK
 
 
-def invoke_merge(args: argparse.Namespace) -> int:
-    global logger
+def _find_sboms_in_folder(
+    folder: Path, explicit_inputs: list[Path], parser: argparse.ArgumentParser
+) -> list[Path]:
+    if not folder.is_dir():
+        usage_error("Path not found or is not a directory: " + str(folder), parser)
 
-    inputs = args.input
+    # Find all SBOMs in source folder (filenames: bom.json or *.cdx.json)
+    folder_inputs: list[Path] = list(folder.glob("*.cdx.json"))
+    if (folder / "bom.json").is_file():
+        folder_inputs.append(folder / "bom.json")
 
-    if args.from_folder is not None:
-        if not args.from_folder.is_dir():
-            usage_error(
-                "Path not found or is not a directory: " + str(args.from_folder),
-                args.parser,
-            )
+    # Remove any paths which have already been provided as an explicit input
+    folder_inputs = os_sorted(p for p in folder_inputs if p not in explicit_inputs)
+
+    if len(folder_inputs) == 0:
+        logger.warning(f"No additional SBOMs found in folder: {folder}")
+
+    for input in folder_inputs:
+        logger.debug(f"Found in folder: {input}")
 
-        # Find all SBOMs in source folder (filenames: bom.json or *.cdx.json)
-        folder_inputs: list[Path] = list(args.from_folder.glob("*.cdx.json"))
-        if (args.from_folder / "bom.json").is_file():
-            folder_inputs.append(args.from_folder / "bom.json")
+    return folder_inputs
 
-        # Remove any paths which have already been provided as an explicit input
-        folder_inputs = os_sorted(p for p in folder_inputs if p not in args.input)
 
-        if len(folder_inputs) == 0:
-            logger.warning(f"No additional SBOMs found in folder: {args.from_folder}")
+def invoke_merge(args: argparse.Namespace) -> int:
+    global logger
 
-        for input in folder_inputs:
-            logger.debug(f"Found in folder: {input}")
+    inputs = args.input
 
-        inputs += folder_inputs
+    if args.from_folder is not None:
+        inputs += _find_sboms_in_folder(args.from_folder, args.input, args.parser)
 
     if len(inputs) < 2:
         usage_error(f"Not enough inputs. Must be at least 2, you have provided {len(inputs)}.")
@@ -1057,15 +1212,44 @@ def invoke_set(args: argparse.Namespace) -> int:
         except FileNotFoundError as ex:
             raise InputFileError(f"File not found: {args.from_file}", None) from ex
 
-    sbom, _ = read_sbom(args.input)
+    inputs: list[Path] = args.input
+    if args.from_folder is not None:
+        inputs += _find_sboms_in_folder(args.from_folder, args.input, args.parser)
+    elif not inputs:
+        usage_error("<input> is required, unless the --from-folder option is used.", args.parser)
+
+    if args.jobs < 1:
+        usage_error("--jobs must be at least 1.", args.parser)
+
     cfg = cdxev.set.SetConfig(
         args.force,
         args.allow_protected,
-        [args.input],
+        inputs,
         args.from_file,
         args.ignore_missing,
         args.ignore_existing,
     )
+
+    if len(inputs) != 1 or args.from_folder is not None:
+        if args.plan_only:
+            usage_error("--plan-only can only be used with a single input.", args.parser)
+        if args.output is None or (args.output.exists() and not args.output.is_dir()):
+            usage_error(
+                "--output must be a directory when updating more than one SBOM.", args.parser
+            )
+        if len({input.name for input in inputs}) != len(inputs):
+            usage_error("The names of the input files must be unique.", args.parser)
+
+        args.output.mkdir(parents=True, exist_ok=True)
+        files = [(input, args.output / input.name) for input in inputs]
+        cdxev.set.run_many(files, updates, cfg, read_sbom, args.jobs)
+        return Status.OK
+
+    sbom, _ = read_sbom(inputs[0])
+    if args.plan_only:
+        cdxev.set.plan(sbom, updates, cfg).write(sys.stdout)
+        return Status.OK
+
     cdxev.set.run(sbom, updates, cfg)
     write_sbom(sbom, args.output)
     return Status.OK
@@ -1079,28 +1263,50 @@ def invoke_validate(args: argparse.Namespace) -> int:
             args.parser,
         )
 
-    if args.schema_type is None and args.schema_path is None:
-        # Default to built-in stock schema. This case can't be handled by argparse
-        # due to an undocumented behavior which keeps options with default values
-        # from working correctly in mutually exclusive groups.
-        args.schema_type = "default"
+    if args.report_max_issues is not None:
+        if not args.report_format:
+            usage_error("--report-max-issues requires --report-format.", args.parser)
+        if args.report_max_issues < 0:
+            usage_error("--report-max-issues must not be negative.", args.parser)
+
+    if args.profile_top < 1:
+        usage_error("--profile-top must be at least 1.", args.parser)
+
+    schemas: list[SchemaSource] = args.schemas
+    if not schemas:
+        # Default to built-in stock schema
+        schemas = [SchemaSource(schema_type="default")]
+
+    if args.baseline is not None and args.no_cache:
+        usage_error("--baseline cannot be combined with --no-cache.", args.parser)
 
     sbom, file_type = read_sbom(args.input)
-    return (
-        Status.OK
-        if validate_sbom(
-            sbom=sbom,
-            input_format=file_type,
-            file=Path(args.input),
-            report_format=args.report_format,
-            report_path=args.report_path,
-            schema_type=args.schema_type,
-            filename_regex=(None if args.no_filename_validation else args.filename_pattern),
-            schema_path=args.schema_path,
-        )
-        == Status.OK
-        else Status.VALIDATION_ERROR
-    )
+    baseline = read_sbom(args.baseline)[0] if args.baseline is not None else None
+    profile = ValidationProfile() if args.profile or args.profile_path else None
+    status = validate_sbom(
+        sbom=sbom,
+        input_format=file_type,
+        file=Path(args.input),
+        report_format=args.report_format,
+        report_path=args.report_path,
+        schema_type=schemas[0].schema_type,
+        filename_regex=(None if args.no_filename_validation else args.filename_pattern),
+        schema_path=schemas[0].schema_path,
+        cache_dir=None if args.no_cache else default_cache_dir(),
+        baseline=baseline,
+        profile=profile,
+        report_max_issues=args.report_max_issues,
+        additional_schemas=schemas[1:],
+    )
+
+    if profile is not None:
+        if args.profile_path is not None:
+            with args.profile_path.open("w", encoding="utf_8") as f:
+                profile.write(f, args.profile_top, as_json=True)
+        else:
+            profile.write(sys.stderr, args.profile_top, as_json=False)
+
+    return Status.OK if status == Status.OK else Status.VALIDATION_ERROR
 
 
 def invoke_vex(args: argparse.Namespace) -> int:
@@ -1133,7 +1339,31 @@ def invoke_vex(args: argparse.Namespace) -> int:
 
 
 def invoke_build_public_bom(args: argparse.Namespace) -> int:
-    sbom, _ = read_sbom(args.input)
+    inputs: list[Path] = args.input
+    if args.from_folder is not None:
+        inputs += _find_sboms_in_folder(args.from_folder, args.input, args.parser)
+    elif not inputs:
+        usage_error("<input> is required, unless the --from-folder option is used.", args.parser)
+
+    if args.jobs < 1:
+        usage_error("--jobs must be at least 1.", args.parser)
+
+    if len(inputs) != 1 or args.from_folder is not None:
+        if args.output is None or (args.output.exists() and not args.output.is_dir()):
+            usage_error(
+                "--output must be a directory when processing more than one SBOM.", args.parser
+            )
+        if len({input.name for input in inputs}) != len(inputs):
+            usage_error("The names of the input files must be unique.", args.parser)
+
+        args.output.mkdir(parents=True, exist_ok=True)
+        files = [(input, args.output / input.name) for input in inputs]
+        cdxev.build_public_bom.run_many(
+            files, args.schema_path, args.ext_ref_regex, read_sbom, args.jobs
+        )
+        return Status.OK
+
+    sbom, _ = read_sbom(inputs[0])
     output = build_public_bom(sbom, args.schema_path, args.ext_ref_regex)
     write_sbom(output, args.output)
     return Status.OK
@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import concurrent.futures
+import hashlib
+import logging
+import mmap
+import re
+import typing as t
+import urllib.parse
+from pathlib import Path
+
+from cdxev.auxiliary.cache import JsonCache, hash_json
+from cdxev.error import AppError
+
+logger = logging.getLogger(__name__)
+
+HASH_ALGORITHMS: dict[str, t.Callable[[], t.Any]] = {
+    "MD5": hashlib.md5,
+    "SHA-1": hashlib.sha1,
+    "SHA-256": hashlib.sha256,
+    "SHA-384": hashlib.sha384,
+    "SHA-512": hashlib.sha512,
+    "SHA3-256": hashlib.sha3_256,
+    "SHA3-384": hashlib.sha3_384,
+    "SHA3-512": hashlib.sha3_512,
+    "BLAKE2b-256": lambda: hashlib.blake2b(digest_size=32),
+    "BLAKE2b-384": lambda: hashlib.blake2b(digest_size=48),
+    "BLAKE2b-512": hashlib.blake2b,
+}
+"""Maps the CycloneDX names of the supported hash algorithms to their implementations."""
+
+CHUNK_SIZE = 1024 * 1024
+"""The number of bytes passed to the hash functions at once."""
+
+ARTIFACT_NAME_FIELDS = (
+    "name",
+    "version",
+    "group",
+    "purl_type",
+    "purl_namespace",
+    "purl_name",
+    "purl_version",
+)
+"""The fields which can be used in templates for artifact names."""
+
+# The extensions of an artifact, e.g., '.tar.gz'. A part starting with a digit belongs to the
+# version instead, so 'foo-1.0.tar.gz' doesn't match 'foo-1'.
+_EXTENSIONS = re.compile(r"(?:\.[A-Za-z][A-Za-z0-9]*)+")
+
+
+def artifact_name_fields(component: dict[str, t.Any]) -> dict[str, str]:
+    """
+    Collects the values which can be used in templates for artifact names.
+
+    :param component: A component.
+    :return: The values of the fields in :py:data:`ARTIFACT_NAME_FIELDS` which are present in the
+             component.
+    """
+    fields = {
+        field_name: component[field_name]
+        for field_name in ("name", "version", "group")
+        if isinstance(component.get(field_name), str)
+    }
+    purl = component.get("purl")
+    if isinstance(purl, str) and purl.startswith("pkg:"):
+        # pkg:type/namespace/name@version?qualifiers#subpath
+        path = re.split(r"[?#]", purl[4:], maxsplit=1)[0].strip("/")
+        if "@" in path:
+            path, fields["purl_version"] = path.rsplit("@", 1)
+            fields["purl_version"] = urllib.parse.unquote(fields["purl_version"])
+        segments = [urllib.parse.unquote(segment) for segment in path.split("/")]
+        if len(segments) >= 2:
+            fields["purl_type"] = segments[0]
+            fields["purl_name"] = segments[-1]
+            if len(segments) > 2:
+                fields["purl_namespace"] = "/".join(segments[1:-1])
+    return fields
+
+
+class ArtifactIndex:
+    """
+    Finds the files in a directory, including its subdirectories, by name.
+
+    A file is found by its full name or by its name without extensions. For instance,
+    ``foo-1.0.tar.gz`` is found as ``foo-1.0.tar.gz``, ``foo-1.0.tar`` and ``foo-1.0``. Names
+    which apply to more than one file are ambiguous and don't find any.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """
+        :param directory: The directory to search.
+        """
+        self._files: dict[str, t.Optional[Path]] = {}
+        for file in sorted(directory.rglob("*")):
+            if not file.is_file():
+                continue
+            names = {file.name}
+            for dot in (i for i, char in enumerate(file.name) if char == "." and i > 0):
+                if _EXTENSIONS.fullmatch(file.name, dot):
+                    names.add(file.name[:dot])
+            for name in names:
+                self._files[name] = file if name not in self._files else None
+
+    def find(self, name: str) -> t.Optional[Path]:
+        """
+        Looks up a file.
+
+        :param name: The name of the file with or without extensions.
+        :return: The file or ``None`` if no file or more than one file has this name.
+        """
+        file = self._files.get(name)
+        if file is None and name in self._files:
+            logger.warning("Artifact name '%s' matches more than one file", name)
+        return file
+
+
+def _artifact_error(path: Path, exc: OSError) -> AppError:
+    return AppError(
+        "Artifact cannot be read",
+        f"Failed to read artifact '{path}' ({exc.strerror or exc})",
+        module_name=str(path),
+    )
+
+
+def hash_file(path: Path, algorithms: t.Sequence[str]) -> dict[str, str]:
+    """
+    Computes hashes of a file's content.
+
+    The file is memory-mapped and all hashes are computed in a single pass. The hash functions
+    release the GIL, so several files can be hashed in parallel threads.
+
+    :param path: The file to hash.
+    :param algorithms: The CycloneDX names of the algorithms. See :py:data:`HASH_ALGORITHMS`.
+    :return: Maps the algorithms to the hex digests.
+    :raises AppError: If the file cannot be read.
+    """
+    hashes = {alg: HASH_ALGORITHMS[alg]() for alg in algorithms}
+    try:
+        with path.open("rb") as f:
+            # Empty files cannot be mapped
+            if path.stat().st_size > 0:
+                with (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+                    memoryview(data) as view,
+                ):
+                    for start in range(0, len(view), CHUNK_SIZE):
+                        with view[start : start + CHUNK_SIZE] as chunk:
+                            for h in hashes.values():
+                                h.update(chunk)
+    except OSError as exc:
+        raise _artifact_error(path, exc) from exc
+    return {alg: h.hexdigest() for alg, h in hashes.items()}
+
+
+def hash_artifacts(
+    directory: Path,
+    files: t.Iterable[Path],
+    algorithms: t.Sequence[str],
+    cache: t.Optional[JsonCache] = None,
+    max_workers: t.Optional[int] = None,
+) -> dict[Path, dict[str, str]]:
+    """
+    Computes hashes of many files in a pool of threads.
+
+    If a cache is given, the hashes of the files in *directory* are remembered across runs. A
+    file is only read again if its size or modification time changed or hashes of further
+    algorithms are requested.
+
+    :param directory: The directory which contains the files. The cache holds one entry for it.
+    :param files: The files to hash.
+    :param algorithms: The CycloneDX names of the algorithms. See :py:data:`HASH_ALGORITHMS`.
+    :param cache: The cache or ``None`` to always read the files.
+    :param max_workers: The number of threads. By default, this depends on the number of CPUs.
+    :return: Maps each file to its hashes, which in turn map the algorithms to the hex digests.
+    :raises AppError: If a file cannot be read.
+    """
+    key = hash_json(["artifact-hashes", str(directory.resolve())])
+    entries: dict[str, t.Any] = (cache.get(key) if cache is not None else None) or {}
+
+    results: dict[Path, dict[str, str]] = {}
+    pending: dict[Path, tuple[str, int, int]] = {}
+    for file in files:
+        try:
+            stat = file.stat()
+        except OSError as exc:
+            raise _artifact_error(file, exc) from exc
+        file_key = str(file.resolve())
+        entry = entries.get(file_key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and all(alg in entry.get("hashes", {}) for alg in algorithms)
+        ):
+            results[file] = {alg: entry["hashes"][alg] for alg in algorithms}
+        else:
+            pending[file] = (file_key, stat.st_size, stat.st_mtime_ns)
+
+    logger.debug("Hashing %d artifacts, %d found in cache", len(pending), len(results))
+    if not pending:
+        return results
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        computed = pool.map(hash_file, pending, [algorithms] * len(pending))
+        for (file, (file_key, size, mtime_ns)), hashes in zip(
+            pending.items(), computed, strict=True
+        ):
+            results[file] = hashes
+            entries[file_key] = {"size": size, "mtime_ns": mtime_ns, "hashes": hashes}
+
+    if cache is not None:
+        # Forget files which no longer exist
+        cache.put(
+            key,
+            {file_key: entry for file_key, entry in entries.items() if Path(file_key).exists()},
+        )
+    return results
@@ -1,14 +1,19 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import concurrent.futures
+import itertools
 import logging
 import typing as t
 
 from cdxev.auxiliary.sbom_functions import walk_components
+from cdxev.log import LoggedMessages, collect_messages, relay_messages
 
 from .operations import Operation
 
 logger = logging.getLogger(__name__)
 
+Handler = t.Callable[[dict], None]
+
 
 def get_all_operations() -> list[type[Operation]]:
     return Operation.__subclasses__()
@@ -29,6 +34,7 @@ def run(
     sbom: dict,
     selected: t.Optional[list[type[Operation]]] = None,
     config: t.Optional[dict[type[Operation], dict[str, t.Any]]] = None,
+    jobs: int = 1,
 ) -> None:
     """
     Runs the amend command on an SBOM. The SBOM is modified in-place.
@@ -37,6 +43,9 @@ def run(
     :param selected: List of operation classes to run on the SBOM.
     :param config: Arguments for the operations. They will be passed to the operation's
                    __init__() method as kw-args.
+    :param jobs: The number of worker processes to run component-local operations in. If greater
+                 than 1, consecutive component-local operations run in parallel on the subtrees
+                 of the top-level components, while other operations still run serially.
     """
     # If no operations are selected, select the default operations.
     if config is None:
@@ -48,7 +57,63 @@ def run(
 
     _prepare(operations, sbom)
     _metadata(operations, sbom)
-    walk_components(sbom, _do_amend, operations, skip_meta=True)
+
+    components = sbom.get("components", [])
+    if jobs < 2 or len(components) < 2:
+        _amend_components(sbom, operations)
+        return
+
+    # Operations are run in groups of consecutive component-local or other operations, so their
+    # order is preserved.
+    for local, group in itertools.groupby(operations, lambda op: op.component_local):
+        group_operations = list(group)
+        if local:
+            sbom["components"] = _amend_in_parallel(components, group_operations, jobs)
+            components = sbom["components"]
+        else:
+            _amend_components(sbom, group_operations)
+
+
+def _amend_in_parallel(
+    components: list[dict], operations: list[Operation], jobs: int
+) -> list[dict]:
+    """
+    Runs component-local operations on the subtrees of the top-level components in a pool of
+    worker processes.
+
+    Messages logged by the operations are collected in the workers and logged again by this
+    process in the order of the shards.
+
+    :return: The amended top-level components in their original order.
+    """
+    # A few shards per worker balance the load if the subtrees differ in size.
+    shard_count = min(len(components), jobs * 4)
+    shard_size = -(-len(components) // shard_count)
+    shards = [components[i : i + shard_size] for i in range(0, len(components), shard_size)]
+
+    logger.debug("Amending %d shards of top-level components in parallel", len(shards))
+    log_level = logging.getLogger(__package__).getEffectiveLevel()
+    amended: list[dict] = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(shards))) as pool:
+        results = pool.map(
+            _amend_shard, shards, itertools.repeat(operations), itertools.repeat(log_level)
+        )
+        for shard, messages in results:
+            relay_messages(logger, messages)
+            amended.extend(shard)
+    return amended
+
+
+def _amend_shard(
+    components: list[dict], operations: list[Operation], log_level: int
+) -> tuple[list[dict], LoggedMessages]:
+    # Workers which aren't forked don't inherit the log configuration of the main process and
+    # their log wouldn't reach the user anyway.
+    package_logger = logging.getLogger(__package__)
+    package_logger.setLevel(log_level)
+    with collect_messages(package_logger) as messages:
+        _amend_components({"components": components}, operations)
+    return components, messages
 
 
 def _prepare(operations: list[Operation], sbom: dict) -> None:
@@ -56,17 +121,39 @@ def _prepare(operations: list[Operation], sbom: dict) -> None:
         operation.prepare(sbom)
 
 
+def _handlers(operations: list[Operation], method: str) -> list[Handler]:
+    """
+    Builds the dispatch table for one of the ``handle_*`` methods.
+
+    :param operations: The operations in the order they should run.
+    :param method: The name of the method, e.g., ``"handle_component"``.
+    :return: The bound methods of those operations which override the no-op of
+             :py:class:`Operation`.
+    """
+    noop = getattr(Operation, method)
+    return [getattr(op, method) for op in operations if getattr(type(op), method) is not noop]
+
+
 def _metadata(operations: list[Operation], sbom: dict) -> None:
     if "metadata" not in sbom:
         return
 
     logger.debug("Processing metadata")
     metadata = sbom["metadata"]
-    for operation in operations:
-        operation.handle_metadata(metadata)
+    for handler in _handlers(operations, "handle_metadata"):
+        handler(metadata)
 
 
-def _do_amend(component: dict, operations: list[Operation]) -> None:
-    for operation in operations:
-        logger.debug("Processing component %s", (component.get("bom-ref", "<no bom-ref>")))
-        operation.handle_component(component)
+def _amend_components(sbom: dict, operations: list[Operation]) -> None:
+    # All operations are applied to a component before the walk moves on, so the tree is
+    # traversed only once regardless of the number of operations.
+    handlers = _handlers(operations, "handle_component")
+    if handlers:
+        walk_components(sbom, _do_amend, handlers, skip_meta=True)
+
+
+def _do_amend(component: dict, handlers: list[Handler]) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Processing component %s", component.get("bom-ref", "<no bom-ref>"))
+    for handler in handlers:
+        handler(component)
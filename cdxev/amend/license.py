@@ -1,5 +1,10 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import functools
+import importlib.resources
+import json
+import re
+import typing as t
 from collections.abc import Callable
 
 
@@ -47,3 +52,83 @@ def foreach_license(callable: Callable[[dict, dict], None], component: dict) ->
 
         license = license_container["license"]
         callable(license, component)
+
+
+class LicenseNameIndex:
+    """
+    Looks up SPDX ids by license name.
+
+    The index is built from a list of mappings, each with an SPDX expression ``exp`` and a list of
+    ``names`` commonly used for it. A name is first looked up case-insensitively. If that fails,
+    the name is normalized with :py:func:`normalize_license_name` and looked up again. Normalized
+    names which would map to more than one expression are left out of the index.
+    """
+
+    def __init__(self, mappings: t.Iterable[dict[str, t.Any]]) -> None:
+        """
+        :param mappings: Objects with the keys ``exp`` and ``names``.
+        """
+        self._exact: dict[str, str] = {}
+        normalized: dict[str, t.Optional[str]] = {}
+        for mapping in mappings:
+            for name in mapping["names"]:
+                self._exact[name.lower()] = mapping["exp"]
+                key = normalize_license_name(name)
+                if normalized.setdefault(key, mapping["exp"]) != mapping["exp"]:
+                    normalized[key] = None
+        self._normalized = {key: exp for key, exp in normalized.items() if exp is not None}
+
+    def find_id(self, name: str) -> t.Optional[str]:
+        """
+        Finds the SPDX id for a license name.
+
+        :param name: The name of a license.
+        :return: The SPDX id or ``None`` if the name is unknown.
+        """
+        exp = self._exact.get(name.lower())
+        if exp is None:
+            exp = self._normalized.get(normalize_license_name(name))
+        return exp
+
+
+_PUNCTUATION = re.compile(r"[^\w.+]+")
+_NON_DECIMAL_DOT = re.compile(r"(?<!\d)\.|\.(?!\d)")
+_VERSION_WORD = re.compile(r"\b(?:version|v)\s*(?=\d)")
+_TRAILING_ZEROS = re.compile(r"(?<=\d)(?:\.0)+(?![.\d])")
+
+
+def normalize_license_name(name: str) -> str:
+    """
+    Reduces a license name to a canonical form, so that spelling variants of the same name
+    compare equal.
+
+    Case, whitespace and punctuation are ignored, except for ``+`` and decimal points. A version
+    number may be preceded by ``version`` or ``v`` and trailing zero components of version numbers
+    are ignored. For instance, ``Apache License, Version 2.0`` and ``apache-license (v2)`` are
+    both normalized to ``apache license 2``.
+
+    :param name: The name of a license.
+    :return: The normalized name.
+    """
+    name = _PUNCTUATION.sub(" ", name.casefold())
+    name = _NON_DECIMAL_DOT.sub(" ", name)
+    name = _VERSION_WORD.sub("", name)
+    name = _TRAILING_ZEROS.sub("", name)
+    return " ".join(name.split())
+
+
+@functools.cache
+def license_name_index() -> LicenseNameIndex:
+    """
+    Returns the index of license names known to the tool.
+
+    The mappings are largely sourced from https://github.com/CycloneDX/cyclonedx-core-java/ and
+    https://spdx.org/licenses/. The index is built on the first call and shared by all later
+    calls in the same process.
+
+    :return: The index.
+    """
+    mapping_file = (
+        importlib.resources.files(__spec__.parent) / "license_name_spdx_id_map.json"  # type: ignore[arg-type]  # noqa: E501
+    )
+    return LicenseNameIndex(json.loads(mapping_file.read_text(encoding="utf_8_sig")))
@@ -50,12 +50,16 @@ If you want to add additional operations to the amend command, do it like this:
    * You MUST add a docstring to `__init__()` which describes the parameter. This description will
      be visible in the command-line help text.
 
+#. If your operation's ``handle_component()`` only reads and modifies the component passed to it,
+   set the class attribute ``component_local = True``. This allows running it in parallel with
+   ``--jobs``. **Do not** set it if the operation collects information across components.
+
 #. If you want to add your operation to the default set, add the :py:func:`default` decorator.
    See above about important considerations before doing so.
 
 """
 
-import importlib.resources
+import functools
 import json
 import logging
 import typing as t
@@ -64,13 +68,30 @@ from pathlib import Path
 
 import charset_normalizer
 
-from cdxev.amend.license import foreach_license, license_has_id, license_has_text
+from cdxev.amend.artifacts import (
+    ARTIFACT_NAME_FIELDS,
+    HASH_ALGORITHMS,
+    ArtifactIndex,
+    artifact_name_fields,
+    hash_artifacts,
+)
+from cdxev.amend.license import (
+    foreach_license,
+    license_has_id,
+    license_has_text,
+    license_name_index,
+)
+from cdxev.auxiliary.cache import JsonCache, default_cache_dir
 from cdxev.auxiliary.identity import ComponentIdentity
+from cdxev.auxiliary.sbom_functions import UniqueList, walk_components
 from cdxev.error import AppError
 from cdxev.log import LogMessage
 
 logger = logging.getLogger(__name__)
 
+LICENSE_TEXT_CACHE_SIZE = 256
+"""The number of license text files whose decoded content is kept in memory."""
+
 
 def default(cls: type["Operation"]) -> type["Operation"]:
     """
@@ -89,6 +110,14 @@ class Operation:
     Subclasses should override these methods where necessary.
     """
 
+    component_local: t.ClassVar[bool] = False
+    """
+    Whether :py:meth:`handle_component` only depends on and modifies the component passed to it.
+
+    Operations which set this to ``True`` must not accumulate state across components. They can
+    then be run in parallel on different parts of the component tree.
+    """
+
     def prepare(self, sbom: dict) -> None:
         """
         The prepare method will be called once before starting the walk through the SBOM.
@@ -116,6 +145,8 @@ class AddBomRef(Operation):
     have an SBOM.
     """
 
+    component_local = True
+
     def handle_metadata(self, metadata: dict) -> None:
         if "component" in metadata:
             self._add_bom_ref(metadata["component"])
@@ -145,7 +176,7 @@ class Compositions(Operation):
     """
 
     __compositions: list
-    __unknown_assemblies: list
+    __unknown_assemblies: UniqueList[str]
     __metacomp_aggregate: t.Optional[str]
 
     def prepare(self, sbom: dict) -> None:
@@ -170,7 +201,7 @@ class Compositions(Operation):
         # Replace any existing compositions with a new, empty list
         self.__compositions.clear()
         self.__compositions.append({"aggregate": "unknown", "assemblies": []})
-        self.__unknown_assemblies = self.__compositions[0]["assemblies"]
+        self.__unknown_assemblies = UniqueList(self.__compositions[0]["assemblies"])
 
     def handle_metadata(self, metadata: dict) -> None:
         metacomp = metadata.get("component", {}).get("bom-ref", None)
@@ -183,8 +214,13 @@ class Compositions(Operation):
                 for comp in self.__compositions
                 if comp["aggregate"] == self.__metacomp_aggregate
             )
-            assemblies = composition.setdefault("assemblies", [])
-            self.__append_unique_assembly(assemblies, metacomp)
+            if composition is self.__compositions[0]:
+                # Components are added to this one later, so it must stay tracked by one object.
+                self.__unknown_assemblies.append(metacomp)
+            else:
+                assemblies = composition.setdefault("assemblies", [])
+                if metacomp not in assemblies:
+                    assemblies.append(metacomp)
         except StopIteration:
             composition = {
                 "aggregate": self.__metacomp_aggregate,
@@ -200,12 +236,7 @@ class Compositions(Operation):
 
     def __add_to_assemblies(self, bom_ref: str) -> None:
         logger.debug("Added %s to compositions.", bom_ref)
-        self.__append_unique_assembly(self.__unknown_assemblies, bom_ref)
-
-    @staticmethod
-    def __append_unique_assembly(assemblies: list, bom_ref: str) -> None:
-        if bom_ref not in assemblies:
-            assemblies.append(bom_ref)
+        self.__unknown_assemblies.append(bom_ref)
 
 
 @default
@@ -249,6 +280,8 @@ class InferSupplier(Operation):
     ``http`` or ``https`` scheme.
     """
 
+    component_local = True
+
     def infer_supplier(self, component: dict) -> None:
         if "supplier" in component:
             return
@@ -298,33 +331,30 @@ class LicenseNameToId(Operation):
     For any license on a component or the metadata component that is declared with a name but no
     id, this operation attempts to replace the name with a matching SPDX id. The operation
     contains a lookup table of common license names to SPDX ids largely sourced from
-    https://github.com/CycloneDX/cyclonedx-core-java/ and https://spdx.org/licenses/.
+    https://github.com/CycloneDX/cyclonedx-core-java/ and https://spdx.org/licenses/. Names are
+    matched regardless of case, whitespace, punctuation and the spelling of version numbers, e.g.,
+    ``Apache License, Version 2.0`` and ``apache-license (v2)`` are treated alike.
 
     Licenses that already have an id are skipped. If no corresponding id can be found, the license
     is also skipped.
     """
 
-    license_map: dict[str, str] = {}
+    component_local = True
 
     def prepare(self, sbom: dict) -> None:
-        license_mapping_file = (
-            importlib.resources.files(__spec__.parent) / "license_name_spdx_id_map.json"  # type: ignore[arg-type]  # noqa: E501
-        )
-        license_mapping_json = license_mapping_file.read_text(encoding="utf_8_sig")
-        license_mapping = json.loads(license_mapping_json)
-        for mapping in license_mapping:
-            for name in mapping["names"]:
-                self.license_map[name.lower()] = mapping["exp"]
+        # Builds the index now rather than for the first license. It is kept for the remainder of
+        # the process.
+        license_name_index()
 
     def _do_it(self, license: dict, component: dict) -> None:
         if license_has_id(license):
             return
 
-        name = license["name"].lower()
-        if name not in self.license_map:
+        name = license["name"]
+        id = license_name_index().find_id(name)
+        if id is None:
             return
 
-        id = self.license_map[name]
         license["id"] = id
         del license["name"]
 
@@ -356,18 +386,22 @@ class AddLicenseText(Operation):
     declared in the SBOM. The filename's extension is ignored or might even be missing.
 
     This operation skips licenses with an SPDX id as well as licenses which already contain a text.
-    """
 
-    license_files: dict[str, Path] = {}
-    """Maps filenames to path."""
-    aliases: dict[str, str] = {}
-    """Maps filename without extension to full filename."""
+    A file is only read when a license refers to it. Its decoded text is then reused for every
+    further reference, as long as the file isn't modified.
+    """
 
     def __init__(self, license_dir: Path) -> None:
         """
         :param license_dir: Path to a folder with files containing license texts.
         """
         self.license_dir = license_dir
+        self.license_files: dict[str, Path] = {}
+        """Maps filenames to path."""
+        self.aliases: dict[str, str] = {}
+        """Maps filename without extension to full filename."""
+        self._texts: dict[Path, str] = {}
+        """The texts of the files already used in this run."""
 
     def _add_text(self, license: dict, text: str) -> None:
         license["text"] = {"content": text}
@@ -380,13 +414,9 @@ class AddLicenseText(Operation):
             return None
 
         file = self.license_files[license_name]
-        match = charset_normalizer.from_path(file).best()
-        if match is None:
-            raise AppError("File encoding cannot be determined", module_name=str(file))
-        text = str(match)
-        # Escape string for inclusion in json. The slice is to remove the surrounding
-        # double-quotes added by json.dumps()
-        return json.dumps(text)[1:-1]
+        if file not in self._texts:
+            self._texts[file] = _read_license_text(file, file.stat().st_mtime_ns)
+        return self._texts[file]
 
     def _do_it(self, license: dict, component: dict) -> None:
         if license_has_id(license) or license_has_text(license):
@@ -411,6 +441,9 @@ class AddLicenseText(Operation):
                 "Not found or not a directory: " + str(self.license_dir),
             )
 
+        self.license_files = {}
+        self.aliases = {}
+        self._texts = {}
         listing = (file for file in self.license_dir.glob("*") if file.is_file())
         for file in listing:
             self.license_files[file.name.lower()] = file
@@ -426,6 +459,27 @@ class AddLicenseText(Operation):
         foreach_license(self._do_it, component)
 
 
+@functools.lru_cache(maxsize=LICENSE_TEXT_CACHE_SIZE)
+def _read_license_text(file: Path, mtime_ns: int) -> str:
+    """
+    Reads and decodes a license text file.
+
+    The result is cached for the remainder of the process. The modification time is part of the
+    cache key, so a file which changed in the meantime is read again.
+
+    :param file: The file to read.
+    :param mtime_ns: The modification time of the file.
+    :return: The text, escaped for inclusion in JSON.
+    """
+    match = charset_normalizer.from_path(file).best()
+    if match is None:
+        raise AppError("File encoding cannot be determined", module_name=str(file))
+    text = str(match)
+    # Escape string for inclusion in json. The slice is to remove the surrounding
+    # double-quotes added by json.dumps()
+    return json.dumps(text)[1:-1]
+
+
 class DeleteAmbiguousLicenses(Operation):
     """
     Deletes license claims which are solely identified by the ``name`` property.
@@ -438,6 +492,8 @@ class DeleteAmbiguousLicenses(Operation):
     disabled by default.
     """
 
+    component_local = True
+
     def _has_text(self, license: dict) -> bool:
         if license.get("text", {}).get("content", "") != "":
             return True
@@ -487,3 +543,120 @@ class DeleteAmbiguousLicenses(Operation):
 
     def handle_component(self, component: dict) -> None:
         self._filter_licenses(component)
+
+
+class AddArtifactHashes(Operation):
+    """
+    Adds the hashes of built artifacts to components.
+
+    When using this operation, the user must also specify a directory where the artifacts are
+    stored. Each component is matched to a file in this directory or its subdirectories by a name
+    which is built from the component according to a template. The file may have additional
+    extensions, e.g., the name "foo-1.0" matches the file "foo-1.0.tar.gz".
+
+    Hashes computed for the same algorithms replace existing hashes in the component. Other hashes
+    are kept. Components without a matching file are left unchanged.
+
+    The hashes of the artifacts are cached, so unchanged files aren't read again in later runs.
+    """
+
+    component_local = True
+
+    def __init__(
+        self,
+        artifact_dir: Path,
+        artifact_name: str = "{name}-{version}",
+        hash_algorithms: str = "SHA-256",
+        hash_cache: str = "",
+    ) -> None:
+        """
+        :param artifact_dir: Path to a folder with the artifacts.
+        :param artifact_name: The template for the artifact name of a component. The fields {name},
+                              {version} and {group} are taken from the component, {purl_type},
+                              {purl_namespace}, {purl_name} and {purl_version} from its purl.
+        :param hash_algorithms: Comma-separated list of the hash algorithms to compute. Supported
+                                are MD5, SHA-1, SHA-256, SHA-384, SHA-512, SHA3-256, SHA3-384,
+                                SHA3-512, BLAKE2b-256, BLAKE2b-384 and BLAKE2b-512.
+        :param hash_cache: Path to a folder for the hash cache. By default, the cache is kept with
+                           the other caches of the tool.
+        """
+        self.artifact_dir = artifact_dir
+        self.artifact_name = artifact_name
+        self.hash_algorithms = [alg.strip() for alg in hash_algorithms.split(",") if alg.strip()]
+        self.hash_cache = Path(hash_cache) if hash_cache else default_cache_dir() / "artifacts"
+        self._artifacts: dict[str, t.Optional[Path]] = {}
+        self._hashes: dict[Path, dict[str, str]] = {}
+
+        unknown = [alg for alg in self.hash_algorithms if alg not in HASH_ALGORITHMS]
+        if unknown or not self.hash_algorithms:
+            raise AppError(
+                "Unsupported hash algorithm",
+                f"Cannot compute hashes '{hash_algorithms}'. Supported algorithms are: "
+                + ", ".join(HASH_ALGORITHMS),
+            )
+        try:
+            artifact_name.format_map(dict.fromkeys(ARTIFACT_NAME_FIELDS, ""))
+        except (KeyError, IndexError, ValueError) as exc:
+            raise AppError(
+                "Invalid artifact name",
+                f"The template '{artifact_name}' is invalid ({exc!r}). Supported fields are: "
+                + ", ".join("{" + field_name + "}" for field_name in ARTIFACT_NAME_FIELDS),
+            ) from exc
+
+    def _name_artifact(self, component: dict) -> t.Optional[str]:
+        try:
+            return self.artifact_name.format_map(artifact_name_fields(component))
+        except KeyError:
+            # The component lacks a field used in the template
+            return None
+
+    def prepare(self, sbom: dict) -> None:
+        if not self.artifact_dir.is_dir():
+            raise AppError(
+                "Artifact directory not found",
+                "Not found or not a directory: " + str(self.artifact_dir),
+            )
+
+        # The artifacts of all components are hashed up front, so the files can be read in
+        # parallel.
+        index = ArtifactIndex(self.artifact_dir)
+        self._artifacts = {}
+
+        def find(component: dict) -> None:
+            name = self._name_artifact(component)
+            if name is not None and name not in self._artifacts:
+                self._artifacts[name] = index.find(name)
+
+        walk_components(sbom, find)
+        files = {file for file in self._artifacts.values() if file is not None}
+        self._hashes = hash_artifacts(
+            self.artifact_dir, sorted(files), self.hash_algorithms, JsonCache(self.hash_cache)
+        )
+
+    def _add_hashes(self, component: dict) -> None:
+        name = self._name_artifact(component)
+        file = self._artifacts.get(name) if name is not None else None
+        if file is None:
+            return
+
+        computed = self._hashes[file]
+        hashes = [h for h in component.get("hashes", []) if h.get("alg") not in computed]
+        hashes.extend({"alg": alg, "content": content} for alg, content in computed.items())
+        component["hashes"] = hashes
+
+        component_id = ComponentIdentity.create(component, True)
+        logger.info(
+            LogMessage(
+                "Hashes added",
+                f"Added hashes of artifact '{file.name}' to component {component_id}",
+            )
+        )
+
+    def handle_metadata(self, metadata: dict) -> None:
+        if "component" not in metadata:
+            return
+
+        self._add_hashes(metadata["component"])
+
+    def handle_component(self, component: dict) -> None:
+        self._add_hashes(component)
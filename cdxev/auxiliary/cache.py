@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import typing as t
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+"""Default upper bound for the size of a single cache directory in bytes."""
+
+
+def default_cache_dir() -> Path:
+    """
+    Returns the directory in which the tool keeps its persistent caches.
+
+    This is ``$XDG_CACHE_HOME/cdx-ev`` if the environment variable is set. Otherwise, it is
+    ``%LOCALAPPDATA%\\cdx-ev`` on Windows and ``~/.cache/cdx-ev`` everywhere else.
+
+    :return: The path to the cache directory. The directory is not created by this function.
+    """
+    if xdg_cache_home := os.environ.get("XDG_CACHE_HOME"):
+        return Path(xdg_cache_home) / "cdx-ev"
+    if os.name == "nt" and (local_app_data := os.environ.get("LOCALAPPDATA")):
+        return Path(local_app_data) / "cdx-ev"
+    return Path.home() / ".cache" / "cdx-ev"
+
+
+def hash_json(obj: t.Any) -> str:
+    """
+    Computes a SHA-256 digest of a JSON-serializable object.
+
+    The object is serialized in a canonical form (sorted keys, no insignificant whitespace), so
+    two objects which compare equal produce the same digest, regardless of key order.
+
+    :param obj: The object to hash.
+    :return: The hex digest.
+    """
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf_8")).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    """
+    Computes a SHA-256 digest of a file's content.
+
+    :param path: The file to hash.
+    :return: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class JsonCache:
+    """
+    A directory of JSON documents, each stored under a key, with size-bounded LRU eviction.
+
+    Recency is tracked through the modification time of the cache files, which is refreshed on
+    every hit. Once the total size of the directory exceeds *max_size*, the least recently used
+    entries are deleted.
+
+    The cache is strictly best-effort. A cache directory which cannot be read or written behaves
+    like an empty cache and never causes the calling command to fail.
+    """
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        :param directory: The directory holding the cache files. It is created on the first write.
+        :param max_size: The maximum total size of all cache files in bytes.
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (key + ".json")
+
+    def get(self, key: str) -> t.Optional[t.Any]:
+        """
+        Looks up an entry.
+
+        :param key: The key of the entry. Must be usable as a filename, e.g., a hex digest.
+        :return: The stored object or ``None`` if there is no (readable) entry for *key*.
+        """
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf_8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Mark the entry as recently used
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+        return value
+
+    def put(self, key: str, value: t.Any) -> None:
+        """
+        Stores an entry, replacing any previous entry with the same key.
+
+        :param key: The key of the entry. Must be usable as a filename, e.g., a hex digest.
+        :param value: A JSON-serializable object.
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so concurrent readers never see partial entries.
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf_8") as f:
+                    json.dump(value, f, separators=(",", ":"))
+                os.replace(tmp_name, self._path(key))
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+                raise
+        except OSError as exc:
+            logger.debug("Failed to write cache entry %s: %s", key, exc)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+        with contextlib.suppress(OSError):
+            for path in self.directory.glob("*.json"):
+                with contextlib.suppress(OSError):
+                    stat = path.stat()
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                    total_size += stat.st_size
+
+        if total_size <= self.max_size:
+            return
+
+        # Least recently used entries first
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                total_size -= size
+                logger.debug("Evicted cache entry %s", path.name)
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from enum import Enum
 from functools import total_ordering
 from re import fullmatch
-from typing import Any, Callable, Optional, Sequence
+from typing import Any, Callable, Generic, Hashable, Iterable, Optional, Sequence, TypeVar
 
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.component import Component
@@ -20,6 +20,8 @@ from cdxev.log import LogMessage
 
 logger = logging.getLogger(__name__)
 
+H = TypeVar("H", bound=Hashable)
+
 
 @dataclass(frozen=True, order=True)
 class SpecVersion:
@@ -284,6 +286,49 @@ def walk_components(
     _recurse(sbom["components"], func, *args, **kwargs)
 
 
+class UniqueList(Generic[H]):
+    """
+    Appends items to a list unless the list already contains them.
+
+    The list keeps its insertion order and stays the object stored in the SBOM. Its items are
+    additionally tracked in a set, so appending takes constant instead of linear time. While in
+    use, the list must only be modified through this object.
+    """
+
+    def __init__(self, items: list[H]) -> None:
+        """
+        :param items: The list to append to. It may already contain items, including duplicates,
+                      which are kept.
+        """
+        self.items = items
+        self._seen = set(items)
+
+    def __contains__(self, item: H) -> bool:
+        return item in self._seen
+
+    def append(self, item: H) -> bool:
+        """
+        Appends an item if it isn't in the list yet.
+
+        :param item: The item to append.
+        :return: ``True`` if the item was appended.
+        """
+        if item in self._seen:
+            return False
+        self._seen.add(item)
+        self.items.append(item)
+        return True
+
+    def extend(self, items: Iterable[H]) -> None:
+        """
+        Appends all items which aren't in the list yet, in the given order.
+
+        :param items: The items to append.
+        """
+        for item in items:
+            self.append(item)
+
+
 def make_bom_refs_unique(list_of_sboms: Sequence[dict]) -> None:
     assigned_bom_refs: dict[ComponentIdentity, str] = {}
 
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import concurrent.futures
 import json
 import logging
 import re
@@ -9,12 +10,82 @@ from typing import Any, Sequence
 
 from jsonschema import Draft7Validator, FormatChecker
 
-from cdxev.auxiliary.sbom_functions import extract_components
-from cdxev.log import LogMessage
+from cdxev.auxiliary.io_processing import write_sbom
+from cdxev.error import AppError
+from cdxev.log import FileResult, LogMessage, collect_messages, relay_messages
+from cdxev.validator.keywords import json_key
 
 logger = logging.getLogger(__name__)
 
 
+# Properties whose names start with this prefix, in any case, are internal
+_INTERNAL_PROPERTY_PREFIX = "internal:"
+
+
+class ComponentCleaner:
+    """
+    Removes internal properties and unwanted external references from components.
+
+    The regex for external references is compiled once and reused for all components. Lists
+    are only replaced if something is removed from them.
+
+    Parameters
+    ----------
+    ext_ref_regex: str | re.Pattern | None
+        The regex pattern or compiled pattern for external references to remove.
+        If ``None``, no external references are removed.
+    """
+
+    def __init__(self, ext_ref_regex: t.Union[str, re.Pattern[str], None] = None) -> None:
+        self.ext_ref_pattern = (
+            re.compile(ext_ref_regex) if isinstance(ext_ref_regex, str) else ext_ref_regex
+        )
+
+    def clear_properties(self, component: dict[str, Any]) -> None:
+        """
+        Removes the properties tagged as internal from a component and deletes the
+        ``properties`` if none remain.
+        """
+        properties = component.get("properties")
+        if properties is None:
+            return
+        prefix = _INTERNAL_PROPERTY_PREFIX
+        public_properties = [
+            entry for entry in properties if entry.get("name", "")[: len(prefix)].lower() != prefix
+        ]
+        if not public_properties:
+            del component["properties"]
+        elif len(public_properties) != len(properties):
+            component["properties"] = public_properties
+
+    def clear_external_references(self, component: dict[str, Any]) -> None:
+        """
+        Removes the external references whose URL matches the pattern from a component and
+        deletes the ``externalReferences`` if none remain.
+        """
+        references = component.get("externalReferences")
+        if references is None:
+            return
+        if self.ext_ref_pattern is not None:
+            match = self.ext_ref_pattern.match
+            references = [ref for ref in references if not match(ref["url"])]
+        if not references:
+            del component["externalReferences"]
+        elif len(references) != len(component["externalReferences"]):
+            component["externalReferences"] = references
+
+    def clear(self, component: dict[str, Any]) -> None:
+        """
+        Clears a component and all components nested in it, at any depth.
+        """
+        pending = [component]
+        while pending:
+            current = pending.pop()
+            self.clear_properties(current)
+            self.clear_external_references(current)
+            pending.extend(current.get("components", ()))
+
+
 def remove_internal_information_from_properties(component: dict[str, Any]) -> None:
     """
     Removes information from properties, that are
@@ -32,20 +103,12 @@ def remove_internal_information_from_properties(component: dict[str, Any]) -> No
     -------
     None
     """
-    new_properties = [
-        entry
-        for entry in component.get("properties", [])
-        if not re.search("^internal:", entry.get("name").lower())
-    ]
-    # if the component has public properties, replace old properties list with new one
-    # otherwise delete empty key-value pair
-    if new_properties != []:
-        component["properties"] = new_properties
-    else:
-        component.pop("properties", None)
+    ComponentCleaner().clear_properties(component)
 
 
-def validate_external_references(regex: t.Union[str, None], component: dict) -> None:
+def validate_external_references(
+    regex: t.Union[str, re.Pattern[str], None], component: dict
+) -> None:
     """
     Checks the external references of a component and
     removes any that match the regex pattern.
@@ -53,7 +116,7 @@ def validate_external_references(regex: t.Union[str, None], component: dict) ->
 
     Parameters
     ----------
-    regex: str
+    regex: str | re.Pattern
         The regex pattern
     component: dict
         A component dictionary
@@ -62,19 +125,12 @@ def validate_external_references(regex: t.Union[str, None], component: dict) ->
     -------
     None
     """
-    references = component.get("externalReferences", [])
-    if regex is not None:
-        new_references = [ref for ref in references if not re.match(regex, ref["url"])]
-        if new_references != []:
-            component["externalReferences"] = new_references
-        else:
-            component.pop("externalReferences", None)
-    else:
-        if not references:
-            component.pop("externalReferences", None)
+    ComponentCleaner(regex).clear_external_references(component)
 
 
-def clear_component(component: dict[str, Any], ext_ref_regex: t.Union[str, None] = None) -> None:
+def clear_component(
+    component: dict[str, Any], ext_ref_regex: t.Union[str, re.Pattern[str], None] = None
+) -> None:
     """
     Removes all internal information of the component
     and applies the same process to all sub-components
@@ -85,23 +141,91 @@ def clear_component(component: dict[str, Any], ext_ref_regex: t.Union[str, None]
     component: dict[str, Any]
         A dictionary representing the component,
         which may contain sub-components
+    ext_ref_regex: str | re.Pattern | None
+        The regex pattern for external references to remove
 
     Returns
     -------
     None
     """
-    remove_internal_information_from_properties(component)
-    validate_external_references(ext_ref_regex, component)
-    # The 'extract_components' function processes any nested components recursively,
-    # ensuring that all levels of sub-components are handled.
-    sub_components = extract_components(component.get("components", []))
-    for sub_component in sub_components:
-        remove_internal_information_from_properties(sub_component)
-        validate_external_references(ext_ref_regex, sub_component)
+    ComponentCleaner(ext_ref_regex).clear(component)
+
+
+# Keywords which can constrain the "components" of a component without naming the property
+_KEYWORDS_FOR_UNNAMED_PROPERTIES = {
+    "additionalProperties",
+    "patternProperties",
+    "propertyNames",
+    "minProperties",
+    "maxProperties",
+    "unevaluatedProperties",
+}
+
+
+def _schema_ignores_nested_components(schema: t.Any) -> bool:
+    """
+    Checks whether a schema's verdict on a component could depend on its nested components.
+
+    This is a conservative check. It only returns ``True`` if the string ``components`` doesn't
+    occur in the schema at all and the schema has no keywords which could apply to properties
+    without naming them.
+    """
+    pending = [schema]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            if _KEYWORDS_FOR_UNNAMED_PROPERTIES & node.keys():
+                return False
+            if "components" in node:
+                return False
+            if isinstance(node.get("$ref"), str) and not node["$ref"].startswith("#"):
+                return False
+            for keyword in ("const", "enum"):
+                if keyword in node and "{" in json.dumps(node[keyword]):
+                    # Compares entire objects, possibly the component itself
+                    return False
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+        elif node == "components":
+            return False
+    return True
+
+
+class InternalComponentPredicate:
+    """
+    Decides whether a component is tagged internal, i.e., whether it is valid according to the
+    internal-tagging schema.
+
+    If the schema cannot depend on nested components, they are left out when validating a
+    component. Otherwise, the descendants of a component would be validated again for each of its
+    ancestors. The outcome is then also memoized by the content of the component, so identical
+    components are only validated once.
+    """
+
+    def __init__(self, validator: Draft7Validator) -> None:
+        """
+        :param validator: A validator for the internal-tagging schema.
+        """
+        self.validator = validator
+        self.ignores_nested_components = _schema_ignores_nested_components(validator.schema)
+        self._outcomes: dict[t.Hashable, bool] = {}
+
+    def __call__(self, component: dict) -> bool:
+        if not self.ignores_nested_components:
+            return self.validator.is_valid(component)
+
+        if "components" in component:
+            component = {key: value for key, value in component.items() if key != "components"}
+        fingerprint = json_key(component)
+        outcome = self._outcomes.get(fingerprint)
+        if outcome is None:
+            outcome = self._outcomes[fingerprint] = self.validator.is_valid(component)
+        return outcome
 
 
 def remove_component_tagged_internal(
-    component: dict, validator: Draft7Validator
+    component: dict, validator: t.Union[Draft7Validator, InternalComponentPredicate]
 ) -> tuple[list[str], list[dict]]:
     """
     Removes the top-level component if it is marked as internal (internal, if valid
@@ -113,9 +237,9 @@ def remove_component_tagged_internal(
     ----------
     components: dict
         A dictionary of the top-level component
-    validator: Draft7Validator
+    validator: Draft7Validator | InternalComponentPredicate
         A validator to check if component is valid
-        according to the schema
+        according to the schema or a predicate created from it
 
     Returns
     -------
@@ -126,6 +250,8 @@ def remove_component_tagged_internal(
         the original component with only its public nested components.
         Otherwise the nested top-level components are saved in the list
     """
+    if isinstance(validator, Draft7Validator):
+        validator = InternalComponentPredicate(validator)
 
     list_of_removed_bom_refs = []
     sub_components = component.get("components", [])
@@ -151,7 +277,7 @@ def remove_component_tagged_internal(
     # check if component is tagged internal
     # if so, then replace list containing only the parent component
     # with a list of all (not internal) sub components
-    if validator.is_valid(component):
+    if validator(component):
         list_of_public_component = list_of_public_component[0].get("components", [])
         list_of_removed_bom_refs.append(component.get("bom-ref", ""))
     return list_of_removed_bom_refs, list_of_public_component
@@ -196,10 +322,120 @@ def merge_dependency_for_removed_component(
     return new_dependencies
 
 
+class _DependsOn:
+    """
+    The dependsOn list of a dependency entry while it is being rewired.
+
+    References can be removed and appended in constant time. A removed reference may be appended
+    again later, so each occurrence remembers the generation of the reference it belongs to.
+    Occurrences of an older generation have been removed.
+    """
+
+    def __init__(self, refs: list[str]) -> None:
+        self.items = [(ref, 0) for ref in refs]
+        self.generations: dict[str, int] = {}
+        self.counts: dict[str, int] = {}
+        for ref in refs:
+            self.counts[ref] = self.counts.get(ref, 0) + 1
+
+    def __contains__(self, ref: str) -> bool:
+        return self.counts.get(ref, 0) > 0
+
+    def remove(self, ref: str) -> None:
+        self.generations[ref] = self.generations.get(ref, 0) + 1
+        self.counts[ref] = 0
+
+    def append(self, ref: str) -> None:
+        self.items.append((ref, self.generations.get(ref, 0)))
+        self.counts[ref] = 1
+
+    def to_list(self) -> list[str]:
+        return [ref for ref, gen in self.items if gen == self.generations.get(ref, 0)]
+
+
+def contract_dependencies(
+    removed_bom_refs: Sequence[str], dependencies: Sequence[dict]
+) -> list[dict]:
+    """
+    Resolves the dependencies after several components are removed.
+
+    The result is the same as calling :py:func:`merge_dependency_for_removed_component` for each
+    removed bom-ref in turn: The entries of the removed components are deleted and every other
+    entry which depends on a removed component depends on that component's dependencies instead.
+    Chains of removed components are thereby resolved transitively.
+
+    Instead of scanning all entries for every removed component, the entries which depend on a
+    removed component are looked up in a reverse index, so the time grows with the number of
+    dependencies rather than with their product with the number of removed components.
+
+    Parameters
+    ----------
+    removed_bom_refs: Sequence[str]
+        The bom-refs of the removed components in the order they were removed
+    dependencies: Sequence[dict]
+        A list with dependency dictionaries
+
+    Returns
+    -------
+    list[dict]
+        A list with the resolved dependencies
+    """
+    removed = set(removed_bom_refs)
+    entries_by_ref: dict[str, list[int]] = {}
+    # Maps removed bom-refs to the entries whose dependsOn contains them
+    dependents: dict[str, set[int]] = {}
+    for index, entry in enumerate(dependencies):
+        ref = entry.get("ref", "")
+        if ref in removed:
+            entries_by_ref.setdefault(ref, []).append(index)
+        for dependency in entry.get("dependsOn", []):
+            if dependency in removed:
+                dependents.setdefault(dependency, set()).add(index)
+
+    # Only the entries which are rewired get a _DependsOn
+    rewired: dict[int, _DependsOn] = {}
+
+    def current_depends_on(index: int) -> list[str]:
+        if index in rewired:
+            return rewired[index].to_list()
+        return list(dependencies[index].get("dependsOn", []))
+
+    removed_entries: set[int] = set()
+    for bom_ref in removed_bom_refs:
+        dependencies_to_merge: list[str] = []
+        for index in entries_by_ref.pop(bom_ref, []):
+            removed_entries.add(index)
+            dependencies_to_merge = current_depends_on(index)
+
+        for index in sorted(dependents.pop(bom_ref, set()) - removed_entries):
+            if index not in rewired:
+                rewired[index] = _DependsOn(dependencies[index]["dependsOn"])
+            depends_on = rewired[index]
+            if bom_ref not in depends_on:
+                continue
+            depends_on.remove(bom_ref)
+            for dependency in dependencies_to_merge:
+                if dependency not in depends_on:
+                    depends_on.append(dependency)
+                    if dependency in removed:
+                        dependents.setdefault(dependency, set()).add(index)
+
+    new_dependencies = []
+    for index, entry in enumerate(dependencies):
+        if index in removed_entries:
+            continue
+        if index in rewired:
+            entry["dependsOn"] = rewired[index].to_list()
+        new_dependencies.append(entry)
+    return new_dependencies
+
+
 def build_public_bom(
     sbom: dict[str, Any],
-    path_to_schema: t.Union[Path, None],
-    ext_ref_regex: t.Union[str, None] = None,
+    path_to_schema: t.Optional[Path],
+    ext_ref_regex: t.Union[str, re.Pattern[str], None] = None,
+    *,
+    validator: t.Optional[Draft7Validator] = None,
 ) -> dict:
     """
     Removes the components with the property internal
@@ -209,8 +445,13 @@ def build_public_bom(
     ----------
     sbom: dict
         An SBOM dictionary
-    path_to_schema:
+    path_to_schema: Path | None
         The path to json schema for defining internal components
+    ext_ref_regex: str | re.Pattern | None
+        The regex pattern for external references to remove
+    validator: Draft7Validator | None
+        A validator created by create_internal_validator, which is used
+        instead of loading the schema again. Excludes path_to_schema
 
     Returns
     -------
@@ -223,15 +464,21 @@ def build_public_bom(
     dependencies = sbom.get("dependencies", [])
     cleared_components = []
     list_of_removed_component_bom_refs = []
+    cleaner = ComponentCleaner(ext_ref_regex)
 
-    # if a schema is provided, the validator will verify the metadata.component as well
-    # as each individual component to determine if it is marked as internal according to the schema
     if path_to_schema is not None:
+        if validator is not None:
+            raise ValueError("path_to_schema and validator are mutually exclusive")
         validator = create_internal_validator(path_to_schema)
 
+    # if a schema is provided, the validator will verify the metadata.component as well
+    # as each individual component to determine if it is marked as internal according to the schema
+    if validator is not None:
+        is_internal = InternalComponentPredicate(validator)
+
         # check if the JSON schema applies to metadata.component. If so, print a warning
         list_of_removed_metadata_component, _ = remove_component_tagged_internal(
-            metadata.get("component", {}), validator
+            metadata.get("component", {}), is_internal
         )
         if len(list_of_removed_metadata_component) > 0:
             logger.warning(
@@ -244,46 +491,265 @@ def build_public_bom(
             )
         for component in components:
             removed_component_bom_refs, noninternal_components = remove_component_tagged_internal(
-                component, validator
+                component, is_internal
             )
             list_of_removed_component_bom_refs.extend(removed_component_bom_refs)
             # loop trough list of removed (internal) components
             # and remove internal properties from all (sub-)components
             for noninternal_component in noninternal_components:
-                clear_component(noninternal_component, ext_ref_regex)
+                cleaner.clear(noninternal_component)
                 cleared_components.append(noninternal_component)
     else:
         # remove internal properties from all (sub-)components
         for component in components:
-            clear_component(component, ext_ref_regex)
+            cleaner.clear(component)
             cleared_components.append(component)
     # replace components with cleared components, if it is not an empy list
     if cleared_components:
         sbom["components"] = cleared_components
     else:
         sbom.pop("components", None)
-    for bom_ref in list_of_removed_component_bom_refs:
-        dependencies = merge_dependency_for_removed_component(bom_ref, dependencies)
+    if list_of_removed_component_bom_refs:
+        dependencies = contract_dependencies(list_of_removed_component_bom_refs, dependencies)
     # check metadata.component
-    remove_internal_information_from_properties(sbom.get("metadata", {}).get("component", {}))
-    validate_external_references(ext_ref_regex, sbom.get("metadata", {}).get("component", {}))
+    cleaner.clear_properties(sbom.get("metadata", {}).get("component", {}))
+    cleaner.clear_external_references(sbom.get("metadata", {}).get("component", {}))
     # replace dependencies with new dependencies, if it is not an empy list
     if dependencies:
         sbom["dependencies"] = dependencies
     else:
         sbom.pop("dependencies", None)
-    for composition in sbom.get("compositions", []):
-        new_assemblies = composition.get("assemblies").copy()
-        for bom_ref in composition.get("assemblies"):
-            if bom_ref in list_of_removed_component_bom_refs:
-                new_assemblies.remove(bom_ref)
-        composition["assemblies"] = new_assemblies
+    if list_of_removed_component_bom_refs:
+        removed_bom_refs = set(list_of_removed_component_bom_refs)
+        remove_refs_from_compositions(removed_bom_refs, sbom.get("compositions", []))
+        if vulnerabilities := remove_refs_from_vulnerabilities(
+            removed_bom_refs, sbom.get("vulnerabilities", [])
+        ):
+            sbom["vulnerabilities"] = vulnerabilities
+        else:
+            sbom.pop("vulnerabilities", None)
     return sbom
 
 
-def create_internal_validator(path_to_schema: Path) -> Draft7Validator:
+def remove_refs_from_compositions(removed_bom_refs: set[str], compositions: list[dict]) -> None:
+    """
+    Removes references to removed components from the assemblies and dependencies of
+    compositions.
+    The function operates directly on the given compositions.
+
+    Parameters
+    ----------
+    removed_bom_refs: set[str]
+        The bom-refs of the removed components
+    compositions: list[dict]
+        A list with composition dictionaries
+
+    Returns
+    -------
+    None
+    """
+    for composition in compositions:
+        for key in ("assemblies", "dependencies"):
+            if key in composition:
+                composition[key] = [
+                    bom_ref for bom_ref in composition[key] if bom_ref not in removed_bom_refs
+                ]
+
+
+def remove_refs_from_vulnerabilities(
+    removed_bom_refs: set[str], vulnerabilities: list[dict]
+) -> list[dict]:
+    """
+    Removes references to removed components from the affects of vulnerabilities.
+
+    Vulnerabilities which only affected removed components are removed as well. Vulnerabilities
+    which didn't declare any affects are kept.
+
+    Parameters
+    ----------
+    removed_bom_refs: set[str]
+        The bom-refs of the removed components
+    vulnerabilities: list[dict]
+        A list with vulnerability dictionaries
+
+    Returns
+    -------
+    list[dict]
+        The vulnerabilities which still affect any component
+    """
+    new_vulnerabilities = []
+    for vulnerability in vulnerabilities:
+        affects = vulnerability.get("affects", [])
+        new_affects = [affect for affect in affects if affect.get("ref") not in removed_bom_refs]
+        if affects and not new_affects:
+            logger.info(
+                LogMessage(
+                    "Vulnerability removed",
+                    f"Vulnerability '{vulnerability.get('id', '')}' was removed because it only "
+                    "affected removed components.",
+                )
+            )
+            continue
+        if len(new_affects) != len(affects):
+            vulnerability["affects"] = new_affects
+        new_vulnerabilities.append(vulnerability)
+    return new_vulnerabilities
+
+
+def load_internal_schema(path_to_schema: Path) -> dict:
+    """
+    Loads the JSON schema which defines when a component is internal and checks that it is a
+    valid draft-07 schema.
+
+    Parameters
+    ----------
+    path_to_schema: Path
+        The path to the JSON schema
+
+    Returns
+    -------
+    dict
+        The schema
+    """
     with path_to_schema.open(encoding="utf_8_sig") as schema_f:
-        schema_internal = json.load(schema_f)
-    validator_for_being_internal = Draft7Validator(schema_internal, format_checker=FormatChecker())
-    validator_for_being_internal.check_schema(schema_internal)
-    return validator_for_being_internal
+        schema_internal: dict = json.load(schema_f)
+    Draft7Validator.check_schema(schema_internal)
+    return schema_internal
+
+
+def _validator_for_schema(schema_internal: dict) -> Draft7Validator:
+    return Draft7Validator(schema_internal, format_checker=FormatChecker())
+
+
+def create_internal_validator(path_to_schema: Path) -> Draft7Validator:
+    return _validator_for_schema(load_internal_schema(path_to_schema))
+
+
+ReadSbom = t.Callable[[Path], tuple[dict, str]]
+"""A function which loads an SBOM file, such as ``cdxev.__main__.read_sbom``."""
+
+
+def _build_public_file(
+    input: Path,
+    output: Path,
+    validator: t.Optional[Draft7Validator],
+    ext_ref_pattern: t.Optional[re.Pattern[str]],
+    read_sbom: ReadSbom,
+) -> FileResult:
+    """
+    Builds the public SBOM for an SBOM file and writes the result.
+
+    :return: The messages logged while building the public SBOM, attributed to *input*, and the
+             details of the error if the file could not be processed. Messages and errors are
+             returned instead of logged or raised because the log of a worker process doesn't
+             reach the user and :py:class:`AppError` cannot be passed between processes.
+    """
+    error = None
+    with collect_messages(logger, str(input)) as messages:
+        try:
+            sbom, _ = read_sbom(input)
+            public_sbom = build_public_bom(sbom, None, ext_ref_pattern, validator=validator)
+            write_sbom(public_sbom, output)
+        except AppError as exc:
+            error = exc.details
+            if error.module_name is None:
+                error.module_name = str(input)
+    return messages, error
+
+
+# The arguments shared by all files processed in a worker process, set once by _init_worker
+_worker_args: t.Optional[
+    tuple[t.Optional[Draft7Validator], t.Optional[re.Pattern[str]], ReadSbom]
+] = None
+
+
+def _init_worker(
+    schema_internal: t.Optional[dict],
+    ext_ref_pattern: t.Optional[re.Pattern[str]],
+    read_sbom: ReadSbom,
+    log_level: int,
+) -> None:
+    global _worker_args
+    # Messages below the level of the parent process would be dropped there anyway
+    logger.setLevel(log_level)
+    validator = _validator_for_schema(schema_internal) if schema_internal is not None else None
+    _worker_args = (validator, ext_ref_pattern, read_sbom)
+
+
+def _build_public_file_in_worker(input: Path, output: Path) -> FileResult:
+    if _worker_args is None:
+        raise RuntimeError("The worker process has not been initialized.")
+    return _build_public_file(input, output, *_worker_args)
+
+
+def run_many(
+    files: t.Sequence[tuple[Path, Path]],
+    path_to_schema: t.Optional[Path],
+    ext_ref_regex: t.Optional[str],
+    read_sbom: ReadSbom,
+    jobs: int = 1,
+) -> None:
+    """
+    Builds the public SBOMs for several SBOM files.
+
+    The schema is loaded and checked and the regex compiled only once. With more than one job,
+    the SBOMs are processed by a pool of worker processes, each of which creates its validator
+    once. The messages logged for each SBOM are reported with the path of its file.
+
+    Parameters
+    ----------
+    files: Sequence[tuple[Path, Path]]
+        Pairs of the path to an input SBOM and the path to write the public SBOM to
+    path_to_schema: Path | None
+        The path to json schema for defining internal components
+    ext_ref_regex: str | None
+        The regex pattern for external references to remove
+    read_sbom: ReadSbom
+        The function to load the input SBOMs with. It must be defined at module level, so it
+        can be passed to worker processes.
+    jobs: int
+        The maximum number of SBOMs to process in parallel
+
+    Raises
+    ------
+    AppError
+        If one of the SBOMs could not be processed. The other SBOMs are processed and written
+        anyway.
+    """
+    schema_internal = load_internal_schema(path_to_schema) if path_to_schema is not None else None
+    ext_ref_pattern = re.compile(ext_ref_regex) if ext_ref_regex is not None else None
+
+    results: list[FileResult]
+    if jobs > 1 and len(files) > 1:
+        inputs = [input for input, _ in files]
+        outputs = [output for _, output in files]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(jobs, len(files)),
+            initializer=_init_worker,
+            initargs=(schema_internal, ext_ref_pattern, read_sbom, logger.getEffectiveLevel()),
+        ) as pool:
+            results = list(pool.map(_build_public_file_in_worker, inputs, outputs))
+    else:
+        validator = _validator_for_schema(schema_internal) if schema_internal is not None else None
+        results = [
+            _build_public_file(input, output, validator, ext_ref_pattern, read_sbom)
+            for input, output in files
+        ]
+
+    failed = []
+    for (input, output), (messages, error) in zip(files, results, strict=True):
+        relay_messages(logger, messages)
+        if error is not None:
+            failed.append(error)
+        else:
+            logger.info(
+                LogMessage(
+                    "Public SBOM written",
+                    f"The public SBOM was written to {output}.",
+                    module_name=str(input),
+                )
+            )
+    for details in failed[1:]:
+        logger.error(details)
+    if failed:
+        raise AppError(log_msg=failed[0])
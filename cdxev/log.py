@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import contextlib
 import dataclasses
 import logging
 import logging.handlers
@@ -92,3 +93,66 @@ def configure_logging(quiet: bool, verbose: bool) -> None:
         stderr_handler.setLevel(logging.DEBUG)
         stderr_handler.setFormatter(LogMessageFormatter())
         root_logger.addHandler(stderr_handler)
+
+
+LoggedMessages = list[tuple[int, LogMessage]]
+"""Messages logged while processing a file together with their levels."""
+
+FileResult = tuple[LoggedMessages, t.Optional[LogMessage]]
+"""The messages logged while processing a file and the error, if it couldn't be processed."""
+
+
+class _CollectingHandler(logging.Handler):
+    def __init__(self, messages: LoggedMessages, module_name: t.Optional[str]) -> None:
+        super().__init__()
+        self.messages = messages
+        self.module_name = module_name
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if isinstance(record.msg, LogMessage):
+            message = dataclasses.replace(record.msg)
+        else:
+            message = LogMessage(record.getMessage(), "")
+        if message.module_name is None and self.module_name is not None:
+            message.module_name = self.module_name
+        self.messages.append((record.levelno, message))
+
+
+@contextlib.contextmanager
+def collect_messages(
+    logger: logging.Logger, module_name: t.Optional[str] = None
+) -> t.Iterator[LoggedMessages]:
+    """
+    Collects the messages logged to a logger in the body of the ``with`` statement instead of
+    emitting them.
+
+    Commands which process several files use this to attribute messages to the file they
+    concern. The messages can also be passed from a worker process, whose log doesn't reach
+    the user, to the main process and logged there again with :py:func:`relay_messages`.
+
+    :param logger: The logger whose messages to collect.
+    :param module_name: Set as the module name of messages which don't have one, usually the
+                        path of the file being processed. If ``None``, they are kept as they are.
+    :return: A context manager which yields the list the messages are collected in.
+    """
+    messages: LoggedMessages = []
+    handler = _CollectingHandler(messages, module_name)
+    propagate = logger.propagate
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        yield messages
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = propagate
+
+
+def relay_messages(logger: logging.Logger, messages: LoggedMessages) -> None:
+    """
+    Logs messages collected by :py:func:`collect_messages` again.
+
+    :param logger: The logger to log the messages to.
+    :param messages: The messages with their levels.
+    """
+    for level, message in messages:
+        logger.log(level, message)
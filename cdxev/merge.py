@@ -8,6 +8,7 @@ from cdxev.auxiliary.identity import ComponentIdentity, VulnerabilityIdentity
 from cdxev.auxiliary.sbom_functions import (
     CycloneDXVersion,
     SpecVersion,
+    UniqueList,
     _affects_key_for,
     add_merged_metadata_component_to_dependencies,
     collect_affects_of_vulnerabilities,
@@ -730,10 +731,8 @@ def merge_compositions(
                         "aggregate", "new"
                     ):
                         found_matching_aggregate = True
-                        merged_assemblies = original_composition.get("assemblies", [])
-                        for reference in new_composition.get("assemblies", []):
-                            if reference not in merged_assemblies:
-                                merged_assemblies.append(reference)
+                        merged_assemblies = UniqueList(original_composition.get("assemblies", []))
+                        merged_assemblies.extend(new_composition.get("assemblies", []))
                 if not found_matching_aggregate:
                     list_to_be_merged_in.append(new_composition)
     return
@@ -1,9 +1,14 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import collections
+import concurrent.futures
+import copy
+import functools
 import logging
 import pathlib
 import re
 import sys
+import time
 import typing as t
 from dataclasses import dataclass, field, fields
 
@@ -16,12 +21,57 @@ from cdxev.auxiliary.identity import (
     Key,
     KeyType,
 )
+from cdxev.auxiliary.io_processing import write_sbom
 from cdxev.auxiliary.sbom_functions import walk_components
 from cdxev.error import AppError
-from cdxev.log import LogMessage
+from cdxev.log import FileResult, LogMessage, collect_messages, relay_messages
 
 logger = logging.getLogger(__name__)
 
+VERSION_CACHE_SIZE = 65536
+"""The number of parsed (versioning scheme, version string) pairs remembered."""
+
+COMPILE_CACHE_SIZE = 16384
+"""The number of regular expressions and version ranges of update identifiers remembered."""
+
+CoordinatesIndex = dict[tuple[str, t.Optional[str]], dict[Key, None]]
+"""
+Maps (name, group) to the coordinate keys of the component map with that name and group. The
+keys are held in a dict, which serves as an insertion-ordered set.
+"""
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    """
+    Compiles a regular expression of an update identifier.
+
+    The compiled patterns are cached, because large update files repeat the same expressions many
+    times. The :py:mod:`re` module has a cache of its own but it is much smaller.
+    """
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _parse_version_range(version_range: str) -> univers.version_range.VersionRange:
+    """Parses a version range of an update identifier. The results are cached."""
+    from_string = univers.version_range.VersionRange.from_string
+    vers: univers.version_range.VersionRange = from_string(version_range)  # type: ignore[no-untyped-call]
+    return vers
+
+
+def _log_compile_cache_info() -> None:
+    regex_info = _compile_regex.cache_info()
+    range_info = _parse_version_range.cache_info()
+    logger.debug(
+        "Compilation cache of update identifiers: regular expressions %d hits, %d misses; "
+        "version ranges %d hits, %d misses",
+        regex_info.hits,
+        regex_info.misses,
+        range_info.hits,
+        range_info.misses,
+    )
+
 
 @dataclass(frozen=True)
 class SetConfig:
@@ -37,6 +87,7 @@ class SetConfig:
 class Context:
     config: "SetConfig"
     component_map: dict[Key, list[dict]] = field(init=False)
+    coordinates_index: CoordinatesIndex = field(init=False)
     sbom: dict
 
 
@@ -91,9 +142,7 @@ class UpdateIdentity(ComponentIdentity):
         coordinates: Coordinates
         if version_range is not None:
             try:
-                vers = univers.version_range.VersionRange.from_string(
-                    version_range  # type:ignore
-                )
+                vers = _parse_version_range(version_range)
             except Exception as exc:
                 # univers raises a variety of unrelated exception types for malformed
                 # version ranges (InvalidVersion, InvalidNuGetVersion, InvalidVersionRange,
@@ -118,7 +167,7 @@ class RegexUpdateIdentity:
         return cls(
             field=field,
             expression=expression,
-            pattern=re.compile(f"^(?:{expression})$"),
+            pattern=_compile_regex(f"^(?:{expression})$"),
         )
 
     def matches(self, component: dict) -> bool:
@@ -129,6 +178,41 @@ class RegexUpdateIdentity:
         return f"{self.field}[regex:{self.expression}]"
 
 
+@functools.lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_version(
+    version_class: type[univers.versions.Version], version: str
+) -> t.Optional[univers.versions.Version]:
+    """
+    Parses a version string in the given versioning scheme.
+
+    The results are cached, because the same versions are compared against many version ranges.
+
+    :param version_class: The versioning scheme.
+    :param version: The version string.
+    :return: The parsed version or ``None`` if the string is invalid in the scheme.
+    """
+    try:
+        return version_class(version)
+    except univers.versions.InvalidVersion:
+        return None
+
+
+@functools.lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _possible_version_schemes(version: str) -> tuple[str, ...]:
+    """Returns the names of all versioning schemes under which the version string is valid."""
+    possible_versions = []
+    for version_type in univers.versions.AVAILABLE_VERSIONS:
+        try:
+            if version_type.is_valid(version):  # type: ignore[no-untyped-call]
+                possible_versions.append(str(version_type.__name__))
+        except univers.versions.nuget.InvalidNuGetVersion:  # type: ignore[attr-defined]
+            # Some validators (notably NuGet) can raise
+            # for malformed inputs while probing support.
+            # Ignore and keep checking remaining schemas.
+            continue
+    return tuple(possible_versions)
+
+
 @dataclass(init=True, frozen=True)
 class CoordinatesWithVersionRange(Coordinates):
     """
@@ -165,20 +249,12 @@ class CoordinatesWithVersionRange(Coordinates):
                     return False
 
             if other.version is not None:
-                try:
-                    if self.version_range.version_class(other.version) in self.version_range:
+                parsed = _parse_version(self.version_range.version_class, other.version)
+                if parsed is not None:
+                    if parsed in self.version_range:
                         return True
-                except univers.versions.InvalidVersion:
-                    possible_versions = []
-                    for version_type in univers.versions.AVAILABLE_VERSIONS:
-                        try:
-                            if version_type.is_valid(other.version):
-                                possible_versions.append(str(version_type.__name__))
-                        except univers.versions.nuget.InvalidNuGetVersion:
-                            # Some validators (notably NuGet) can raise
-                            # for malformed inputs while probing support.
-                            # Ignore and keep checking remaining schemas.
-                            continue
+                else:
+                    possible_versions = _possible_version_schemes(other.version)
                     version_is_of = " which is valid under the schemas: "
 
                     if not possible_versions:
@@ -233,14 +309,14 @@ class CoordinatesRegexIdentity:
         version: t.Optional[str] = None,
         version_range: t.Optional[univers.version_range.VersionRange] = None,
     ) -> "CoordinatesRegexIdentity":
-        name_pattern = re.compile(f"^(?:{name_expression})$")
+        name_pattern = _compile_regex(f"^(?:{name_expression})$")
         if group_expression is not None:
             grp_str = (
                 f"^(?:{group_expression})$"
                 if group_is_regex
                 else f"^{re.escape(group_expression)}$"
             )
-            group_pat: t.Optional[re.Pattern[str]] = re.compile(grp_str)
+            group_pat: t.Optional[re.Pattern[str]] = _compile_regex(grp_str)
         else:
             group_pat = None
         return cls(
@@ -272,10 +348,8 @@ class CoordinatesRegexIdentity:
             comp_version = component.get("version")
             if comp_version is None:
                 return False
-            try:
-                if self.version_range.version_class(comp_version) not in self.version_range:
-                    return False
-            except univers.versions.InvalidVersion:
+            parsed = _parse_version(self.version_range.version_class, comp_version)
+            if parsed is None or parsed not in self.version_range:
                 return False
 
         return True
@@ -373,15 +447,18 @@ def _update_id(
     old: ComponentIdentity,
     new: ComponentIdentity,
     map: dict[Key, list[dict]],
+    index: CoordinatesIndex,
 ) -> None:
     instance_list = None
     for key in old:
         instance_list = map.pop(key)
+        _unindex_key(key, index)
 
     instance_list = t.cast(list[dict], instance_list)
 
     for key in new:
         map[key] = instance_list
+        _index_key(key, index)
 
 
 def _do_update(component: dict, update: dict, ctx: Context) -> None:
@@ -389,52 +466,138 @@ def _do_update(component: dict, update: dict, ctx: Context) -> None:
     update_set = update["set"]
 
     original_id: t.Optional[ComponentIdentity] = None
-    remap = False
+    # The components nested in the component, if the update can replace them
+    original_subtree: t.Optional[list[dict]] = None
+    if any(_should_remap(prop) for prop in update_set):
+        original_subtree = _get_subtree(component)
 
     for prop in update_set:
         if _should_update_id(prop):
             original_id = original_id or ComponentIdentity.create(component, True)
 
-        if _should_remap(prop):
-            remap = True
-
         if _should_delete(prop, component, update_set):
-            logger.debug(f'Deleting "{prop}" on component "{component_id}".')
+            logger.debug('Deleting "%s" on component "%s".', prop, component_id)
             del component[prop]
             continue
 
         if _should_merge(prop, component, update_set):
-            logger.debug(f'Merging "{prop}" on component "{component_id}".')
+            logger.debug('Merging "%s" on component "%s".', prop, component_id)
             component[prop].append(update_set[prop])
             continue
 
         if prop not in component or _should_overwrite(
             prop, component_id, ctx.config.force, ctx.config.ignore_existing
         ):
-            logger.debug(f'Setting "{prop}" on component "{component_id}".')
+            logger.debug('Setting "%s" on component "%s".', prop, component_id)
             component[prop] = update_set[prop]
 
-    if remap:
-        ctx.component_map = _map_out_components(ctx.sbom)
-    elif original_id:
+    if original_id:
         # Update old keys in the component map if identifying
         # properties changed during the update.
         new_id = ComponentIdentity.create(component, True)
-        _update_id(original_id, new_id, ctx.component_map)
+        _update_id(original_id, new_id, ctx.component_map, ctx.coordinates_index)
+
+    if original_subtree is not None:
+        # Only the nested components which were removed or added by the update need to be
+        # unmapped or mapped. The map holds a component once per occurrence in the SBOM, which
+        # can be more than one if an update set the same components on several targets, so
+        # occurrences are counted.
+        subtree = _get_subtree(component)
+        kept = collections.Counter(id(c) for c in original_subtree) & collections.Counter(
+            id(c) for c in subtree
+        )
+        unmatched = kept.copy()
+        for removed in original_subtree:
+            if unmatched[id(removed)] > 0:
+                unmatched[id(removed)] -= 1
+            else:
+                _remove_from_map(removed, ctx.component_map, ctx.coordinates_index)
+        unmatched = kept.copy()
+        for added in subtree:
+            if unmatched[id(added)] > 0:
+                unmatched[id(added)] -= 1
+            else:
+                _add_to_map(added, ctx.component_map, ctx.coordinates_index)
 
 
-def _map_out_components(sbom: dict) -> dict[Key, list[dict]]:
-    def _add_to_map(component: dict, map: dict[Key, list[dict]]) -> None:
-        component_id = ComponentIdentity.create(component, allow_unsafe=True)
-        for key in component_id:
-            instance_list = map.setdefault(key, [])
-            instance_list.append(component)
+def _get_subtree(component: dict) -> list[dict]:
+    """Returns all components nested in the given component, at any depth."""
+    subtree: list[dict] = []
+    walk_components(
+        {"components": component.get("components", [])},
+        lambda nested: subtree.append(nested),
+        skip_meta=True,
+    )
+    return subtree
+
+
+def _add_to_map(
+    component: dict,
+    map: dict[Key, list[dict]],
+    index: t.Optional[CoordinatesIndex] = None,
+) -> None:
+    component_id = ComponentIdentity.create(component, allow_unsafe=True)
+    for key in component_id:
+        instance_list = map.setdefault(key, [])
+        instance_list.append(component)
+        if index is not None:
+            _index_key(key, index)
 
+
+def _remove_from_map(
+    component: dict,
+    map: dict[Key, list[dict]],
+    index: CoordinatesIndex,
+) -> None:
+    component_id = ComponentIdentity.create(component, allow_unsafe=True)
+    for key in component_id:
+        if key not in map:
+            continue
+        # Only one occurrence is removed, since the component might also be nested elsewhere.
+        position = next((i for i, c in enumerate(map[key]) if c is component), None)
+        if position is None:
+            continue
+        # The list is replaced instead of modified because it might be shared by several keys.
+        instance_list = map[key][:position] + map[key][position + 1 :]
+        if instance_list:
+            map[key] = instance_list
+        else:
+            del map[key]
+            _unindex_key(key, index)
+
+
+def _map_out_components(sbom: dict) -> dict[Key, list[dict]]:
     map: dict[Key, list[dict]] = {}
     walk_components(sbom, _add_to_map, map)
     return map
 
 
+def _index_key(key: Key, index: CoordinatesIndex) -> None:
+    if key.type == KeyType.COORDINATES:
+        index.setdefault((key.key.name, key.key.group), {})[key] = None
+
+
+def _unindex_key(key: Key, index: CoordinatesIndex) -> None:
+    if key.type == KeyType.COORDINATES:
+        coordinates = (key.key.name, key.key.group)
+        index[coordinates].pop(key, None)
+        if not index[coordinates]:
+            del index[coordinates]
+
+
+def _index_coordinates(map: dict[Key, list[dict]]) -> CoordinatesIndex:
+    """
+    Indexes the coordinate keys of a component map by name and group.
+
+    Version-range targets can only match components with the same name and group, so this spares
+    them from comparing against every key in the map.
+    """
+    index: CoordinatesIndex = {}
+    for key in map:
+        _index_key(key, index)
+    return index
+
+
 def _get_protected(update_set: dict) -> t.Union[t.Literal[False], set]:
     intersection = _PROTECTED & update_set.keys()
     if intersection:
@@ -581,8 +744,7 @@ def _parse_coordinates_regex(
                 'The update object identifier "version-range" must be a string.',
             )
         try:
-            from_string = univers.version_range.VersionRange.from_string
-            version_range_obj = from_string(vr)  # type: ignore[no-untyped-call]
+            version_range_obj = _parse_version_range(vr)
         except (ValueError, univers.versions.InvalidVersion) as exc:
             raise AppError(
                 "Invalid set file",
@@ -658,18 +820,125 @@ def _parse_regex_update_identity(
 _AnyRegexIdentity = t.Union[RegexUpdateIdentity, CoordinatesRegexIdentity]
 
 
-def _get_regex_targets(sbom: dict, update_id: _AnyRegexIdentity) -> list[dict]:
+def _regex_field(update_id: _AnyRegexIdentity) -> tuple[str, re.Pattern[str]]:
+    """Returns the field a regex identity matches on and the pattern it uses for it."""
+    if isinstance(update_id, CoordinatesRegexIdentity):
+        return "name", update_id.name_pattern
+    return update_id.field, update_id.pattern
+
+
+def _combine_patterns(patterns: t.Sequence[re.Pattern[str]]) -> t.Optional[re.Pattern[str]]:
+    """
+    Combines patterns into one alternation which matches if any of them matches.
+
+    :return: The combined pattern or ``None`` if the patterns cannot be safely combined, e.g.,
+             because they contain groups which might be referenced by backreferences.
+    """
+    if len(patterns) < 2 or any(p.groups for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p.pattern})" for p in patterns))
+    except re.error:
+        return None
+
+
+def _get_regex_targets(
+    sbom: dict, update_ids: t.Collection[_AnyRegexIdentity]
+) -> dict[_AnyRegexIdentity, list[dict]]:
+    """
+    Finds the components matched by several regex identities in a single pass over the
+    components.
+
+    The identities are grouped by the field they match on. The patterns of each group are combined
+    into a prefilter, so components which match none of them are skipped after a single match
+    attempt.
+
+    :param sbom: The SBOM.
+    :param update_ids: The identities.
+    :return: The matching components of each identity.
+    """
+    rules: dict[str, list[_AnyRegexIdentity]] = {}
+    for update_id in update_ids:
+        rules.setdefault(_regex_field(update_id)[0], []).append(update_id)
+
+    prefilters = {
+        field_name: _combine_patterns([_regex_field(update_id)[1] for update_id in field_rules])
+        for field_name, field_rules in rules.items()
+    }
+    targets: dict[_AnyRegexIdentity, list[dict]] = {update_id: [] for update_id in update_ids}
+
+    def _collect(component: dict) -> None:
+        for field_name, field_rules in rules.items():
+            value = component.get(field_name)
+            if not isinstance(value, str):
+                continue
+            prefilter = prefilters[field_name]
+            if prefilter is not None and prefilter.fullmatch(value) is None:
+                continue
+            for update_id in field_rules:
+                if update_id.matches(component):
+                    targets[update_id].append(component)
+
+    walk_components(sbom, _collect)
+    return targets
+
+
+def _get_range_targets(update_key: Key, ctx: Context) -> list[dict]:
     targets: list[dict] = []
+    candidates = ctx.coordinates_index.get((update_key.key.name, update_key.key.group), {})
+    for key in candidates:
+        if update_key == key:
+            targets += ctx.component_map[key]
+    return targets
 
-    def _collect(
-        component: dict,
-        target_list: list[dict],
-        target_id: _AnyRegexIdentity,
-    ) -> None:
-        if target_id.matches(component):
-            target_list.append(component)
 
-    walk_components(sbom, _collect, targets, update_id)
+def _resolve_targets(
+    updates: t.Sequence[dict[str, t.Any]],
+    ctx: Context,
+    start: int,
+    stop_at_protected: bool = True,
+) -> dict[int, list[dict]]:
+    """
+    Resolves the targets of several updates at once.
+
+    Identical identifiers are only resolved once and the targets of all regex identifiers are
+    found in a single pass over the components.
+
+    :param updates: All updates.
+    :param ctx: The context, holding the component map of the current state of the SBOM.
+    :param start: The index of the first update to resolve.
+    :param stop_at_protected: If *true*, stops after the first update which sets protected
+                              properties. Such an update can change which components later updates
+                              match, so their targets must be resolved after it has been applied.
+    :return: The targets of each resolved update, by the index of the update.
+    """
+    # Maps each distinct regex identity or key to the updates using it
+    positions: dict[t.Union[_AnyRegexIdentity, Key], list[int]] = {}
+    for position in range(start, len(updates)):
+        update_id = updates[position]["id"]
+        if not isinstance(update_id, (RegexUpdateIdentity, CoordinatesRegexIdentity)):
+            update_id = update_id[0]
+        positions.setdefault(update_id, []).append(position)
+        if stop_at_protected and _get_protected(updates[position]["set"]):
+            break
+
+    regex_ids = [
+        update_id
+        for update_id in positions
+        if isinstance(update_id, (RegexUpdateIdentity, CoordinatesRegexIdentity))
+    ]
+    regex_targets = _get_regex_targets(ctx.sbom, regex_ids) if regex_ids else {}
+
+    targets: dict[int, list[dict]] = {}
+    for update_id, update_positions in positions.items():
+        if isinstance(update_id, (RegexUpdateIdentity, CoordinatesRegexIdentity)):
+            target_list = regex_targets[update_id]
+        elif isinstance(update_id.key, CoordinatesWithVersionRange):
+            target_list = _get_range_targets(update_id, ctx)
+        else:
+            target_list = ctx.component_map.get(update_id, [])
+        for position in update_positions:
+            targets[position] = list(target_list)
     return targets
 
 
@@ -753,15 +1022,50 @@ def _validate_update_list(
             )
 
 
-def run(
-    sbom: dict,
-    updates: t.Sequence[dict[str, t.Any]],
-    cfg: SetConfig,
-) -> None:
-    ctx = Context(cfg, sbom)
+@dataclass
+class UpdatePlan:
+    """
+    The outcome of planning a set of updates without applying them.
+
+    Targets are resolved against the unmodified SBOM. If an update changes protected properties,
+    later updates may match different components when actually applied.
+    """
+
+    matches: list[tuple[str, int]]
+    """The identifier of each update and the number of components it targets."""
+
+    timings: dict[str, float]
+    """The time in seconds spent in each phase of planning."""
+
+    def write(self, stream: t.TextIO) -> None:
+        """
+        Writes a human-readable report of the plan.
+
+        :param stream: The stream to write to.
+        """
+        width = max([len("Update")] + [len(update_id) for update_id, _ in self.matches])
+        stream.write(f"{'Update':<{width}}  {'Targets':>10}\n")
+        for update_id, count in self.matches:
+            stream.write(f"{update_id:<{width}}  {count:>10}\n")
+        stream.write("\n")
+
+        unmatched = sum(1 for _, count in self.matches if count == 0)
+        stream.write(
+            f"{len(self.matches)} updates, {len(self.matches) - unmatched} with targets, "
+            f"{unmatched} without targets\n"
+        )
+        for phase, elapsed in self.timings.items():
+            stream.write(f"{phase}: {elapsed:.3f} s\n")
+
+
+def _compile_updates(updates: t.Sequence[dict[str, t.Any]], cfg: SetConfig) -> None:
+    """
+    Validates the updates and replaces their identifiers by identity objects, in place.
 
+    :raises AppError: If an update is invalid.
+    """
     try:
-        _validate_update_list(updates, ctx)
+        _validate_update_list(updates, Context(cfg, {}))
     except AppError as exc:
         raise AppError(
             "Set not performed",
@@ -769,25 +1073,67 @@ def run(
             log_msg=exc.details,
         ) from exc
 
+
+def _prepare(sbom: dict, cfg: SetConfig) -> Context:
+    ctx = Context(cfg, sbom)
     ctx.component_map = _map_out_components(sbom)
+    ctx.coordinates_index = _index_coordinates(ctx.component_map)
+    return ctx
 
-    for update in updates:
-        target_list: list[dict] = []
-        update_id = update["id"]
 
-        if isinstance(
-            update_id,
-            (RegexUpdateIdentity, CoordinatesRegexIdentity),
-        ):
-            target_list = _get_regex_targets(sbom, update_id)
-        else:
-            update_key = update_id[0]
-            if isinstance(update_key.key, CoordinatesWithVersionRange):
-                for key in ctx.component_map.keys():
-                    if update_key == key:
-                        target_list += ctx.component_map[key]
-            elif update_key in ctx.component_map:
-                target_list = ctx.component_map[update_key]
+def plan(
+    sbom: dict,
+    updates: t.Sequence[dict[str, t.Any]],
+    cfg: SetConfig,
+) -> UpdatePlan:
+    """
+    Resolves the targets of all updates without modifying the SBOM.
+
+    :param sbom: The SBOM.
+    :param updates: The updates, as in :py:func:`run`.
+    :param cfg: The configuration.
+    :return: The plan.
+    """
+    start = time.perf_counter()
+    _compile_updates(updates, cfg)
+    ctx = _prepare(sbom, cfg)
+    prepared = time.perf_counter()
+    targets = _resolve_targets(updates, ctx, 0, stop_at_protected=False)
+    resolved = time.perf_counter()
+
+    return UpdatePlan(
+        matches=[(str(update["id"]), len(targets[i])) for i, update in enumerate(updates)],
+        timings={
+            "Validation and indexing": prepared - start,
+            "Target resolution": resolved - prepared,
+        },
+    )
+
+
+def run(
+    sbom: dict,
+    updates: t.Sequence[dict[str, t.Any]],
+    cfg: SetConfig,
+) -> None:
+    _compile_updates(updates, cfg)
+    _apply(sbom, updates, cfg)
+    _log_compile_cache_info()
+
+
+def _apply(
+    sbom: dict,
+    updates: t.Sequence[dict[str, t.Any]],
+    cfg: SetConfig,
+) -> None:
+    ctx = _prepare(sbom, cfg)
+
+    # The targets of upcoming updates, resolved in batches ahead of time
+    targets: dict[int, list[dict]] = {}
+
+    for position, update in enumerate(updates):
+        if position not in targets:
+            targets = _resolve_targets(updates, ctx, position)
+        target_list = targets.pop(position)
 
         if len(target_list) == 0:
             if not cfg.ignore_missing:
@@ -806,3 +1152,108 @@ def run(
 
         for target in target_list:
             _do_update(target, update, ctx)
+
+
+ReadSbom = t.Callable[[pathlib.Path], tuple[dict, str]]
+"""A function which loads an SBOM file, such as ``cdxev.__main__.read_sbom``."""
+
+
+def _apply_to_file(
+    input: pathlib.Path,
+    output: pathlib.Path,
+    updates: t.Sequence[dict[str, t.Any]],
+    cfg: SetConfig,
+    read_sbom: ReadSbom,
+) -> FileResult:
+    """
+    Applies compiled updates to an SBOM file and writes the result.
+
+    :return: The messages logged while applying the updates, attributed to *input*, and the
+             details of the error if the updates could not be applied. Messages and errors are
+             returned instead of logged or raised because the log of a worker process doesn't
+             reach the user and :py:class:`AppError` cannot be passed between processes.
+    """
+    error = None
+    with collect_messages(logger, str(input)) as messages:
+        try:
+            sbom, _ = read_sbom(input)
+            # The values of the updates end up in the SBOM, where later updates might modify
+            # them. A copy keeps the SBOMs independent of each other.
+            _apply(sbom, copy.deepcopy(updates), cfg)
+            write_sbom(sbom, output)
+        except AppError as exc:
+            error = exc.details
+            if error.module_name is None:
+                error.module_name = str(input)
+    return messages, error
+
+
+# The arguments shared by all files processed in a worker process, set once by _init_worker
+_worker_args: t.Optional[tuple[t.Sequence[dict[str, t.Any]], SetConfig, ReadSbom]] = None
+
+
+def _init_worker(
+    updates: t.Sequence[dict[str, t.Any]], cfg: SetConfig, read_sbom: ReadSbom, log_level: int
+) -> None:
+    global _worker_args
+    # Messages below the level of the parent process would be dropped there anyway
+    logger.setLevel(log_level)
+    _worker_args = (updates, cfg, read_sbom)
+
+
+def _apply_to_file_in_worker(input: pathlib.Path, output: pathlib.Path) -> FileResult:
+    if _worker_args is None:
+        raise RuntimeError("The worker process has not been initialized.")
+    return _apply_to_file(input, output, *_worker_args)
+
+
+def run_many(
+    files: t.Sequence[tuple[pathlib.Path, pathlib.Path]],
+    updates: t.Sequence[dict[str, t.Any]],
+    cfg: SetConfig,
+    read_sbom: ReadSbom,
+    jobs: int = 1,
+) -> None:
+    """
+    Applies the same updates to several SBOM files.
+
+    The updates are validated and their identifiers compiled only once. With more than one job,
+    the SBOMs are processed by a pool of worker processes, each of which receives the compiled
+    updates once. The messages logged for each SBOM are reported with the path of its file.
+
+    :param files: Pairs of the path to an input SBOM and the path to write the result to.
+    :param updates: The updates, as in :py:func:`run`.
+    :param cfg: The configuration.
+    :param read_sbom: The function to load the input SBOMs with. It must be defined at module
+                      level, so it can be passed to worker processes.
+    :param jobs: The maximum number of SBOMs to process in parallel.
+    :raises AppError: If the updates are invalid or could not be applied to one of the SBOMs. In
+                      the latter case, the other SBOMs are processed and written anyway.
+    """
+    _compile_updates(updates, cfg)
+
+    results: list[FileResult]
+    if jobs > 1 and len(files) > 1:
+        inputs = [input for input, _ in files]
+        outputs = [output for _, output in files]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(jobs, len(files)),
+            initializer=_init_worker,
+            initargs=(updates, cfg, read_sbom, logger.getEffectiveLevel()),
+        ) as pool:
+            results = list(pool.map(_apply_to_file_in_worker, inputs, outputs))
+    else:
+        results = [
+            _apply_to_file(input, output, updates, cfg, read_sbom) for input, output in files
+        ]
+
+    _log_compile_cache_info()
+    failed = []
+    for messages, error in results:
+        relay_messages(logger, messages)
+        if error is not None:
+            failed.append(error)
+    for details in failed[1:]:
+        logger.error(details)
+    if failed:
+        raise AppError(log_msg=failed[0])
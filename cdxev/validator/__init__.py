@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from .validate import validate_sbom
+from .validate import SchemaSource, validate_sbom
 
-__all__ = ["validate_sbom"]
+__all__ = ["SchemaSource", "validate_sbom"]
@@ -1,41 +1,116 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import abc
 import hashlib
 import json
 import logging
 import pathlib
+import textwrap
 import traceback
 import typing as t
 
 from cdxev.log import LogMessage
 
 
-class WarningsNgReporter(logging.Handler):
+class _StreamingReporter(logging.Handler, abc.ABC):
     """
-    Reporter which writes in a JSON format for Jenkins's static analysis model. See
-    https://github.com/jenkinsci/analysis-model/blob/master/src/main/java/edu/hm/hafner/analysis/Issue.java
+    Base class for reporters which write their issues into a JSON array as they arrive.
+
+    The target is opened on the first issue or when the reporter is closed, whichever comes
+    first. The array is only complete once the reporter has been closed. The output is exactly
+    the same as that of ``json.dumps(..., indent=4)`` on the complete document.
     """
 
-    # noinspection PyDefaultArgument
+    _prefix: str
+    """Everything up to and including the opening bracket of the array."""
+
+    _suffix: str
+    """Everything from the closing bracket of the array to the end of the document."""
+
+    _depth: int
+    """The nesting depth of the array's items in the document."""
+
     def __init__(
         self,
         file_path: pathlib.Path,
         target: t.Union[t.TextIO, pathlib.Path],
-        buffer: t.Optional[dict[str, list]] = None,
+        max_issues: t.Optional[int] = None,
     ):
         """
         Creates a new handler with the given target.
 
+        :param file_path: The path of the validated file, reported as the location of issues.
         :param target: The target can be either a path to a file or a text stream object.
+        :param max_issues: The maximum number of issues to write. Further issues are only
+                           counted.
         """
         super().__init__(logging.ERROR)
-        self.buffer = buffer if buffer is not None else {"issues": []}
         self.target = target
         self.file_path = file_path
+        self.max_issues = max_issues
+        # The number of issues written so far and those left out because of max_issues
+        self.written = 0
+        self.omitted = 0
+        self._stream: t.Optional[t.TextIO] = None
+        self._closed = False
+
+    @abc.abstractmethod
+    def format_record(self, record: logging.LogRecord) -> dict[str, t.Any]:
+        """
+        Converts a logged issue into an item of the array.
+
+        :param record: The record of the issue.
+        :return: The JSON-serializable item.
+        """
 
     def emit(self, record: logging.LogRecord) -> None:
         issue = self.format_record(record)
-        self.buffer["issues"].append(issue)
+        if self._closed:
+            return
+        if self.max_issues is not None and self.written >= self.max_issues:
+            self.omitted += 1
+            return
+
+        text = textwrap.indent(json.dumps(issue, indent=4), " " * 4 * self._depth)
+        self._write(("," if self.written else "") + "\n" + text)
+        self.written += 1
+
+    def _write(self, s: str) -> None:
+        if self._stream is None:
+            if isinstance(self.target, pathlib.Path):
+                # Buffered, so issues don't cause a system call each
+                self._stream = self.target.open("w", encoding="utf_8")
+            else:
+                self._stream = self.target
+            self._stream.write(self._prefix)
+        self._stream.write(s)
+
+    def close(self) -> None:
+        """
+        Close the handler and complete the document in the target.
+        """
+        self.acquire()
+        try:
+            if not self._closed:
+                self._closed = True
+                closing = "\n" + " " * 4 * (self._depth - 1) if self.written else ""
+                self._write(closing + self._suffix)
+                if isinstance(self.target, pathlib.Path) and self._stream is not None:
+                    self._stream.close()
+        finally:
+            self.release()
+            super().close()
+
+
+class WarningsNgReporter(_StreamingReporter):
+    """
+    Reporter which writes in a JSON format for Jenkins's static analysis model. See
+    https://github.com/jenkinsci/analysis-model/blob/master/src/main/java/edu/hm/hafner/analysis/Issue.java
+    """
+
+    _prefix = '{\n    "issues": ['
+    _suffix = "]\n}"
+    _depth = 2
 
     def format_record(self, record: logging.LogRecord) -> dict[str, t.Union[str, int]]:
         if not isinstance(record.msg, LogMessage):
@@ -85,47 +160,16 @@ class WarningsNgReporter(logging.Handler):
 
         return issue
 
-    def close(self) -> None:
-        """
-        Close the handler and write the buffer to the target.
-        """
-        s = json.dumps(self.buffer, indent=4)
-        try:
-            if isinstance(self.target, pathlib.Path):
-                self.target.write_text(s, encoding="utf_8")
-            else:
-                self.target.write(s)
-        finally:
-            super().close()
-
 
-class GitLabCQReporter(logging.Handler):
+class GitLabCQReporter(_StreamingReporter):
     """
     Reporter which writes in a JSON format for GitLab Code Quality Report.
     See https://docs.gitlab.com/ee/ci/testing/code_quality.html#implement-a-custom-tool
     """
 
-    # noinspection PyDefaultArgument
-    def __init__(
-        self,
-        file_path: pathlib.Path,
-        target: t.Union[t.TextIO, pathlib.Path],
-        buffer: t.Optional[list] = None,
-    ):
-        """
-        Creates a new handler with the given target.
-
-        :param target: The target can be either a path to a file or a text stream object.
-        """
-        super().__init__(logging.ERROR)
-
-        self.buffer = buffer if buffer is not None else []
-        self.target = target
-        self.file_path = file_path
-
-    def emit(self, record: logging.LogRecord) -> None:
-        issue = self.format_record(record)
-        self.buffer.append(issue)
+    _prefix = "["
+    _suffix = "]"
+    _depth = 1
 
     def format_record(self, record: logging.LogRecord) -> dict[str, t.Union[str, int, dict]]:
         if not isinstance(record.msg, LogMessage):
@@ -161,16 +205,3 @@ class GitLabCQReporter(logging.Handler):
         }
 
         return issue
-
-    def close(self) -> None:
-        """
-        Close the handler and write the buffer to the target.
-        """
-        s = json.dumps(self.buffer, indent=4)
-        try:
-            if isinstance(self.target, pathlib.Path):
-                self.target.write_text(s, encoding="utf_8")
-            else:
-                self.target.write(s)
-        finally:
-            super().close()
@@ -41,12 +41,22 @@ def open_schema(
         ) from e
 
 
+def builtin_schema_filename(schema_type: str, spec_version: str) -> str:
+    """
+    Determines the name of the file which contains a built-in schema.
+
+    :param schema_type: The type of built-in schema, e.g., ``default`` or ``custom``.
+    :param spec_version: The CycloneDX version.
+    :return: The name of the file in the bundled schema directory.
+    """
+    if schema_type == "default":
+        return f"bom-{spec_version}.schema.json"
+    return f"bom-{spec_version}-{schema_type}.schema.json"
+
+
 def _get_builtin_schema(schema_type: str, spec_version: str) -> dict:
     schema_dir = resources.files("cdxev.auxiliary") / "schema"
-    if schema_type == "default":
-        schema_file = schema_dir / f"bom-{spec_version}.schema.json"
-    else:
-        schema_file = schema_dir / f"bom-{spec_version}-{schema_type}.schema.json"
+    schema_file = schema_dir / builtin_schema_filename(schema_type, spec_version)
 
     if not schema_file.is_file():
         raise AppError(
@@ -0,0 +1,219 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Faster implementations of JSON Schema keywords whose reference implementations in jsonschema
+scale poorly with the size of the schema or the instance.
+
+They produce exactly the same errors as the implementations they replace.
+"""
+
+import functools
+import typing as t
+
+import jsonschema.protocols
+import jsonschema.validators
+from jsonschema import FormatChecker
+from jsonschema.exceptions import FormatError, ValidationError
+
+KeywordFunction = t.Callable[..., t.Iterator[ValidationError]]
+
+ENUM_LOOKUP_THRESHOLD = 16
+"""Enums with fewer members are checked by a linear scan, which is cheaper for them."""
+
+FORMAT_CACHE_SIZE = 16384
+"""The number of (format, value) pairs remembered by :py:class:`CachingFormatChecker`."""
+
+
+def json_key(value: t.Any) -> t.Hashable:
+    """
+    Converts a JSON value into a hashable key which respects JSON Schema equality.
+
+    Two values produce the same key if, and only if, JSON Schema considers them equal. In
+    particular, ``true`` is not equal to ``1`` but ``1`` is equal to ``1.0`` and the order of
+    object members is insignificant.
+
+    :param value: A deserialized JSON value.
+    :return: The key.
+    """
+    # Strings, numbers and null can serve as their own key. Booleans, arrays and objects are
+    # tagged so they cannot collide with each other or with numbers.
+    if isinstance(value, bool):
+        return ("boolean", value)
+    if isinstance(value, (list, tuple)):
+        return ("array", tuple(json_key(item) for item in value))
+    if isinstance(value, dict):
+        return ("object", frozenset((name, json_key(item)) for name, item in value.items()))
+    return t.cast(t.Hashable, value)
+
+
+EnumLookups = dict[int, tuple[list[t.Any], frozenset[t.Hashable]]]
+"""
+Maps id(enums) to the list it was computed from and the keys of its members. Holding on to the
+list guarantees that its id isn't reused while the entry exists.
+"""
+
+
+def _make_enum(fallback: KeywordFunction, lookups: EnumLookups) -> KeywordFunction:
+    def enum(
+        validator: jsonschema.protocols.Validator,
+        enums: t.Any,
+        instance: t.Any,
+        schema: t.Any,
+    ) -> t.Iterator[ValidationError]:
+        if not isinstance(enums, list) or len(enums) < ENUM_LOOKUP_THRESHOLD:
+            yield from fallback(validator, enums, instance, schema)
+            return
+
+        lookup = lookups.get(id(enums))
+        if lookup is None or lookup[0] is not enums:
+            lookup = (enums, frozenset(json_key(member) for member in enums))
+            lookups[id(enums)] = lookup
+
+        if json_key(instance) not in lookup[1]:
+            yield ValidationError(f"{instance!r} is not one of {enums!r}")
+
+    return enum
+
+
+def unique_items(
+    validator: jsonschema.protocols.Validator,
+    unique: t.Any,
+    instance: t.Any,
+    schema: t.Any,
+) -> t.Iterator[ValidationError]:
+    """
+    Implementation of ``uniqueItems`` in linear instead of quadratic time for arrays of objects.
+    """
+    if (
+        unique
+        and validator.is_type(instance, "array")
+        and len({json_key(item) for item in instance}) != len(instance)
+    ):
+        yield ValidationError(f"{instance!r} has non-unique elements")
+
+
+def extend(
+    validator_cls: type[jsonschema.protocols.Validator],
+    wrap: t.Optional[t.Callable[[str, KeywordFunction], KeywordFunction]] = None,
+) -> type[jsonschema.protocols.Validator]:
+    """
+    Creates a validator class which uses the faster keyword implementations.
+
+    Large ``enum`` keywords, such as the list of SPDX license IDs, are checked by a set lookup
+    and ``uniqueItems`` is checked by hashing the array items.
+
+    References into schemas of a different dialect (e.g., the draft-07 SPDX schema referenced
+    from a 2020-12 CycloneDX schema) are validated by an extended class for that dialect, too.
+    All these classes share the precompiled enums.
+
+    :param validator_cls: The validator class for the dialect of the schema.
+    :param wrap: Optionally, a function which is called with the name and implementation of
+                 every keyword and returns a replacement implementation, e.g., for
+                 instrumentation.
+    :return: A validator class for the same dialect as *validator_cls*.
+    """
+    lookups: EnumLookups = {}
+    extended: dict[type, type[jsonschema.protocols.Validator]] = {}
+    # The (attribute name, init argument) pairs of the extended classes
+    fields: dict[type, list[tuple[str, str]]] = {}
+
+    def evolve(self: t.Any, **changes: t.Any) -> jsonschema.protocols.Validator:
+        # Mirrors the evolve() of jsonschema, except that the class for the dialect of the new
+        # schema is replaced by its extended counterpart.
+        schema = changes.setdefault("schema", self.schema)
+        new_cls = for_dialect(jsonschema.validators.validator_for(schema, default=type(self)))
+        for name, alias in fields[type(self)]:
+            if alias not in changes:
+                changes[alias] = getattr(self, name)
+        return new_cls(**changes)
+
+    def for_dialect(
+        cls: type[jsonschema.protocols.Validator],
+    ) -> type[jsonschema.protocols.Validator]:
+        if cls not in extended:
+            keywords: dict[str, KeywordFunction] = {}
+            if "enum" in cls.VALIDATORS:
+                keywords["enum"] = _make_enum(cls.VALIDATORS["enum"], lookups)
+            if "uniqueItems" in cls.VALIDATORS:
+                keywords["uniqueItems"] = unique_items
+            if wrap is not None:
+                keywords = {
+                    keyword: wrap(keyword, func)
+                    for keyword, func in {**cls.VALIDATORS, **keywords}.items()
+                }
+            new_cls = jsonschema.validators.extend(cls, keywords)  # type: ignore[no-untyped-call]
+            new_cls.evolve = evolve
+            fields[new_cls] = [(a.name, a.alias) for a in new_cls.__attrs_attrs__ if a.init]
+            extended[cls] = extended[new_cls] = new_cls
+        return extended[cls]
+
+    return for_dialect(validator_cls)
+
+
+class CachingFormatChecker(FormatChecker):
+    """
+    A format checker which remembers the outcome of checking string values.
+
+    SBOMs repeat the same timestamps, URLs and e-mail addresses many times. Some format checks,
+    e.g., those for e-mail addresses, are expensive enough to make this worthwhile.
+    """
+
+    def __init__(
+        self,
+        formats: t.Optional[t.Iterable[str]] = None,
+        maxsize: int = FORMAT_CACHE_SIZE,
+    ) -> None:
+        """
+        :param formats: The formats to check. Other formats are accepted without checking. Formats
+                        unknown to jsonschema are ignored. If ``None``, all known formats are
+                        checked.
+        :param maxsize: The number of outcomes to remember. The least recently used are
+                        forgotten first.
+        """
+        if formats is not None:
+            formats = [f for f in formats if f in self.checkers]
+        super().__init__(formats)
+        self._check_string = functools.lru_cache(maxsize=maxsize)(self._check_uncached)
+
+    def _check_uncached(
+        self, instance: str, format: str
+    ) -> t.Optional[tuple[str, t.Optional[BaseException]]]:
+        try:
+            super().check(instance, format)
+        except FormatError as error:
+            return error.message, error.cause
+        return None
+
+    def check(self, instance: object, format: str) -> None:
+        if format not in self.checkers:
+            return
+        if not isinstance(instance, str):
+            super().check(instance, format)
+            return
+
+        failure = self._check_string(instance, format)
+        if failure is not None:
+            raise FormatError(failure[0], cause=failure[1])
+
+
+def used_formats(schemas: t.Iterable[t.Any]) -> set[str]:
+    """
+    Collects the values of all ``format`` keywords in the given schemas.
+
+    The result may contain a few extra strings, e.g., if an example in a schema has a property
+    named ``format``. This is harmless when used to select the formats which need checking.
+
+    :param schemas: The schemas to search, including subschemas.
+    :return: The names of the formats.
+    """
+    formats = set()
+    pending = list(schemas)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get("format"), str):
+                formats.add(node["format"])
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+    return formats
@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import contextlib
+import json
+import time
+import typing as t
+from dataclasses import dataclass
+
+from jsonschema.exceptions import ValidationError
+
+from cdxev.validator.keywords import KeywordFunction
+
+
+@dataclass
+class Timing:
+    """The accumulated time spent in a phase, keyword or schema location."""
+
+    time: float = 0.0
+    """The cumulative time in seconds."""
+
+    calls: int = 0
+    """How often the phase was entered or the keyword evaluated."""
+
+
+class ValidationProfile:
+    """
+    Collects the time spent in the phases of a validation and in the evaluation of schema
+    keywords.
+
+    Keyword times are cumulative, i.e., the time of a keyword such as ``properties`` includes
+    the time of all keywords in its subschemas.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, Timing] = {}
+        self.keywords: dict[str, Timing] = {}
+        self.locations: dict[str, Timing] = {}
+        # Maps id(subschema) to the URI of the subschema. Holds on to the subschemas, so their
+        # ids remain unique.
+        self._schema_uris: dict[int, tuple[t.Any, str]] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> t.Iterator[None]:
+        """
+        Measures the time spent in the body of the ``with`` statement as part of a phase.
+
+        A phase can be entered multiple times. Its time is the total of all visits.
+
+        :param name: The name of the phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = self.phases.setdefault(name, Timing())
+            timing.time += time.perf_counter() - start
+            timing.calls += 1
+
+    def add_schema(self, uri: str, schema: t.Any) -> None:
+        """
+        Makes the subschemas of a schema known, so keyword times can be attributed to their
+        locations.
+
+        :param uri: The URI of the schema.
+        :param schema: The schema.
+        """
+        pending = [(schema, uri + "#")]
+        while pending:
+            node, location = pending.pop()
+            if isinstance(node, dict):
+                if id(node) in self._schema_uris:
+                    continue
+                self._schema_uris[id(node)] = (node, location)
+                children = node.items()
+            elif isinstance(node, list):
+                children = enumerate(node)  # type: ignore[assignment]
+            else:
+                continue
+            for key, child in children:
+                token = str(key).replace("~", "~0").replace("/", "~1")
+                pending.append((child, f"{location}/{token}"))
+
+    def wrap_keyword(self, keyword: str, func: KeywordFunction) -> KeywordFunction:
+        """
+        Instruments a keyword implementation to record its evaluation time.
+
+        Can be passed as the *wrap* argument of :py:func:`cdxev.validator.keywords.extend`.
+
+        :param keyword: The name of the keyword.
+        :param func: The implementation of the keyword.
+        :return: An implementation which behaves the same as *func*.
+        """
+
+        def timed_keyword(
+            validator: t.Any, value: t.Any, instance: t.Any, schema: t.Any
+        ) -> t.Iterator[ValidationError]:
+            elapsed = 0.0
+            try:
+                start = time.perf_counter()
+                errors = func(validator, value, instance, schema) or iter(())
+                elapsed += time.perf_counter() - start
+                while True:
+                    # Errors are produced lazily. Only the time spent inside the keyword
+                    # counts, not the time the caller spends between two errors.
+                    start = time.perf_counter()
+                    try:
+                        error = next(errors)
+                    except StopIteration:
+                        return
+                    finally:
+                        elapsed += time.perf_counter() - start
+                    yield error
+            finally:
+                self._record(keyword, schema, elapsed)
+
+        return timed_keyword
+
+    def _record(self, keyword: str, schema: t.Any, elapsed: float) -> None:
+        entry = self._schema_uris.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            location = f"{entry[1]}/{keyword}"
+        else:
+            location = f"<unknown>/{keyword}"
+        for timings, key in ((self.keywords, keyword), (self.locations, location)):
+            timing = timings.setdefault(key, Timing())
+            timing.time += elapsed
+            timing.calls += 1
+
+    def to_dict(self, top: int) -> dict[str, t.Any]:
+        """
+        Summarizes the profile.
+
+        :param top: The number of keywords and schema locations to include.
+        :return: A JSON-serializable summary with the phases in the order they were first entered
+                 and the keywords and locations with the highest cumulative times.
+        """
+
+        def top_timings(timings: dict[str, Timing], name: str) -> list[dict[str, t.Any]]:
+            ranked = sorted(timings.items(), key=lambda item: item[1].time, reverse=True)
+            return [
+                {name: key, "time": timing.time, "calls": timing.calls}
+                for key, timing in ranked[:top]
+            ]
+
+        return {
+            "phases": [
+                {"phase": name, "time": timing.time, "calls": timing.calls}
+                for name, timing in self.phases.items()
+            ],
+            "keywords": top_timings(self.keywords, "keyword"),
+            "locations": top_timings(self.locations, "location"),
+        }
+
+    def write(self, stream: t.TextIO, top: int, as_json: bool) -> None:
+        """
+        Writes a report of the profile.
+
+        :param stream: The stream to write to.
+        :param top: The number of keywords and schema locations to include.
+        :param as_json: Write JSON instead of human-readable tables.
+        """
+        summary = self.to_dict(top)
+        if as_json:
+            json.dump(summary, stream, indent=4)
+            stream.write("\n")
+            return
+
+        for title, key, rows in (
+            ("Phase", "phase", summary["phases"]),
+            (f"Top {top} keywords", "keyword", summary["keywords"]),
+            (f"Top {top} schema locations", "location", summary["locations"]),
+        ):
+            width = max([len(title)] + [len(row[key]) for row in rows])
+            stream.write(f"{title:<{width}}  {'Time [s]':>10}  {'Calls':>10}\n")
+            for row in rows:
+                stream.write(f"{row[key]:<{width}}  {row['time']:>10.3f}  {row['calls']:>10}\n")
+            stream.write("\n")
+
+
+def phase(profile: t.Optional[ValidationProfile], name: str) -> t.ContextManager[None]:
+    """
+    Measures the time of a phase if profiling is enabled.
+
+    :param profile: The profile to record the time in or ``None`` if profiling is disabled.
+    :param name: The name of the phase.
+    :return: A context manager.
+    """
+    if profile is None:
+        return contextlib.nullcontext()
+    return profile.phase(name)
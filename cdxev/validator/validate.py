@@ -1,23 +1,32 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import contextlib
+import functools
+import hashlib
+import importlib.metadata
 import logging
 import re
 import sys
 import typing as t
+from dataclasses import asdict, dataclass, field
+from importlib import resources
 from pathlib import Path
 
 import jsonschema
 import jsonschema.exceptions
+import jsonschema.protocols
 import jsonschema.validators
-from jsonschema import FormatChecker
 from referencing import Registry, Resource
 from referencing.jsonschema import DRAFT202012, Schema
 
+from cdxev import pkg
+from cdxev.auxiliary.cache import JsonCache, hash_file, hash_json
 from cdxev.error import AppError
 from cdxev.log import LogMessage
+from cdxev.validator import keywords, profiling
 from cdxev.validator.customreports import GitLabCQReporter, WarningsNgReporter
 from cdxev.validator.helper import (
+    builtin_schema_filename,
     load_bundled_schema,
     load_spdx_schema,
     open_schema,
@@ -27,7 +36,42 @@ from cdxev.validator.helper import (
 logger = logging.getLogger(__name__)
 
 
-def validate_sbom(  # noqa: C901
+@dataclass
+class ValidationResult:
+    """The outcome of validating a single SBOM, before it is reported."""
+
+    errors: list[str] = field(default_factory=list)
+    """Error messages in the form ``<location> has the mistake: <description>``."""
+
+    warnings: list[str] = field(default_factory=list)
+    """Warning messages which don't render the SBOM invalid."""
+
+
+ComponentRecords = dict[str, t.Optional[dict[str, list[str]]]]
+"""
+Maps the fingerprints of top-level components to their validation results.
+
+A result is ``None`` if it cannot be reused for the same component at a different position.
+"""
+
+
+@dataclass(frozen=True)
+class SchemaSource:
+    """Selects a schema to validate against. Exactly one of the fields must be set."""
+
+    schema_type: t.Optional[str] = None
+    """The type of built-in schema, e.g., ``default`` or ``custom``."""
+
+    schema_path: t.Optional[Path] = None
+    """The path to a schema file."""
+
+    @property
+    def label(self) -> str:
+        """A short name of the schema for use in messages."""
+        return self.schema_type or str(self.schema_path)
+
+
+def validate_sbom(
     sbom: dict,
     input_format: str,
     file: Path,
@@ -36,8 +80,40 @@ def validate_sbom(  # noqa: C901
     schema_type: t.Optional[str],
     filename_regex: t.Optional[str],
     schema_path: t.Optional[Path],
+    cache_dir: t.Optional[Path] = None,
+    baseline: t.Optional[dict] = None,
+    profile: t.Optional[profiling.ValidationProfile] = None,
+    report_max_issues: t.Optional[int] = None,
+    additional_schemas: t.Sequence[SchemaSource] = (),
 ) -> int:
-    errors: list[str] = []
+    """
+    Validates an SBOM and logs the results.
+
+    :param sbom: The SBOM to validate.
+    :param input_format: The format of the SBOM file. Only ``json`` is validated.
+    :param file: The path of the SBOM file. Used for filename validation and in reports.
+    :param report_format: The format of a report file to write, if any.
+    :param report_path: The path of the report file. Must be given if *report_format* is.
+    :param schema_type: The type of built-in schema to validate against.
+    :param filename_regex: The pattern for filename validation. An empty string selects a default
+                           pattern. ``None`` disables filename validation.
+    :param schema_path: The path to a schema file to validate against.
+    :param cache_dir: A directory for caching validation results. If ``None``, results are
+                      neither looked up nor stored.
+    :param baseline: A previously validated version of *sbom*. Components which are unchanged
+                     since the baseline was validated are not validated again but the results
+                     recorded for them in the cache are reused. Requires *cache_dir*.
+    :param profile: If given, the time spent in the phases of the validation and in the
+                    evaluation of schema keywords is recorded here. Cached results are not
+                    reused then, so there is something to measure, but the result is still
+                    stored.
+    :param report_max_issues: The maximum number of issues to write to the report file. ``None``
+                              means no limit.
+    :param additional_schemas: Further schemas to validate against. The SBOM must be valid
+                               against all schemas. If there are any, messages are tagged with
+                               the schema they came from.
+    :return: 0 if the SBOM is valid, 1 otherwise.
+    """
     if (schema_path is not None) == bool(schema_type):
         raise AssertionError(  # pragma: no cover
             "Exactly one of schema_path or schema_type must be non-None"
@@ -53,6 +129,7 @@ def validate_sbom(  # noqa: C901
         )
         stderr_handler.setStream(sys.stdout)
 
+    result = ValidationResult()
     if input_format == "json":
         try:
             spec_version: str = sbom["specVersion"]
@@ -62,215 +139,63 @@ def validate_sbom(  # noqa: C901
                 "Failed to validate against built-in schema because 'specVersion' is missing. "
                 "Add the field, then retry.",
             ) from exc
-        sbom_schema = open_schema(spec_version, schema_type, schema_path)
 
-        if filename_regex is not None:
-            # Filename should be validated
-            filename_error = validate_filename(file.name, filename_regex, sbom, schema_type)
-            if filename_error:
-                if filename_regex == "" and schema_type != "custom":
-                    # Implicit validation against CycloneDX recommendations is only a warning
-                    logger.warning(filename_error)
-                else:
-                    # Explicit filename pattern or custom schema produces validation errors
-                    errors.append("SBOM has the mistake: " + filename_error)
+        cache = JsonCache(cache_dir / "validate") if cache_dir is not None else None
+        # All schemas share one registry of the referenced helper schemas. It's only built if
+        # at least one of them isn't served from the cache.
+        create_registry = functools.cache(_create_registry)
+        # The SBOMs are hashed once for all schemas
+        sbom_hash = hash_json(sbom) if cache is not None else None
+        baseline_hash = hash_json(baseline) if cache is not None and baseline is not None else None
+        schemas = [SchemaSource(schema_type, schema_path), *additional_schemas]
+        filename_checks: set[bool] = set()
 
-        schema_spdx = Resource.from_contents(
-            contents=load_spdx_schema(), default_specification=DRAFT202012
-        )
-        registry: Registry[Schema] = Registry().with_resource(
-            uri="spdx.schema.json", resource=schema_spdx
-        )
-        for helper_schema_name in ("jsf-0.82.schema.json", "cryptography-defs.schema.json"):
-            try:
-                helper_schema = load_bundled_schema(helper_schema_name)
-                helper_resource = Resource.from_contents(
-                    contents=helper_schema, default_specification=DRAFT202012
-                )
-                registry = registry.with_resource(uri=helper_schema_name, resource=helper_resource)
-            except Exception:
-                # Helper schema absent – skip; validation will still work unless the
-                # BOM itself exercises the missing reference.
-                logger.debug(
-                    "Bundled helper schema '%s' could not be loaded; skipping.",
-                    helper_schema_name,
-                    exc_info=True,
-                )
+        for source in schemas:
+            # The filename is validated once for each distinct pattern, together with the first
+            # schema which applies it. Without an explicit pattern, custom schemas require a
+            # different one than the others.
+            filename_check = source.schema_type == "custom" and filename_regex == ""
+            if filename_regex is not None and filename_check not in filename_checks:
+                filename_checks.add(filename_check)
+                schema_filename_regex: t.Optional[str] = filename_regex
+            else:
+                schema_filename_regex = None
 
-        validator_cls: type[jsonschema.Validator] = jsonschema.validators.validator_for(
-            sbom_schema
-        )
-        if schema_path is not None:
-            # Built-in schemas are assumed to be tested during development. A runtime check on
-            # every run of the validate command would be excessive.
-            try:
-                validator_cls.check_schema(sbom_schema)
-            except jsonschema.exceptions.SchemaError as exc:
-                raise AppError(
-                    "Schema not loaded",
-                    "Invalid JSON Schema in schema file " + str(schema_path),
-                ) from exc
-        v = validator_cls(
-            schema=sbom_schema,
-            registry=registry,
-            format_checker=FormatChecker(),
-        )
-        for error in sorted(v.iter_errors(sbom), key=str):
-            try:
-                if error.validator == "required" and error.validator_value == [
-                    "this_is_an_externally_described_component"
-                ]:
-                    # This requirement in the schema allows us to produce warnings.
-                    comp = t.cast(dict, error.instance)
-                    if "bom-ref" in comp:
-                        comp_id = f"Component [bom-ref: {comp['bom-ref']}]"
-                    elif "name" in comp:
-                        comp_id = f"Component [name: {comp['name']}]"
-                    else:
-                        comp_id = f"Unidentified component at {error.json_path}"
+            schema_result = _validate_cached(
+                sbom,
+                spec_version,
+                file,
+                source,
+                schema_filename_regex,
+                cache,
+                baseline,
+                sbom_hash,
+                baseline_hash,
+                create_registry,
+                profile,
+            )
+            if len(schemas) > 1:
+                schema_result = _tag_messages(schema_result, source.label)
+            result.errors.extend(schema_result.errors)
+            result.warnings.extend(schema_result.warnings)
 
-                    logger.warning(
-                        comp_id + " is described by an external BOM. "
-                        "The validity of the referenced BOM cannot be checked."
-                    )
-                    continue
-                elif len(error.absolute_path) > 3:
-                    error_path = (
-                        sbom[error.absolute_path[0]][error.absolute_path[1]].get(
-                            "bom-ref",
-                            sbom[error.absolute_path[0]][error.absolute_path[1]].get(
-                                "name", error.json_path
-                            ),
-                        )
-                        + " the field "
-                        + error.absolute_path[2]
-                        + "["
-                        + str(error.absolute_path[3])
-                        + "] has the mistake: "
-                    )
-                elif len(error.absolute_path) >= 2:
-                    error_path = (
-                        sbom[error.absolute_path[0]][error.absolute_path[1]].get(
-                            "bom-ref",
-                            sbom[error.absolute_path[0]][error.absolute_path[1]].get(
-                                "name", error.json_path
-                            ),
-                        )
-                        + " has the mistake: "
-                    )
-                elif len(error.absolute_path) == 1:
-                    if "$schema" == error.absolute_path[0]:
-                        # skip error that schema is wrong as probably another scheme is in use
-                        continue
-                    else:
-                        error_path = f"{error.absolute_path[0]} has the mistake: "
-                else:
-                    error_path = "SBOM has the mistake: "
-            except AttributeError:
-                error_path = error.json_path + " has the mistake: "
-            if error.context is not None and len(error.context) > 0:
-                if error.validator == "oneOf" and "licenses" in error.json_path:
-                    # When licenseChoice (array oneOf) fails, the actual errors are nested in
-                    # the context of the branch that was closest to passing. Walk the context
-                    # tree to find the most relevant leaf errors to surface.
-                    def collect_leaf_errors(
-                        err: jsonschema.exceptions.ValidationError,
-                    ) -> list[jsonschema.exceptions.ValidationError]:
-                        if err.context:
-                            leaves = []
-                            for sub in err.context:
-                                leaves.extend(collect_leaf_errors(sub))
-                            return leaves
-                        return [err]
-
-                    # Collect all leaf errors from all branches (deduplicated by message)
-                    all_leaves: list[jsonschema.exceptions.ValidationError] = []
-                    seen_messages: set[str] = set()
-                    for ctx_error in error.context:
-                        for leaf in collect_leaf_errors(ctx_error):
-                            if leaf.message not in seen_messages:
-                                seen_messages.add(leaf.message)
-                                all_leaves.append(leaf)
-
-                    for leaf in all_leaves:
-                        if "license.id" in leaf.json_path and "is not one of" in leaf.message:
-                            errors.append(
-                                error_path
-                                + "used license ID "
-                                + leaf.args[0].split()[0]
-                                + " is not a valid SPDX ID. "
-                                "Please use either the field 'name' and 'text' or "
-                                "provide a valid ID."
-                            )
-                        elif "non-empty" in leaf.message:
-                            errors.append(
-                                f"{error_path}'{leaf.absolute_path[-1]}' should not be empty"
-                            )
-                        elif leaf.validator == "pattern":
-                            errors.append(error_path + leaf.message.replace("\\", ""))
-                        else:
-                            errors.append(error_path + leaf.message)
-                else:
-                    error_message = ""
-                    for i in range(len(error.context)):
-                        error_field = re.search(r"'\w+'|(is too short)", error.context[i].message)
-                        if (error_field is None) or (error_field.group(0) == "is too short"):
-                            validation_field = (
-                                "'" + error.context[i].json_path.split(".")[-1] + "'"
-                            )
-                        else:
-                            validation_field = error_field.group(0)
-                        if i < (len(error.context) - 1):
-                            if error_message == "":
-                                error_message += validation_field
-                            else:
-                                error_message += ", " + validation_field
-                        else:
-                            error_message += " or " + validation_field
-                    error_message += " is a required property"
-                    errors.append(error_path + error_message)
-            else:
-                if ("license.id" in error.json_path) and ("is not one of" in error.message):
-                    # if mistake is a wrong SPDX ID omit printing every single option
-                    errors.append(
-                        error_path
-                        + "used license ID "
-                        + error.args[0].split()[0]
-                        + " is not a valid SPDX ID. "
-                        "Please use either the field 'name' or provide a valid ID."
-                    )
-                elif ("dependsOn" in error.json_path) and (
-                    "has non-unique elements" in error.message
-                ):
-                    dependencies = sbom.get("dependencies", {})
-                    index_dependencies = re.search(r"\[\d\]", error_path)
-                    if index_dependencies is not None:
-                        index_ref = index_dependencies.group(0).strip("[]")
-                        errors.append(
-                            dependencies[int(index_ref)]["ref"]
-                            + " has the mistake: the dependencies in dependsOn are non-unique"
-                        )
-                    else:
-                        errors.append(
-                            "SBOM has the mistake: Could not find reference for dependencies"
-                        )
-                elif "non-empty" in error.message:
-                    errors.append(f"{error_path}'{error.absolute_path[-1]}' should not be empty")
-                elif error.validator == "pattern":
-                    errors.append(error_path + error.message.replace("\\", ""))
-                else:
-                    errors.append(error_path + error.message)
-    sorted_errors = sorted(set(errors))
+        result.errors = sorted(set(result.errors))
+        result.warnings = list(dict.fromkeys(result.warnings))
+
+        for warning in result.warnings:
+            logger.warning(warning)
 
-    report_handler: t.Optional[logging.Handler] = None
+    sorted_errors = result.errors
+
+    report_handler: t.Optional[t.Union[WarningsNgReporter, GitLabCQReporter]] = None
     if report_format == "warnings-ng":
         # The following cast is safe because the caller of this function made sure that
         # report_path is not None when report_format is not None.
-        report_handler = WarningsNgReporter(file, t.cast(Path, report_path))
+        report_handler = WarningsNgReporter(file, t.cast(Path, report_path), report_max_issues)
         logger.addHandler(report_handler)
     elif report_format == "gitlab-code-quality":
         # See comment above
-        report_handler = GitLabCQReporter(file, t.cast(Path, report_path))
+        report_handler = GitLabCQReporter(file, t.cast(Path, report_path), report_max_issues)
         logger.addHandler(report_handler)
     if len(sorted_errors) == 0:
         logger.info("SBOM is compliant to the provided specification schema")
@@ -287,5 +212,690 @@ def validate_sbom(  # noqa: C901
                 )
             )
         if report_handler is not None:
+            logger.removeHandler(report_handler)
             report_handler.close()
+            if report_handler.omitted:
+                logger.warning(
+                    "The report contains only the first %d issues. %d more were omitted.",
+                    report_handler.written,
+                    report_handler.omitted,
+                )
         return 1
+
+
+def _validate_cached(
+    sbom: dict,
+    spec_version: str,
+    file: Path,
+    source: SchemaSource,
+    filename_regex: t.Optional[str],
+    cache: t.Optional[JsonCache],
+    baseline: t.Optional[dict],
+    sbom_hash: t.Optional[str],
+    baseline_hash: t.Optional[str],
+    create_registry: t.Callable[[], Registry[Schema]],
+    profile: t.Optional[profiling.ValidationProfile],
+) -> ValidationResult:
+    """
+    Validates an SBOM against a single schema, unless the result is found in the cache.
+
+    See :py:func:`validate_sbom` for the parameters. *sbom_hash* and *baseline_hash* are the
+    results of :py:func:`hash_json` for the SBOM and the baseline or ``None`` if there is no
+    cache.
+    """
+    schema_id: t.Optional[str] = None
+    cached: t.Optional[dict] = None
+    with profiling.phase(profile, "cache lookup"):
+        if cache is not None:
+            schema_id = _schema_id(spec_version, source.schema_type, source.schema_path)
+        if cache is not None and schema_id is not None and sbom_hash is not None:
+            result_key = _result_cache_key(sbom_hash, schema_id, file, filename_regex)
+            # A profile of a cached result wouldn't tell anything about the validation
+            if profile is None:
+                cached = cache.get(result_key)
+
+    if cached is not None:
+        logger.debug("Reusing cached validation result")
+        return ValidationResult(errors=cached["errors"], warnings=cached["warnings"])
+
+    baseline_records: t.Optional[ComponentRecords] = None
+    if baseline is not None and cache is not None and schema_id is not None:
+        with profiling.phase(profile, "cache lookup"):
+            baseline_records = cache.get(
+                _component_cache_key(t.cast(str, baseline_hash), schema_id)
+            )
+        if baseline_records is None:
+            logger.info(
+                "No validation results have been recorded for the baseline SBOM. "
+                "Validating all components."
+            )
+
+    result, records = _validate(
+        sbom,
+        spec_version,
+        file,
+        source.schema_type,
+        filename_regex,
+        source.schema_path,
+        record_components=cache is not None and schema_id is not None,
+        baseline_records=baseline_records,
+        profile=profile,
+        create_registry=create_registry,
+        cache=cache,
+    )
+    if cache is not None and schema_id is not None:
+        with profiling.phase(profile, "cache store"):
+            cache.put(result_key, asdict(result))
+            if records is not None:
+                cache.put(_component_cache_key(t.cast(str, sbom_hash), schema_id), records)
+
+    return result
+
+
+def _tag_messages(result: ValidationResult, label: str) -> ValidationResult:
+    """
+    Marks the messages in a result with the schema they came from.
+
+    :param result: The result of validating against a single schema.
+    :param label: A label for the schema.
+    :return: A new result with tagged messages.
+    """
+    mistake = "has the mistake: "
+    return ValidationResult(
+        errors=[msg.replace(mistake, f"{mistake}[{label}] ", 1) for msg in result.errors],
+        warnings=[f"[{label}] {msg}" for msg in result.warnings],
+    )
+
+
+# The bundled schemas which any schema can reference
+_HELPER_SCHEMAS = ("spdx.schema.json", "jsf-0.82.schema.json", "cryptography-defs.schema.json")
+
+
+@functools.cache
+def _bundled_schema_hash(filename: str) -> t.Optional[str]:
+    """
+    Computes a SHA-256 digest of a schema file bundled with this tool.
+
+    :return: The hex digest or ``None`` if there is no such file.
+    """
+    path = resources.files("cdxev.auxiliary.schema") / filename
+    if not path.is_file():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _library_version(name: str) -> t.Optional[str]:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+@functools.cache
+def _cache_environment() -> dict[str, t.Any]:
+    """
+    Describes everything besides the SBOM and the schema which validation results depend on.
+
+    The version of this tool alone isn't enough, because it isn't set in source or editable
+    installs.
+    """
+    return {
+        "tool": pkg.VERSION,
+        "jsonschema": _library_version("jsonschema"),
+        "email-validator": _library_version("email-validator"),
+        "helpers": {name: _bundled_schema_hash(name) for name in _HELPER_SCHEMAS},
+    }
+
+
+def _schema_id(
+    spec_version: str, schema_type: t.Optional[str], schema_path: t.Optional[Path]
+) -> t.Optional[str]:
+    """
+    Identifies the schema an SBOM is validated against for the purpose of caching.
+
+    Schema files as well as built-in schemas are identified by the hash of their content.
+
+    :return: The identifier or ``None`` if validation results must not be cached.
+    """
+    if schema_path is not None:
+        try:
+            return "file:" + hash_file(schema_path)
+        except OSError:
+            # Leave error reporting to the actual attempt at loading the schema
+            return None
+
+    digest = _bundled_schema_hash(builtin_schema_filename(t.cast(str, schema_type), spec_version))
+    if digest is None:
+        # Leave error reporting to the actual attempt at loading the schema
+        return None
+    # The type is part of the identifier because filename validation depends on it
+    return f"builtin:{schema_type}:{digest}"
+
+
+def _result_cache_key(
+    sbom_hash: str, schema_id: str, file: Path, filename_regex: t.Optional[str]
+) -> str:
+    """
+    Computes the key under which the validation result of an SBOM is cached.
+
+    The key covers everything the result depends on: the SBOM content, the schema, the filename
+    and pattern (if filenames are validated) and the versions of this tool and the libraries it
+    validates with.
+
+    :param sbom_hash: The result of :py:func:`hash_json` for the SBOM.
+    """
+    return hash_json(
+        {
+            **_cache_environment(),
+            "sbom": sbom_hash,
+            "schema": schema_id,
+            "filename": file.name if filename_regex is not None else None,
+            "filenameRegex": filename_regex,
+        }
+    )
+
+
+def _component_cache_key(sbom_hash: str, schema_id: str) -> str:
+    """
+    Computes the key under which the results of an SBOM's components are recorded.
+
+    Unlike the key of the overall result, this key doesn't depend on the filename, so the records
+    can be found for any SBOM passed as a baseline.
+
+    :param sbom_hash: The result of :py:func:`hash_json` for the SBOM.
+    """
+    return hash_json(
+        {
+            **_cache_environment(),
+            "components": sbom_hash,
+            "schema": schema_id,
+        }
+    )
+
+
+def _validate(
+    sbom: dict,
+    spec_version: str,
+    file: Path,
+    schema_type: t.Optional[str],
+    filename_regex: t.Optional[str],
+    schema_path: t.Optional[Path],
+    record_components: bool = False,
+    baseline_records: t.Optional[ComponentRecords] = None,
+    profile: t.Optional[profiling.ValidationProfile] = None,
+    create_registry: t.Optional[t.Callable[[], Registry[Schema]]] = None,
+    cache: t.Optional[JsonCache] = None,
+) -> tuple[ValidationResult, t.Optional[ComponentRecords]]:
+    result = ValidationResult()
+    with profiling.phase(profile, "schema loading"):
+        sbom_schema = open_schema(spec_version, schema_type, schema_path)
+
+    if filename_regex is not None:
+        # Filename should be validated
+        with profiling.phase(profile, "filename validation"):
+            filename_error = validate_filename(file.name, filename_regex, sbom, schema_type)
+        if filename_error:
+            if filename_regex == "" and schema_type != "custom":
+                # Implicit validation against CycloneDX recommendations is only a warning
+                result.warnings.append(filename_error)
+            else:
+                # Explicit filename pattern or custom schema produces validation errors
+                result.errors.append("SBOM has the mistake: " + filename_error)
+
+    v = _create_validator(sbom_schema, schema_path, profile, create_registry, cache)
+    records: t.Optional[ComponentRecords] = None
+    if (record_components or baseline_records) and isinstance(sbom.get("components"), list):
+        records = _validate_components(
+            v, sbom, sbom_schema, baseline_records or {}, result, profile
+        )
+    else:
+        with profiling.phase(profile, "validation"):
+            validation_errors = sorted(v.iter_errors(sbom), key=str)
+        with profiling.phase(profile, "error post-processing"):
+            _format_errors(sbom, validation_errors, result)
+    result.errors = sorted(set(result.errors))
+    return result, records
+
+
+# Keywords which may be applied to the components array when validating incrementally.
+# Anything else could make the validity of a component depend on its siblings.
+_INCREMENTAL_ARRAY_KEYWORDS = {
+    "$id",
+    "$comment",
+    "title",
+    "description",
+    "type",
+    "items",
+    "uniqueItems",
+    "minItems",
+    "maxItems",
+}
+
+
+# Keywords of subschemas applied to the document which don't depend on the content of the
+# components array. They only look at the names of the document's properties or don't apply to
+# the instance at all.
+_KEYWORDS_BLIND_TO_COMPONENTS = {
+    "$schema",
+    "$id",
+    "$comment",
+    "title",
+    "description",
+    "default",
+    "examples",
+    "definitions",
+    "$defs",
+    "type",
+    "required",
+    "dependentRequired",
+    "minProperties",
+    "maxProperties",
+}
+
+# Applicators which apply their subschemas to the document itself
+_IN_PLACE_APPLICATORS = {"allOf", "anyOf", "oneOf", "not", "if", "then", "else"}
+
+
+def _is_blind_to_components(schema: t.Any, is_root: bool = False) -> bool:
+    """
+    Checks whether a subschema applied to the document could depend on the content of the
+    components array.
+
+    This is a conservative check. The root schema may constrain the array through
+    ``properties.components``, which the caller checks separately. Any other subschema applied
+    to the document must not mention ``components`` in its ``properties``.
+
+    :param schema: The subschema.
+    :param is_root: Whether *schema* is the root schema.
+    :return: ``True`` if the verdict of *schema* is independent of the array's content.
+    """
+    if isinstance(schema, bool):
+        return True
+    if not isinstance(schema, dict):
+        return False
+
+    for keyword, value in schema.items():
+        if keyword in _KEYWORDS_BLIND_TO_COMPONENTS:
+            continue
+        if keyword in _IN_PLACE_APPLICATORS:
+            subschemas = value if isinstance(value, list) else [value]
+        elif keyword in ("dependencies", "dependentSchemas") and isinstance(value, dict):
+            # Property dependencies in draft-07 are lists of names, which are blind, too
+            subschemas = [sub for sub in value.values() if not isinstance(sub, list)]
+        elif keyword == "properties" and isinstance(value, dict):
+            if is_root or "components" not in value:
+                continue
+            return False
+        elif keyword == "additionalProperties" and is_root:
+            # Doesn't apply to the components because the caller requires them in properties
+            continue
+        else:
+            return False
+        if not all(_is_blind_to_components(sub) for sub in subschemas):
+            return False
+    return True
+
+
+def _validate_components(
+    v: jsonschema.protocols.Validator,
+    sbom: dict,
+    sbom_schema: dict,
+    baseline_records: ComponentRecords,
+    result: ValidationResult,
+    profile: t.Optional[profiling.ValidationProfile] = None,
+) -> ComponentRecords:
+    """
+    Validates an SBOM while keeping track of the results of each top-level component.
+
+    Components with a reusable result in *baseline_records* aren't validated again. Instead,
+    the document is validated with only the remaining components in place and the recorded
+    results are added for the others.
+
+    :param v: The validator.
+    :param sbom: The SBOM to validate.
+    :param sbom_schema: The schema of the validator.
+    :param baseline_records: The results recorded for the components of a baseline SBOM.
+    :param result: The result to which error and warning messages are added.
+    :param profile: The profile to record the time of the phases in, if any.
+    :return: The results of the components in *sbom*.
+    """
+    components: list = sbom["components"]
+    with profiling.phase(profile, "component fingerprinting"):
+        fingerprints = [hash_json(component) for component in components]
+
+    array_schema = sbom_schema.get("properties", {}).get("components")
+    if (
+        baseline_records
+        and isinstance(array_schema, dict)
+        and array_schema.keys() <= _INCREMENTAL_ARRAY_KEYWORDS
+        # Otherwise, other subschemas could constrain the array as a whole
+        and _is_blind_to_components(sbom_schema, is_root=True)
+    ):
+        changed = [i for i, fp in enumerate(fingerprints) if baseline_records.get(fp) is None]
+    else:
+        changed = list(range(len(components)))
+
+    with profiling.phase(profile, "validation"):
+        validation_errors: list[jsonschema.exceptions.ValidationError]
+        if len(changed) < len(components):
+            logger.debug(
+                "Validating %d of %d components which changed since the baseline",
+                len(changed),
+                len(components),
+            )
+            skeleton = dict(sbom)
+            skeleton["components"] = [components[i] for i in changed]
+            validation_errors = []
+            for error in v.iter_errors(skeleton):
+                if list(error.path) == ["components"]:
+                    # Keywords on the array itself must see all components. See below.
+                    continue
+                if len(error.path) > 1 and error.path[0] == "components":
+                    # Translate positions in the skeleton to positions in the actual SBOM
+                    error.path[1] = changed[t.cast(int, error.path[1])]
+                validation_errors.append(error)
+
+            array_keywords = {
+                keyword: value
+                for keyword, value in t.cast(dict, array_schema).items()
+                if keyword not in ("$id", "items")
+            }
+            # descend() is implemented by all validator classes but missing from their protocol
+            validation_errors.extend(
+                t.cast(t.Any, v).descend(components, array_keywords, path="components")
+            )
+        else:
+            validation_errors = list(v.iter_errors(sbom))
+
+    with profiling.phase(profile, "error post-processing"):
+        component_results = {i: ValidationResult() for i in changed}
+        for error in sorted(validation_errors, key=str):
+            error_result = ValidationResult()
+            _format_errors(sbom, [error], error_result)
+            result.errors.extend(error_result.errors)
+            result.warnings.extend(error_result.warnings)
+
+            path = error.absolute_path
+            if len(path) > 1 and path[0] == "components" and path[1] in component_results:
+                component_results[path[1]].errors.extend(error_result.errors)
+                component_results[path[1]].warnings.extend(error_result.warnings)
+
+    records: ComponentRecords = {}
+    for i, fp in enumerate(fingerprints):
+        if i not in component_results:
+            record = t.cast(dict[str, list[str]], baseline_records[fp])
+            result.errors.extend(record["errors"])
+            result.warnings.extend(record["warnings"])
+            records[fp] = record
+            continue
+
+        component_result = component_results[i]
+        # Messages about components without a bom-ref or name refer to them by position.
+        # Such results cannot be transferred to the same component at another position.
+        position = f"components[{i}]"
+        if any(position in msg for msg in component_result.errors + component_result.warnings):
+            records[fp] = None
+        else:
+            records[fp] = asdict(component_result)
+
+    return records
+
+
+def _create_registry() -> Registry[Schema]:
+    schema_spdx = Resource.from_contents(
+        contents=load_spdx_schema(), default_specification=DRAFT202012
+    )
+    registry: Registry[Schema] = Registry().with_resource(
+        uri="spdx.schema.json", resource=schema_spdx
+    )
+    for helper_schema_name in ("jsf-0.82.schema.json", "cryptography-defs.schema.json"):
+        try:
+            helper_schema = load_bundled_schema(helper_schema_name)
+            helper_resource = Resource.from_contents(
+                contents=helper_schema, default_specification=DRAFT202012
+            )
+            registry = registry.with_resource(uri=helper_schema_name, resource=helper_resource)
+        except Exception:
+            # Helper schema absent – skip; validation will still work unless the
+            # BOM itself exercises the missing reference.
+            logger.debug(
+                "Bundled helper schema '%s' could not be loaded; skipping.",
+                helper_schema_name,
+                exc_info=True,
+            )
+    # Resolve all resources up front. An uncrawled registry is crawled again on every lookup
+    # of a $ref into one of the helper schemas.
+    return registry.crawl()
+
+
+def _check_schema(
+    validator_cls: type[jsonschema.protocols.Validator],
+    sbom_schema: dict,
+    schema_path: Path,
+    cache: t.Optional[JsonCache],
+) -> None:
+    """
+    Checks a schema file against the metaschema of its dialect.
+
+    Schemas which passed the check are remembered in the cache by the hash of the file and the
+    validator class, so the check is skipped for them on later runs.
+
+    :raise AppError: If the schema is invalid.
+    """
+    key: t.Optional[str] = None
+    if cache is not None:
+        with contextlib.suppress(OSError):
+            key = hash_json(
+                {
+                    "check": "metaschema",
+                    "tool": pkg.VERSION,
+                    "jsonschema": importlib.metadata.version("jsonschema"),
+                    "validator": f"{validator_cls.__module__}.{validator_cls.__qualname__}",
+                    "schema": hash_file(schema_path),
+                }
+            )
+    if cache is not None and key is not None and cache.get(key) is True:
+        logger.debug("Skipping the check of known-good schema %s", schema_path)
+        return
+
+    try:
+        validator_cls.check_schema(sbom_schema)
+    except jsonschema.exceptions.SchemaError as exc:
+        raise AppError(
+            "Schema not loaded",
+            "Invalid JSON Schema in schema file " + str(schema_path),
+        ) from exc
+
+    if cache is not None and key is not None:
+        cache.put(key, True)
+
+
+def _create_validator(
+    sbom_schema: dict,
+    schema_path: t.Optional[Path],
+    profile: t.Optional[profiling.ValidationProfile] = None,
+    create_registry: t.Optional[t.Callable[[], Registry[Schema]]] = None,
+    cache: t.Optional[JsonCache] = None,
+) -> jsonschema.protocols.Validator:
+    validator_cls: type[jsonschema.Validator] = jsonschema.validators.validator_for(sbom_schema)
+    if schema_path is not None:
+        # Built-in schemas are assumed to be tested during development. A runtime check on
+        # every run of the validate command would be excessive.
+        with profiling.phase(profile, "schema check"):
+            _check_schema(validator_cls, sbom_schema, schema_path, cache)
+
+    with profiling.phase(profile, "registry construction"):
+        registry = (create_registry or _create_registry)()
+
+    with profiling.phase(profile, "validator construction"):
+        # Only set up checkers for the formats used somewhere in the schemas
+        formats = keywords.used_formats(
+            [sbom_schema, *(registry.contents(uri) for uri in registry)]
+        )
+        if profile is not None:
+            profile.add_schema(sbom_schema.get("$id", ""), sbom_schema)
+            for uri in registry:
+                profile.add_schema(uri, registry.contents(uri))
+        return keywords.extend(
+            validator_cls, wrap=profile.wrap_keyword if profile is not None else None
+        )(
+            schema=sbom_schema,
+            registry=registry,
+            format_checker=keywords.CachingFormatChecker(formats),
+        )
+
+
+def _format_errors(  # noqa: C901
+    sbom: dict,
+    validation_errors: t.Iterable[jsonschema.exceptions.ValidationError],
+    result: ValidationResult,
+) -> None:
+    """
+    Translates the errors reported by jsonschema into messages and adds them to *result*.
+
+    :param sbom: The validated SBOM.
+    :param validation_errors: The errors found in the SBOM.
+    :param result: The result to which error and warning messages are added.
+    """
+    errors = result.errors
+    for error in validation_errors:
+        try:
+            if error.validator == "required" and error.validator_value == [
+                "this_is_an_externally_described_component"
+            ]:
+                # This requirement in the schema allows us to produce warnings.
+                comp = t.cast(dict, error.instance)
+                if "bom-ref" in comp:
+                    comp_id = f"Component [bom-ref: {comp['bom-ref']}]"
+                elif "name" in comp:
+                    comp_id = f"Component [name: {comp['name']}]"
+                else:
+                    comp_id = f"Unidentified component at {error.json_path}"
+
+                result.warnings.append(
+                    comp_id + " is described by an external BOM. "
+                    "The validity of the referenced BOM cannot be checked."
+                )
+                continue
+            elif len(error.absolute_path) > 3:
+                error_path = (
+                    sbom[error.absolute_path[0]][error.absolute_path[1]].get(
+                        "bom-ref",
+                        sbom[error.absolute_path[0]][error.absolute_path[1]].get(
+                            "name", error.json_path
+                        ),
+                    )
+                    + " the field "
+                    + error.absolute_path[2]
+                    + "["
+                    + str(error.absolute_path[3])
+                    + "] has the mistake: "
+                )
+            elif len(error.absolute_path) >= 2:
+                error_path = (
+                    sbom[error.absolute_path[0]][error.absolute_path[1]].get(
+                        "bom-ref",
+                        sbom[error.absolute_path[0]][error.absolute_path[1]].get(
+                            "name", error.json_path
+                        ),
+                    )
+                    + " has the mistake: "
+                )
+            elif len(error.absolute_path) == 1:
+                if "$schema" == error.absolute_path[0]:
+                    # skip error that schema is wrong as probably another scheme is in use
+                    continue
+                else:
+                    error_path = f"{error.absolute_path[0]} has the mistake: "
+            else:
+                error_path = "SBOM has the mistake: "
+        except AttributeError:
+            error_path = error.json_path + " has the mistake: "
+        if error.context is not None and len(error.context) > 0:
+            if error.validator == "oneOf" and "licenses" in error.json_path:
+                # When licenseChoice (array oneOf) fails, the actual errors are nested in
+                # the context of the branch that was closest to passing. Walk the context
+                # tree to find the most relevant leaf errors to surface.
+                def collect_leaf_errors(
+                    err: jsonschema.exceptions.ValidationError,
+                ) -> list[jsonschema.exceptions.ValidationError]:
+                    if err.context:
+                        leaves = []
+                        for sub in err.context:
+                            leaves.extend(collect_leaf_errors(sub))
+                        return leaves
+                    return [err]
+
+                # Collect all leaf errors from all branches (deduplicated by message)
+                all_leaves: list[jsonschema.exceptions.ValidationError] = []
+                seen_messages: set[str] = set()
+                for ctx_error in error.context:
+                    for leaf in collect_leaf_errors(ctx_error):
+                        if leaf.message not in seen_messages:
+                            seen_messages.add(leaf.message)
+                            all_leaves.append(leaf)
+
+                for leaf in all_leaves:
+                    if "license.id" in leaf.json_path and "is not one of" in leaf.message:
+                        errors.append(
+                            error_path
+                            + "used license ID "
+                            + leaf.args[0].split()[0]
+                            + " is not a valid SPDX ID. "
+                            "Please use either the field 'name' and 'text' or "
+                            "provide a valid ID."
+                        )
+                    elif "non-empty" in leaf.message:
+                        errors.append(
+                            f"{error_path}'{leaf.absolute_path[-1]}' should not be empty"
+                        )
+                    elif leaf.validator == "pattern":
+                        errors.append(error_path + leaf.message.replace("\\", ""))
+                    else:
+                        errors.append(error_path + leaf.message)
+            else:
+                error_message = ""
+                for i in range(len(error.context)):
+                    error_field = re.search(r"'\w+'|(is too short)", error.context[i].message)
+                    if (error_field is None) or (error_field.group(0) == "is too short"):
+                        validation_field = "'" + error.context[i].json_path.split(".")[-1] + "'"
+                    else:
+                        validation_field = error_field.group(0)
+                    if i < (len(error.context) - 1):
+                        if error_message == "":
+                            error_message += validation_field
+                        else:
+                            error_message += ", " + validation_field
+                    else:
+                        error_message += " or " + validation_field
+                error_message += " is a required property"
+                errors.append(error_path + error_message)
+        else:
+            if ("license.id" in error.json_path) and ("is not one of" in error.message):
+                # if mistake is a wrong SPDX ID omit printing every single option
+                errors.append(
+                    error_path
+                    + "used license ID "
+                    + error.args[0].split()[0]
+                    + " is not a valid SPDX ID. "
+                    "Please use either the field 'name' or provide a valid ID."
+                )
+            elif ("dependsOn" in error.json_path) and ("has non-unique elements" in error.message):
+                dependencies = sbom.get("dependencies", {})
+                index_dependencies = re.search(r"\[\d\]", error_path)
+                if index_dependencies is not None:
+                    index_ref = index_dependencies.group(0).strip("[]")
+                    errors.append(
+                        dependencies[int(index_ref)]["ref"]
+                        + " has the mistake: the dependencies in dependsOn are non-unique"
+                    )
+                else:
+                    errors.append(
+                        "SBOM has the mistake: Could not find reference for dependencies"
+                    )
+            elif "non-empty" in error.message:
+                errors.append(f"{error_path}'{error.absolute_path[-1]}' should not be empty")
+            elif error.validator == "pattern":
+                errors.append(error_path + error.message.replace("\\", ""))
+            else:
+                errors.append(error_path + error.message)
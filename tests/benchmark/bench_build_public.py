@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Microbenchmark for clearing the components of a large SBOM in build-public.
+
+Internal properties and matching external references are removed from 100,000 components, half
+of them nested. The benchmark compares :py:class:`cdxev.build_public_bom.ComponentCleaner`,
+which compiles the regex once and walks the components without building intermediate lists,
+with matching uncompiled patterns and flattening the nested components of each component.
+
+Usage::
+
+    python tests/benchmark/bench_build_public.py [--components 100000] [--repeat 3]
+"""
+
+import argparse
+import copy
+import re
+import time
+import typing as t
+
+from cdxev.auxiliary.sbom_functions import extract_components
+from cdxev.build_public_bom import ComponentCleaner
+
+CHILDREN_PER_COMPONENT = 1
+
+EXT_REF_REGEX = r"https://(internal|intranet)\.acme\.com/"
+
+
+def build_components(component_count: int) -> list[dict]:
+    def component(i: int) -> dict:
+        return {
+            "type": "library",
+            "name": f"component-{i}",
+            "version": "1.0.0",
+            "properties": [
+                {"name": "acme:build", "value": str(i)},
+                {"name": "acme:team", "value": "platform"},
+                {"name": "Internal:owner", "value": "someone"},
+            ],
+            "externalReferences": [
+                {"type": "website", "url": f"https://example.com/component-{i}"},
+                {"type": "vcs", "url": f"https://github.com/acme/component-{i}"},
+                {"type": "issue-tracker", "url": f"https://internal.acme.com/issues/{i}"},
+            ],
+        }
+
+    components = []
+    for i in range(0, component_count, CHILDREN_PER_COMPONENT + 1):
+        parent = component(i)
+        parent["components"] = [component(i + j + 1) for j in range(CHILDREN_PER_COMPONENT)]
+        components.append(parent)
+    return components
+
+
+def uncompiled_clear(components: list[dict]) -> None:
+    """The clearing as it was before the patterns were compiled."""
+
+    def clear(component: dict) -> None:
+        new_properties = [
+            entry
+            for entry in component.get("properties", [])
+            if not re.search("^internal:", entry.get("name").lower())
+        ]
+        if new_properties != []:
+            component["properties"] = new_properties
+        else:
+            component.pop("properties", None)
+        new_references = [
+            ref
+            for ref in component.get("externalReferences", [])
+            if not re.match(EXT_REF_REGEX, ref["url"])
+        ]
+        if new_references != []:
+            component["externalReferences"] = new_references
+        else:
+            component.pop("externalReferences", None)
+
+    for component in components:
+        clear(component)
+        for sub_component in extract_components(component.get("components", [])):
+            clear(sub_component)
+
+
+def compiled_clear(components: list[dict]) -> None:
+    cleaner = ComponentCleaner(EXT_REF_REGEX)
+    for component in components:
+        cleaner.clear(component)
+
+
+def measure(clear: t.Callable[[list[dict]], None], components: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        copied = copy.deepcopy(components)
+        start = time.perf_counter()
+        clear(copied)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    components = build_components(args.components)
+
+    expected = copy.deepcopy(components)
+    uncompiled_clear(expected)
+    actual = copy.deepcopy(components)
+    compiled_clear(actual)
+    if actual != expected:
+        raise SystemExit("The cleared components differ")
+
+    print(f"{args.components} components")
+    compiled_time = measure(compiled_clear, components, args.repeat)
+    print(f"compiled filters:   {compiled_time:8.3f} s")
+    uncompiled_time = measure(uncompiled_clear, components, args.repeat)
+    print(f"uncompiled filters: {uncompiled_time:8.3f} s ({uncompiled_time / compiled_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
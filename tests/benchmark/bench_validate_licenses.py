@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Microbenchmark for validating a license-heavy SBOM.
+
+Every ``licenses[].license.id`` is checked against the enum of all SPDX license IDs and the
+``components`` array is subject to ``uniqueItems``. The benchmark compares the validator used by
+the ``validate`` command with a validator using the reference keyword implementations of
+jsonschema.
+
+Usage::
+
+    python tests/benchmark/bench_validate_licenses.py [--licenses 20000] [--repeat 3]
+"""
+
+import argparse
+import time
+import typing as t
+
+import jsonschema
+
+from cdxev.validator import validate
+from cdxev.validator.helper import load_spdx_schema, open_schema
+
+LICENSES_PER_COMPONENT = 10
+
+
+def build_sbom(license_count: int) -> dict:
+    license_ids = load_spdx_schema()["enum"]
+    components = []
+    for i in range(license_count // LICENSES_PER_COMPONENT):
+        licenses = [
+            {"license": {"id": license_ids[(i + j) % len(license_ids)]}}
+            for j in range(LICENSES_PER_COMPONENT)
+        ]
+        components.append(
+            {
+                "type": "library",
+                "bom-ref": f"component-{i}",
+                "name": f"component-{i}",
+                "version": "1.0.0",
+                "licenses": licenses,
+            }
+        )
+    return {
+        "bomFormat": "CycloneDX",
+        "specVersion": "1.6",
+        "version": 1,
+        "metadata": {"timestamp": "2024-01-01T00:00:00Z"},
+        "components": components,
+    }
+
+
+def measure(validator: t.Any, sbom: dict, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        errors = list(validator.iter_errors(sbom))
+        best = min(best, time.perf_counter() - start)
+    assert not errors, errors[0].message  # noqa: S101
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--licenses", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sbom = build_sbom(args.licenses)
+    schema = open_schema("1.6", "default", None)
+
+    fast = validate._create_validator(schema, None)
+    reference_cls = jsonschema.validators.validator_for(schema)
+    reference = reference_cls(
+        schema=schema,
+        registry=validate._create_registry(),
+        format_checker=jsonschema.FormatChecker(),
+    )
+
+    print(f"{len(sbom['components'])} components, {args.licenses} licenses")
+    fast_time = measure(fast, sbom, args.repeat)
+    print(f"cdx-ev keywords:    {fast_time:8.3f} s")
+    reference_time = measure(reference, sbom, args.repeat)
+    print(f"reference keywords: {reference_time:8.3f} s ({reference_time / fast_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
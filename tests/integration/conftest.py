@@ -27,6 +27,14 @@ def _data_dir():
     return Path(__file__).parent / "data"
 
 
+@pytest.fixture(autouse=True)
+def cache_home(monkeypatch, tmp_path):
+    """Keeps persistent caches written by the commands out of the user's home directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 @pytest.fixture
 def argv(monkeypatch):
     """
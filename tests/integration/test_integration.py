@@ -191,6 +191,38 @@ class TestAmend:
         expected = load_sbom(data_dir / "amend.expected_add-license-text.cdx.json")
         assert expected == actual
 
+    def test_add_artifact_hashes(
+        self,
+        tmp_path: Path,
+        argv: Callable[..., None],
+        capsys: pytest.CaptureFixture[str],
+    ):
+        (tmp_path / "dist").mkdir()
+        (tmp_path / "dist" / "mylib-1.2.0.tar.gz").write_bytes(b"mylib")
+        sbom = {
+            "bomFormat": "CycloneDX",
+            "specVersion": "1.6",
+            "version": 1,
+            "components": [{"type": "library", "name": "mylib", "version": "1.2.0"}],
+        }
+        (tmp_path / "bom.json").write_text(json.dumps(sbom))
+        argv(
+            "amend",
+            "--operation",
+            "add-artifact-hashes",
+            "--artifact-dir",
+            str(tmp_path / "dist"),
+            "--hash-algorithms",
+            "SHA-256,BLAKE2b-512",
+            "--hash-cache",
+            str(tmp_path / "cache"),
+            str(tmp_path / "bom.json"),
+        )
+        exit_code, actual, _ = run_main(capsys, "json")
+
+        assert exit_code == Status.OK
+        assert [h["alg"] for h in actual["components"][0]["hashes"]] == ["SHA-256", "BLAKE2b-512"]
+
     def test_missing_operation_arg(
         self, argv: Callable[..., None], capsys: pytest.CaptureFixture[str]
     ):
@@ -267,6 +299,94 @@ class TestBuildPublic:
         # Verify that output matches what is expected
         assert actual == data["expected"]
 
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_many_inputs(
+        self,
+        jobs: str,
+        data: DataFixture,
+        argv: Callable[..., None],
+        capsys: pytest.CaptureFixture[str],
+        tmp_path: Path,
+    ):
+        folder = tmp_path / "input"
+        folder.mkdir()
+        for name in ("a.cdx.json", "b.cdx.json"):
+            (folder / name).write_bytes(data["input"].read_bytes())
+        other_input = tmp_path / "c.cdx.json"
+        other_input.write_bytes(data["input"].read_bytes())
+        output = tmp_path / "output"
+
+        argv(
+            "build-public",
+            "--jobs",
+            jobs,
+            "--schema-path",
+            str(data["schema"]),
+            "--ext-ref-regex",
+            r"https://acme\.com|https://internal\.festo\.com",
+            "--from-folder",
+            str(folder),
+            "--output",
+            str(output),
+            str(other_input),
+        )
+        exit_code, _, err = run_main(capsys)
+
+        assert exit_code == Status.OK
+        assert sorted(p.name for p in output.iterdir()) == [
+            "a.cdx.json",
+            "b.cdx.json",
+            "c.cdx.json",
+        ]
+        for path in output.iterdir():
+            assert load_sbom(path) == data["expected"]
+        for input in (folder / "a.cdx.json", folder / "b.cdx.json", other_input):
+            assert f"Public SBOM written (component: {input})" in err
+
+    def test_many_inputs_with_invalid_input(
+        self,
+        data: DataFixture,
+        argv: Callable[..., None],
+        capsys: pytest.CaptureFixture[str],
+        tmp_path: Path,
+    ):
+        invalid_input = tmp_path / "invalid.cdx.json"
+        invalid_input.write_text("not json")
+        output = tmp_path / "output"
+
+        argv(
+            "build-public",
+            "--schema-path",
+            str(data["schema"]),
+            "--output",
+            str(output),
+            str(invalid_input),
+            str(data["input"]),
+        )
+        exit_code, _, err = run_main(capsys)
+
+        assert exit_code != Status.OK
+        assert [p.name for p in output.iterdir()] == [data["input"].name]
+        assert str(invalid_input) in err
+
+    def test_many_inputs_require_output_directory(
+        self,
+        data: DataFixture,
+        argv: Callable[..., None],
+        tmp_path: Path,
+    ):
+        argv(
+            "build-public",
+            "--output",
+            str(data["input"]),
+            str(data["input"]),
+            str(tmp_path / "other.cdx.json"),
+        )
+        with pytest.raises(SystemExit) as e:
+            run_main()
+
+        assert e.value.code == Status.USAGE_ERROR
+
 
 class TestInitSbom:
     class DataFixture(TypedDict):
@@ -757,6 +877,95 @@ class TestSet:
         # Verify that output matches what is expected
         assert actual == data["expected"]
 
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_many_inputs(
+        self,
+        jobs: str,
+        data: DataFixture,
+        argv: Callable[..., None],
+        capsys: pytest.CaptureFixture[str],
+        tmp_path: Path,
+    ):
+        folder = tmp_path / "input"
+        folder.mkdir()
+        for name in ("a.cdx.json", "b.cdx.json", "bom.json"):
+            (folder / name).write_bytes(data["input"].read_bytes())
+        other_input = tmp_path / "c.cdx.json"
+        other_input.write_bytes(data["input"].read_bytes())
+        output = tmp_path / "output"
+
+        argv(
+            "set",
+            "--force",
+            "--jobs",
+            jobs,
+            "--from-file",
+            str(data["set_file"]),
+            "--from-folder",
+            str(folder),
+            "--output",
+            str(output),
+            str(other_input),
+        )
+        exit_code, _, _ = run_main(capsys)
+
+        assert exit_code == Status.OK
+        assert sorted(p.name for p in output.iterdir()) == [
+            "a.cdx.json",
+            "b.cdx.json",
+            "bom.json",
+            "c.cdx.json",
+        ]
+        for path in output.iterdir():
+            actual = load_sbom(path)
+            target_component = search_entry(actual, "purl", "pkg:npm/test-app@1.0.0")
+            assert target_component is not None
+            assert target_component["copyright"] == "2022 Acme Inc"
+
+    def test_many_inputs_require_output_directory(
+        self,
+        data: DataFixture,
+        argv: Callable[..., None],
+        tmp_path: Path,
+    ):
+        argv(
+            "set",
+            "--from-file",
+            str(data["set_file"]),
+            "--output",
+            str(data["input"]),
+            str(data["input"]),
+            str(tmp_path / "other.cdx.json"),
+        )
+        with pytest.raises(SystemExit) as e:
+            run_main()
+
+        assert e.value.code == Status.USAGE_ERROR
+
+    def test_plan_only(
+        self,
+        data: DataFixture,
+        argv: Callable[..., None],
+        capsys: pytest.CaptureFixture[str],
+        tmp_path: Path,
+    ):
+        output = tmp_path / "output.cdx.json"
+        argv(
+            "set",
+            "--plan-only",
+            "--output",
+            str(output),
+            "--from-file",
+            str(data["set_file"]),
+            str(data["input"]),
+        )
+        exit_code, stdout, _ = run_main(capsys)
+
+        assert exit_code == Status.OK
+        assert "PURL[pkg:npm/test-app@1.0.0]" in stdout
+        assert "Target resolution:" in stdout
+        assert not output.exists()
+
     @pytest.mark.parametrize(
         "use_only",
         [
@@ -1161,6 +1370,37 @@ class TestValidate:
         assert len(report) == 1
         assert "check_name" in report[0]
 
+    def test_report_max_issues(
+        self,
+        argv: Callable[..., None],
+        data_dir: Path,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        report_path = tmp_path / "issues.json"
+        sbom = str(data_dir / "validate" / "invalid" / "default" / "laravel_1.4.cdx.json")
+        argv(
+            "validate",
+            "--report-format",
+            "gitlab-code-quality",
+            "--report-path",
+            str(report_path),
+            "--report-max-issues",
+            "0",
+            sbom,
+        )
+        exit_code, stdout, _ = run_main(capsys)
+
+        assert exit_code == Status.VALIDATION_ERROR
+        assert "1 more were omitted" in stdout
+        with open(report_path, encoding="utf_8_sig") as f:
+            assert json.load(f) == []
+
+        argv("validate", "--report-max-issues", "1", sbom)
+        with pytest.raises(SystemExit) as e:
+            run_main()
+        assert e.value.code == Status.USAGE_ERROR
+
     def test_custom_filename_pattern(
         self,
         argv: Callable[..., None],
@@ -1193,6 +1433,31 @@ class TestValidate:
         assert exit_code == Status.OK
         assert "filename doesn't match regular expression ^(bom\\.json|.+\\.cdx\\.json)$" in stdout
 
+    @pytest.mark.parametrize(
+        "schema_types", [["custom"], ["default", "custom"], ["custom", "default"]]
+    )
+    def test_filename_is_validated_for_each_schema_type(
+        self,
+        schema_types: list[str],
+        argv: Callable[..., None],
+        data_dir: Path,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        # Valid against the custom schema, except for its filename
+        valid_sbom = next((data_dir / "validate" / "valid" / "custom").glob("*_1.6_*.cdx.json"))
+        sbom = tmp_path / "foo.cdx.json"
+        sbom.write_bytes(valid_sbom.read_bytes())
+
+        options = [
+            option for schema_type in schema_types for option in ("--schema-type", schema_type)
+        ]
+        argv("validate", "--no-cache", *options, str(sbom))
+        exit_code, stdout, _ = run_main(capsys)
+
+        assert exit_code == Status.VALIDATION_ERROR
+        assert "filename doesn't match regular expression bom\\.json|Acme_Application_" in stdout
+
     def test_custom_schema(
         self,
         argv: Callable[..., None],
@@ -1229,25 +1494,107 @@ class TestValidate:
             "Invalid JSON Schema in schema file"
         )
 
-    def test_invalid_option_combinations(self, argv: Callable[..., None]):
-        argv(
-            "validate",
-            "--filename-pattern",
-            "test",
-            "--no-filename-validation",
-            "foo.cdx.json",
-        )
+    def test_cache(self, argv: Callable[..., None], data_dir: Path, cache_home: Path):
+        sbom = str(data_dir / "validate" / "invalid" / "default" / "laravel_1.4.cdx.json")
+
+        argv("validate", "--no-cache", sbom)
+        exit_code, *_ = run_main()
+        assert exit_code == Status.VALIDATION_ERROR
+        assert not (cache_home / "cdx-ev").exists()
+
+        for _ in range(2):
+            argv("validate", sbom)
+            exit_code, *_ = run_main()
+            assert exit_code == Status.VALIDATION_ERROR
+        # One entry for the result, one for the results of the individual components
+        assert len(list((cache_home / "cdx-ev" / "validate").iterdir())) == 2
+
+    def test_baseline(
+        self,
+        argv: Callable[..., None],
+        data_dir: Path,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        baseline = data_dir / "validate" / "invalid" / "default" / "laravel_1.4.cdx.json"
+        argv("validate", str(baseline))
+        exit_code, expected, _ = run_main(capsys)
+        assert exit_code == Status.VALIDATION_ERROR
+
+        with baseline.open(encoding="utf_8_sig") as f:
+            sbom = json.load(f)
+        sbom["components"][0]["description"] = "changed"
+        changed = tmp_path / "changed.cdx.json"
+        changed.write_text(json.dumps(sbom), encoding="utf_8")
+
+        argv("validate", "--baseline", str(baseline), str(changed))
+        exit_code, actual, _ = run_main(capsys)
+        assert exit_code == Status.VALIDATION_ERROR
+        # Compare distinct lines, since every invocation of main adds another log handler
+        assert set(actual.splitlines()) == set(expected.splitlines())
+
+        argv("validate", "--no-cache", "--baseline", str(baseline), str(changed))
         with pytest.raises(SystemExit) as e:
             run_main()
-
         assert e.value.code == Status.USAGE_ERROR
 
+    def test_multiple_schemas(
+        self,
+        argv: Callable[..., None],
+        data_dir: Path,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        sbom = str(data_dir / "validate" / "invalid" / "default" / "laravel_1.4.cdx.json")
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(
+            json.dumps({"required": ["serialNumber", "does-not-exist"]}), encoding="utf_8"
+        )
+
+        argv("validate", "--schema-type", "default", "--schema-path", str(schema_path), sbom)
+        exit_code, stdout, _ = run_main(capsys)
+
+        assert exit_code == Status.VALIDATION_ERROR
+        assert f"[{schema_path}] 'does-not-exist' is a required property" in stdout
+        assert "[default] " in stdout
+
+    def test_profile(
+        self,
+        argv: Callable[..., None],
+        data_dir: Path,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        sbom = str(data_dir / "validate" / "invalid" / "default" / "laravel_1.4.cdx.json")
+
+        argv("validate", "--no-cache", "--profile", "--profile-top", "3", sbom)
+        exit_code, _, stderr = run_main(capsys)
+        assert exit_code == Status.VALIDATION_ERROR
+        assert "validation" in stderr
+        assert "Top 3 keywords" in stderr
+
+        profile_path = tmp_path / "profile.json"
+        argv("validate", "--no-cache", "--profile-path", str(profile_path), sbom)
+        exit_code, *_ = run_main()
+        assert exit_code == Status.VALIDATION_ERROR
+        with profile_path.open(encoding="utf_8") as f:
+            profile = json.load(f)
+        assert "validation" in [phase["phase"] for phase in profile["phases"]]
+        assert len(profile["keywords"]) == 10
+        assert profile["locations"][0]["location"].endswith("#/properties")
+
+        for top in ("0", "-3"):
+            argv("validate", "--no-cache", "--profile", "--profile-top", top, sbom)
+            with pytest.raises(SystemExit) as e:
+                run_main()
+            assert e.value.code == Status.USAGE_ERROR
+
+    def test_invalid_option_combinations(self, argv: Callable[..., None]):
         argv(
             "validate",
-            "--schema-type",
-            "default",
-            "--schema-path",
-            "myschema.json",
+            "--filename-pattern",
+            "test",
+            "--no-filename-validation",
             "foo.cdx.json",
         )
         with pytest.raises(SystemExit) as e:
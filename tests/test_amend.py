@@ -1,13 +1,22 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import copy
+import hashlib
 import json
+import logging
+import os
+import tempfile
 import typing as t
 import unittest
+import unittest.mock
 from pathlib import Path
 
+from cdxev.amend import artifacts, command, operations
+from cdxev.amend.command import get_all_operations
 from cdxev.amend.command import run as run_amend
+from cdxev.amend.license import LicenseNameIndex, license_name_index, normalize_license_name
 from cdxev.amend.operations import (
+    AddArtifactHashes,
     AddBomRef,
     AddLicenseText,
     Compositions,
@@ -17,6 +26,7 @@ from cdxev.amend.operations import (
     LicenseNameToId,
     Operation,
 )
+from cdxev.auxiliary.sbom_functions import walk_components
 from cdxev.error import AppError
 
 path_to_folder_with_test_sboms = "tests/auxiliary/test_amend_sboms/"
@@ -299,6 +309,51 @@ class LicenseNameToIdTestCase(AmendTestCase):
         self.sbom_fixture["components"][0]["licenses"] = [{}]
         self.operation.handle_component(self.sbom_fixture["components"][0])
 
+    def test_replace_name_variant_with_id(self) -> None:
+        component = {
+            "licenses": [
+                {"license": {"name": "apache-license (v2)"}},
+                {"license": {"name": "  BSD 3 Clause "}},
+                {"license": {"name": "Eclipse Public License Version 2"}},
+            ]
+        }
+        self.operation.handle_component(component)
+        self.assertEqual(
+            [license["license"] for license in component["licenses"]],
+            [{"id": "Apache-2.0"}, {"id": "BSD-3-Clause"}, {"id": "EPL-2.0"}],
+        )
+
+
+class LicenseNameIndexTestCase(unittest.TestCase):
+    def test_normalize_license_name(self) -> None:
+        for name, expected in [
+            ("Apache License, Version 2.0", "apache license 2"),
+            ("Apache License (v2.0)", "apache license 2"),
+            ("APACHE   LICENSE 2", "apache license 2"),
+            ("GPL-2.0+", "gpl 2+"),
+            ("Some License 2.0.1", "some license 2.0.1"),
+            ("Some License 1.10", "some license 1.10"),
+            ("vim license", "vim license"),
+        ]:
+            with self.subTest(name=name):
+                self.assertEqual(normalize_license_name(name), expected)
+
+    def test_exact_name_takes_precedence(self) -> None:
+        index = LicenseNameIndex(
+            [{"exp": "A", "names": ["Foo License"]}, {"exp": "B", "names": ["foo-license"]}]
+        )
+        self.assertEqual(index.find_id("FOO LICENSE"), "A")
+        self.assertEqual(index.find_id("foo-license"), "B")
+
+    def test_ambiguous_variants_are_not_resolved(self) -> None:
+        index = LicenseNameIndex(
+            [{"exp": "A", "names": ["Foo License"]}, {"exp": "B", "names": ["foo-license"]}]
+        )
+        self.assertIsNone(index.find_id("Foo, License"))
+
+    def test_index_is_shared(self) -> None:
+        self.assertIs(license_name_index(), license_name_index())
+
 
 def flat_walk_components(operation: Operation, components: t.Sequence[dict[str, t.Any]]) -> None:
     """
@@ -405,6 +460,209 @@ class AddLicenseTextTestCase(AmendTestCase):
             operation.prepare(self.sbom_fixture)
 
 
+@unittest.mock.patch(
+    "cdxev.amend.operations.charset_normalizer.from_path",
+    wraps=operations.charset_normalizer.from_path,
+)
+class AddLicenseTextCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        operations._read_license_text.cache_clear()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.license_dir = Path(tmp.name)
+        (self.license_dir / "used.txt").write_text("Used license.", encoding="utf_8")
+        (self.license_dir / "unused.txt").write_text("Unused license.", encoding="utf_8")
+
+    def amend(self, component_count: int) -> list[dict]:
+        components = [
+            {"name": f"comp-{i}", "licenses": [{"license": {"name": "used"}}]}
+            for i in range(component_count)
+        ]
+        run_amend(
+            {"components": components},
+            [AddLicenseText],
+            {AddLicenseText: {"license_dir": self.license_dir}},
+        )
+        return components
+
+    def test_file_is_read_once(self, from_path: unittest.mock.Mock) -> None:
+        components = self.amend(3) + self.amend(3)
+
+        from_path.assert_called_once_with(self.license_dir / "used.txt")
+        for component in components:
+            self.assertEqual(
+                component["licenses"][0]["license"]["text"], {"content": "Used license."}
+            )
+
+    def test_modified_file_is_read_again(self, from_path: unittest.mock.Mock) -> None:
+        self.amend(1)
+        file = self.license_dir / "used.txt"
+        file.write_text("Changed license.", encoding="utf_8")
+        mtime_ns = file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(file, ns=(mtime_ns, mtime_ns))
+
+        components = self.amend(1)
+
+        self.assertEqual(from_path.call_count, 2)
+        self.assertEqual(
+            components[0]["licenses"][0]["license"]["text"], {"content": "Changed license."}
+        )
+
+
+class AddArtifactHashesTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.artifact_dir = Path(tmp.name) / "artifacts"
+        self.hash_cache = Path(tmp.name) / "cache"
+        (self.artifact_dir / "sub").mkdir(parents=True)
+        (self.artifact_dir / "foo-1.0.tar.gz").write_bytes(b"foo")
+        (self.artifact_dir / "sub" / "bar-2.jar").write_bytes(b"bar" * 1_000_000)
+        (self.artifact_dir / "empty-1").write_bytes(b"")
+
+    def amend(self, components: list[dict], **options: t.Any) -> None:
+        options.setdefault("hash_cache", str(self.hash_cache))
+        run_amend(
+            {"components": components},
+            [AddArtifactHashes],
+            {AddArtifactHashes: {"artifact_dir": self.artifact_dir, **options}},
+        )
+
+    def test_hashes_added(self) -> None:
+        components = [
+            {"name": "foo", "version": "1.0"},
+            {"name": "bar", "version": "2", "hashes": [{"alg": "MD5", "content": "x"}]},
+            {"name": "empty", "version": "1"},
+            {"name": "foo", "version": "1"},
+            {"name": "unversioned"},
+        ]
+
+        self.amend(components)
+
+        self.assertEqual(
+            [c.get("hashes") for c in components],
+            [
+                [{"alg": "SHA-256", "content": hashlib.sha256(b"foo").hexdigest()}],
+                [
+                    {"alg": "MD5", "content": "x"},
+                    {"alg": "SHA-256", "content": hashlib.sha256(b"bar" * 1_000_000).hexdigest()},
+                ],
+                [{"alg": "SHA-256", "content": hashlib.sha256(b"").hexdigest()}],
+                None,
+                None,
+            ],
+        )
+
+    def test_several_algorithms_replace_existing_hashes(self) -> None:
+        component = {
+            "name": "foo",
+            "version": "1.0",
+            "hashes": [{"alg": "SHA-512", "content": "x"}],
+        }
+
+        self.amend([component], hash_algorithms="SHA-512, BLAKE2b-256")
+
+        self.assertEqual(
+            component["hashes"],
+            [
+                {"alg": "SHA-512", "content": hashlib.sha512(b"foo").hexdigest()},
+                {
+                    "alg": "BLAKE2b-256",
+                    "content": hashlib.blake2b(b"foo", digest_size=32).hexdigest(),
+                },
+            ],
+        )
+
+    def test_artifact_name_from_purl(self) -> None:
+        component = {"name": "foo", "purl": "pkg:maven/org.acme/bar@2?type=jar"}
+
+        self.amend([component], artifact_name="{purl_name}-{purl_version}.jar")
+
+        self.assertEqual(len(component["hashes"]), 1)
+
+    def test_unchanged_artifacts_are_not_read_again(self) -> None:
+        self.amend([{"name": "foo", "version": "1.0"}])
+        file = self.artifact_dir / "foo-1.0.tar.gz"
+        mtime_ns = file.stat().st_mtime_ns
+
+        with unittest.mock.patch(
+            "cdxev.amend.artifacts.hash_file", wraps=artifacts.hash_file
+        ) as hash_file:
+            self.amend([{"name": "foo", "version": "1.0"}])
+            hash_file.assert_not_called()
+
+            file.write_bytes(b"changed")
+            os.utime(file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+            component = {"name": "foo", "version": "1.0"}
+            self.amend([component])
+
+        hash_file.assert_called_once()
+        self.assertEqual(component["hashes"][0]["content"], hashlib.sha256(b"changed").hexdigest())
+
+    def test_invalid_options_raise(self) -> None:
+        for options in [
+            {"hash_algorithms": "SHA-256,CRC32"},
+            {"hash_algorithms": ""},
+            {"artifact_name": "{name}-{revision}"},
+            {"artifact_name": "{name"},
+        ]:
+            with self.subTest(options=options), self.assertRaises(AppError):
+                AddArtifactHashes(self.artifact_dir, **options)
+
+    def test_invalid_artifact_dir_raises(self) -> None:
+        operation = AddArtifactHashes(self.artifact_dir / "missing")
+        with self.assertRaises(AppError):
+            operation.prepare({})
+
+
+class ArtifactsTestCase(unittest.TestCase):
+    def test_artifact_name_fields(self) -> None:
+        self.assertEqual(
+            artifacts.artifact_name_fields(
+                {
+                    "group": "org.acme",
+                    "name": "bar",
+                    "version": 2,
+                    "purl": "pkg:npm/%40acme/bar@2.0%2B1?x=y#sub/path",
+                }
+            ),
+            {
+                "group": "org.acme",
+                "name": "bar",
+                "purl_type": "npm",
+                "purl_namespace": "@acme",
+                "purl_name": "bar",
+                "purl_version": "2.0+1",
+            },
+        )
+
+    def test_artifact_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ["foo-1.0.tar.gz", "foo-1.0.zip", "bar-1.2.3", "baz"]:
+                Path(tmp, name).touch()
+            index = artifacts.ArtifactIndex(Path(tmp))
+
+            self.assertEqual(index.find("foo-1.0.tar"), Path(tmp, "foo-1.0.tar.gz"))
+            self.assertEqual(index.find("foo-1.0.zip"), Path(tmp, "foo-1.0.zip"))
+            self.assertIsNone(index.find("foo-1.0"))
+            self.assertIsNone(index.find("foo-1"))
+            self.assertEqual(index.find("bar-1.2.3"), Path(tmp, "bar-1.2.3"))
+            self.assertIsNone(index.find("bar-1.2"))
+            self.assertEqual(index.find("baz"), Path(tmp, "baz"))
+
+    def test_unreadable_artifacts_raise(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            missing = Path(tmp, "missing")
+
+            with self.assertRaises(AppError) as cm:
+                artifacts.hash_artifacts(Path(tmp), [missing], ["SHA-256"])
+            self.assertEqual(cm.exception.details.module_name, str(missing))
+
+            with self.assertRaises(AppError) as cm:
+                artifacts.hash_file(Path(tmp), ["SHA-256"])
+            self.assertEqual(cm.exception.details.module_name, tmp)
+
+
 class DeleteAmbiguousLicensesTestCase(AmendTestCase):
     def setUp(self):
         super().setUp()
@@ -487,5 +745,102 @@ class DeleteAmbiguousLicensesTestCase(AmendTestCase):
         self.assertDictEqual(self.component, expected)
 
 
+class ParallelAmendTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        with open(path_to_folder_with_test_sboms + "test.cdx.json", encoding="utf_8_sig") as file:
+            self.sbom_fixture = json.load(file)
+        self.sbom_fixture["components"][0]["licenses"] = [
+            {"license": {"name": "Apache License 2.0"}},
+            {"license": {"name": "Some license"}},
+        ]
+        self.sbom_fixture["components"][1]["publisher"] = "Some publisher"
+
+    def test_same_result_as_serial_run(self) -> None:
+        operations: list[type[Operation]] = [
+            InferSupplier,
+            Compositions,
+            LicenseNameToId,
+            DeleteAmbiguousLicenses,
+        ]
+        expected = copy.deepcopy(self.sbom_fixture)
+        run_amend(expected, operations)
+
+        run_amend(self.sbom_fixture, operations, jobs=2)
+
+        self.assertEqual(self.sbom_fixture, expected)
+        self.assertEqual(
+            self.sbom_fixture["components"][0]["licenses"], [{"license": {"id": "Apache-2.0"}}]
+        )
+
+    def test_messages_of_workers_are_logged(self) -> None:
+        with self.assertLogs("cdxev.amend", logging.INFO) as cm:
+            run_amend(self.sbom_fixture, [LicenseNameToId], jobs=2)
+
+        self.assertEqual(
+            [(record.levelno, record.msg.message) for record in cm.records],
+            [(logging.INFO, "License name replaced with id")],
+        )
+        self.assertIsNone(cm.records[0].msg.module_name)
+
+    def test_operation_order_is_preserved(self) -> None:
+        walk_components(self.sbom_fixture, lambda c: c.pop("bom-ref", None), skip_meta=True)
+
+        run_amend(self.sbom_fixture, [Compositions, AddBomRef], jobs=2)
+
+        # Compositions ran before AddBomRef, so it didn't see the new bom-refs.
+        self.assertEqual(self.sbom_fixture["compositions"][0]["assemblies"], [])
+        walk_components(self.sbom_fixture, lambda c: self.assertIn("bom-ref", c))
+
+    def test_component_local_operations(self) -> None:
+        self.assertEqual(
+            {op.__name__ for op in get_all_operations() if op.component_local},
+            {
+                "AddBomRef",
+                "InferSupplier",
+                "LicenseNameToId",
+                "DeleteAmbiguousLicenses",
+                "AddArtifactHashes",
+            },
+        )
+
+
+class DispatchTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        with open(path_to_folder_with_test_sboms + "test.cdx.json", encoding="utf_8_sig") as file:
+            self.sbom_fixture = json.load(file)
+
+    def test_only_overriding_operations_are_dispatched(self) -> None:
+        operations = [DefaultAuthor(), AddBomRef(), InferSupplier()]
+
+        handlers = command._handlers(operations, "handle_component")
+
+        self.assertEqual(
+            handlers, [operations[1].handle_component, operations[2].handle_component]
+        )
+        self.assertEqual(len(command._handlers(operations, "handle_metadata")), 3)
+
+    def test_no_walk_without_component_handlers(self) -> None:
+        with unittest.mock.patch("cdxev.amend.command.walk_components") as walk:
+            run_amend(self.sbom_fixture, [DefaultAuthor])
+
+        walk.assert_not_called()
+        self.assertIn("authors", self.sbom_fixture["metadata"])
+
+    def test_one_debug_record_per_component(self) -> None:
+        component_count = 0
+
+        def count(component: dict) -> None:
+            nonlocal component_count
+            component_count += 1
+
+        walk_components(self.sbom_fixture, count, skip_meta=True)
+
+        with self.assertLogs("cdxev.amend.command", "DEBUG") as logs:
+            run_amend(self.sbom_fixture, [AddBomRef, InferSupplier])
+
+        records = [r for r in logs.records if r.msg == "Processing component %s"]
+        self.assertEqual(len(records), component_count)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,10 +3,16 @@
 import copy
 import json
 import os
+import random
+import re
 import unittest
+import unittest.mock
 from pathlib import Path
 
+from jsonschema import Draft7Validator
+
 from cdxev import build_public_bom as b_p_b
+from cdxev.error import AppError
 
 path_to_sbom = (
     "tests/auxiliary/test_build_public_bom_sboms/Acme_Application_9.1.1_20220217T101458.cdx.json"
@@ -74,6 +80,64 @@ class TestCreateInternalValidator(unittest.TestCase):
         self.assertTrue(validator.is_valid(schema_internal))
 
 
+class TestInternalComponentPredicate(unittest.TestCase):
+    def test_documentation_schemas_ignore_nested_components(self) -> None:
+        for path in [
+            path_to_documentation_schema_1,
+            path_to_documentation_schema_2,
+            path_to_documentation_schema_3,
+            path_to_documentation_schema_4,
+            path_to_example_schema_2,
+        ]:
+            with self.subTest(schema=path.name):
+                validator = b_p_b.create_internal_validator(path)
+                self.assertTrue(
+                    b_p_b.InternalComponentPredicate(validator).ignores_nested_components
+                )
+
+    def test_schemas_which_can_depend_on_nested_components(self) -> None:
+        for schema in [
+            {"required": ["components"]},
+            {"not": {"properties": {"components": {"maxItems": 0}}}},
+            {"properties": {"group": {"const": "a"}}, "additionalProperties": {"type": "string"}},
+            {"anyOf": [{"minProperties": 5}]},
+            {"not": {"const": {"name": "a"}}},
+            {"$ref": "https://example.com/internal.json"},
+        ]:
+            with self.subTest(schema=schema):
+                predicate = b_p_b.InternalComponentPredicate(Draft7Validator(schema))
+                self.assertFalse(predicate.ignores_nested_components)
+
+    def test_outcome_is_memoized_without_nested_components(self) -> None:
+        validator = b_p_b.create_internal_validator(path_to_documentation_schema_1)
+        predicate = b_p_b.InternalComponentPredicate(validator)
+        internal = {"name": "a", "group": "com.acme.internal"}
+        component = {"name": "b", "components": [copy.deepcopy(internal)]}
+
+        predicate.validator = unittest.mock.Mock(wraps=validator)
+        is_valid = predicate.validator.is_valid
+
+        removed, public = b_p_b.remove_component_tagged_internal(component, predicate)
+        b_p_b.remove_component_tagged_internal(
+            {"name": "c", "components": [copy.deepcopy(internal)]}, predicate
+        )
+
+        self.assertEqual(is_valid.call_count, 3)
+        for call in is_valid.call_args_list:
+            self.assertNotIn("components", call.args[0])
+        self.assertEqual(removed, [""])
+        self.assertEqual(public, [{"name": "b"}])
+
+    def test_nested_components_are_validated_if_schema_depends_on_them(self) -> None:
+        validator = Draft7Validator({"required": ["components"]})
+        component = {"name": "a", "bom-ref": "a", "components": [{"name": "b", "bom-ref": "b"}]}
+
+        removed, public = b_p_b.remove_component_tagged_internal(component, validator)
+
+        self.assertEqual(removed, ["a"])
+        self.assertEqual(public, [{"name": "b", "bom-ref": "b"}])
+
+
 class TestMergeDependencyForRemovedComponent(unittest.TestCase):
     dependencies = [
         {"ref": "component 1", "dependsOn": ["Component 2", "Component 3"]},
@@ -102,6 +166,234 @@ class TestMergeDependencyForRemovedComponent(unittest.TestCase):
         self.assertEqual(self.dependencies_without_component_2, resolved_dependencies)
 
 
+class TestContractDependencies(unittest.TestCase):
+    @staticmethod
+    def merge_one_by_one(removed_bom_refs: list[str], dependencies: list[dict]) -> list[dict]:
+        for bom_ref in removed_bom_refs:
+            dependencies = list(
+                b_p_b.merge_dependency_for_removed_component(bom_ref, dependencies)
+            )
+        return dependencies
+
+    def test_chain_of_removed_components(self) -> None:
+        dependencies = [
+            {"ref": "app", "dependsOn": ["a", "lib"]},
+            {"ref": "a", "dependsOn": ["b"]},
+            {"ref": "b", "dependsOn": ["c", "lib"]},
+            {"ref": "c", "dependsOn": ["d"]},
+            {"ref": "d"},
+            {"ref": "lib"},
+        ]
+
+        self.assertEqual(
+            b_p_b.contract_dependencies(["c", "a", "b"], dependencies),
+            [
+                {"ref": "app", "dependsOn": ["lib", "d"]},
+                {"ref": "d"},
+                {"ref": "lib"},
+            ],
+        )
+
+    def test_same_result_as_merging_one_by_one(self) -> None:
+        rng = random.Random(4711)  # noqa: S311
+        for _ in range(300):
+            refs = [f"c{i}" for i in range(rng.randint(1, 12))] + [""]
+            dependencies = [
+                {
+                    "ref": rng.choice(refs),
+                    "dependsOn": [rng.choice(refs) for _ in range(rng.randint(0, 5))],
+                }
+                for _ in range(rng.randint(0, 15))
+            ]
+            for entry in rng.sample(dependencies, len(dependencies) // 4):
+                del entry["dependsOn"]
+            removed = [rng.choice(refs) for _ in range(rng.randint(0, 8))]
+
+            with self.subTest(dependencies=dependencies, removed=removed):
+                expected = self.merge_one_by_one(removed, copy.deepcopy(dependencies))
+                actual = b_p_b.contract_dependencies(removed, copy.deepcopy(dependencies))
+                self.assertEqual(actual, expected)
+
+
+class TestRemoveRefsOfRemovedComponents(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = {
+            "components": [
+                {"name": "public", "bom-ref": "public"},
+                {"name": "secret", "bom-ref": "secret", "group": "com.acme.internal"},
+                {"name": "hidden", "bom-ref": "hidden", "group": "com.acme.internal"},
+            ],
+            "compositions": [
+                {
+                    "aggregate": "unknown",
+                    "assemblies": ["secret", "public", "hidden", "secret"],
+                    "dependencies": ["hidden"],
+                },
+                {"aggregate": "complete"},
+            ],
+            "vulnerabilities": [
+                {"id": "CVE-1", "affects": [{"ref": "secret"}, {"ref": "public"}]},
+                {"id": "CVE-2", "affects": [{"ref": "hidden"}, {"ref": "secret"}]},
+                {"id": "CVE-3"},
+            ],
+        }
+
+    def test_compositions_and_vulnerabilities(self) -> None:
+        public_sbom = b_p_b.build_public_bom(self.sbom, path_to_documentation_schema_1)
+
+        self.assertEqual(
+            public_sbom["compositions"],
+            [
+                {"aggregate": "unknown", "assemblies": ["public"], "dependencies": []},
+                {"aggregate": "complete"},
+            ],
+        )
+        self.assertEqual(
+            public_sbom["vulnerabilities"],
+            [{"id": "CVE-1", "affects": [{"ref": "public"}]}, {"id": "CVE-3"}],
+        )
+
+    def test_no_vulnerabilities_left(self) -> None:
+        self.sbom["vulnerabilities"] = [{"id": "CVE-2", "affects": [{"ref": "hidden"}]}]
+
+        public_sbom = b_p_b.build_public_bom(self.sbom, path_to_documentation_schema_1)
+
+        self.assertNotIn("vulnerabilities", public_sbom)
+
+
+class TestComponentCleaner(unittest.TestCase):
+    def test_property_prefix_is_case_insensitive(self) -> None:
+        component = {
+            "properties": [
+                {"name": "INTERNAL:stuff", "value": "gone"},
+                {"name": "Internal:stuff", "value": "gone"},
+                {"name": "internal", "value": "still there"},
+                {"name": "x-internal:stuff", "value": "still there"},
+            ]
+        }
+        b_p_b.ComponentCleaner().clear_properties(component)
+        self.assertEqual(
+            component,
+            {
+                "properties": [
+                    {"name": "internal", "value": "still there"},
+                    {"name": "x-internal:stuff", "value": "still there"},
+                ]
+            },
+        )
+
+    def test_lists_without_removals_are_kept(self) -> None:
+        properties = [{"name": "stuff", "value": "still there"}]
+        references = [{"type": "website", "url": "https://example.com"}]
+        component = {"properties": properties, "externalReferences": references}
+
+        b_p_b.ComponentCleaner(r"https://internal\.").clear(component)
+
+        self.assertIs(component["properties"], properties)
+        self.assertIs(component["externalReferences"], references)
+
+    def test_compiled_pattern(self) -> None:
+        pattern = re.compile(r"https://internal\.", re.IGNORECASE)
+        component = {
+            "externalReferences": [
+                {"type": "website", "url": "HTTPS://INTERNAL.acme.com"},
+                {"type": "website", "url": "https://example.com"},
+            ]
+        }
+        cleaner = b_p_b.ComponentCleaner(pattern)
+        self.assertIs(cleaner.ext_ref_pattern, pattern)
+
+        cleaner.clear_external_references(component)
+
+        self.assertEqual(
+            component, {"externalReferences": [{"type": "website", "url": "https://example.com"}]}
+        )
+
+    def test_deeply_nested_components(self) -> None:
+        component: dict = {"name": "root"}
+        innermost = component
+        for _ in range(5000):
+            nested = {"properties": [{"name": "internal:stuff", "value": "gone"}]}
+            innermost["components"] = [nested]
+            innermost = nested
+
+        b_p_b.ComponentCleaner().clear(component)
+
+        self.assertEqual(innermost, {})
+
+
+def read_json(path: Path) -> tuple[dict, str]:
+    return get_sbom(str(path)), "json"
+
+
+class TestRunMany(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = unittest.mock.patch.object(b_p_b, "write_sbom", self.write_sbom)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.written: dict[Path, dict] = {}
+        self.files = [
+            (Path(path_to_sbom), Path("public_1.cdx.json")),
+            (Path(path_to_docu_sbom_dic), Path("public_2.cdx.json")),
+        ]
+
+    def write_sbom(self, sbom: dict, output: Path) -> None:
+        self.written[output] = sbom
+
+    def test_results_match_single_runs(self) -> None:
+        b_p_b.run_many(self.files, path_to_documentation_schema_1, r"https://acme\.com", read_json)
+
+        for input, output in self.files:
+            expected = b_p_b.build_public_bom(
+                get_sbom(str(input)), path_to_documentation_schema_1, r"https://acme\.com"
+            )
+            self.assertEqual(self.written[output], expected)
+
+    def test_schema_is_checked_once(self) -> None:
+        with unittest.mock.patch.object(
+            b_p_b.Draft7Validator, "check_schema", wraps=Draft7Validator.check_schema
+        ) as check_schema:
+            b_p_b.run_many(self.files, path_to_documentation_schema_1, None, read_json)
+
+        check_schema.assert_called_once()
+
+    def test_messages_are_reported_per_file(self) -> None:
+        def read_internal_metadata(path: Path) -> tuple[dict, str]:
+            sbom, file_type = read_json(path)
+            sbom["metadata"]["component"]["group"] = "com.acme.internal"
+            return sbom, file_type
+
+        # The messages are only attributed to the file when they reach the handlers of the root
+        # logger
+        with self.assertLogs() as log:
+            b_p_b.run_many(
+                self.files[:1], path_to_documentation_schema_1, None, read_internal_metadata
+            )
+
+        self.assertEqual(
+            [
+                (record.levelname, record.msg.message, record.msg.module_name)
+                for record in log.records
+            ],
+            [
+                ("WARNING", "metadata.component not removed", path_to_sbom),
+                ("INFO", "Public SBOM written", path_to_sbom),
+            ],
+        )
+
+    def test_other_files_are_written_on_error(self) -> None:
+        def read_or_fail(path: Path) -> tuple[dict, str]:
+            if path == self.files[0][0]:
+                raise AppError("Failed to load input file", "Invalid JSON")
+            return read_json(path)
+
+        with self.assertLogs(b_p_b.logger), self.assertRaises(AppError) as cm:
+            b_p_b.run_many(self.files, path_to_documentation_schema_1, None, read_or_fail)
+
+        self.assertEqual(cm.exception.details.module_name, path_to_sbom)
+        self.assertEqual(list(self.written), [self.files[1][1]])
+
+
 class TestRemoveInternalInformationFromProperties(unittest.TestCase):
     component = {
         "properties": [
@@ -372,6 +664,18 @@ class TestCreateExternalBom(unittest.TestCase):
         expected_message = "metadata.component not removed"
         self.assertTrue(expected_message, log.output)
 
+    def test_build_public_with_validator(self) -> None:
+        validator = b_p_b.create_internal_validator(path_to_documentation_schema_1)
+        expected = b_p_b.build_public_bom(get_sbom(path_to_sbom), path_to_documentation_schema_1)
+
+        public_sbom = b_p_b.build_public_bom(get_sbom(path_to_sbom), None, validator=validator)
+
+        self.assertEqual(public_sbom, expected)
+        with self.assertRaises(ValueError):
+            b_p_b.build_public_bom(
+                get_sbom(path_to_sbom), path_to_documentation_schema_1, validator=validator
+            )
+
     def test_build_public_no_metadata_(self) -> None:
         sbom = {"components": [{"bom-ref": "comp1", "group": "com.acme.internal"}]}
         expected = {}
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cdxev.auxiliary.cache import (
+    JsonCache,
+    default_cache_dir,
+    hash_file,
+    hash_json,
+)
+
+
+class TestDefaultCacheDir(unittest.TestCase):
+    def test_xdg_cache_home(self) -> None:
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "/somewhere"}):
+            self.assertEqual(default_cache_dir(), Path("/somewhere") / "cdx-ev")
+
+    def test_home_fallback(self) -> None:
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": ""}), mock.patch("os.name", "posix"):
+            self.assertEqual(default_cache_dir(), Path.home() / ".cache" / "cdx-ev")
+
+
+class TestHashing(unittest.TestCase):
+    def test_hash_json_ignores_key_order(self) -> None:
+        self.assertEqual(hash_json({"a": 1, "b": [1, 2]}), hash_json({"b": [1, 2], "a": 1}))
+
+    def test_hash_json_differs_on_content(self) -> None:
+        self.assertNotEqual(hash_json({"a": 1}), hash_json({"a": 2}))
+
+    def test_hash_file(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "file"
+            path.write_bytes(b"content")
+            self.assertEqual(
+                hash_file(path),
+                "ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73",
+            )
+
+
+class TestJsonCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = TemporaryDirectory()
+        self.directory = Path(self.tempdir.name) / "cache"
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def test_miss(self) -> None:
+        cache = JsonCache(self.directory)
+        self.assertIsNone(cache.get("abc"))
+
+    def test_roundtrip(self) -> None:
+        cache = JsonCache(self.directory)
+        cache.put("abc", {"errors": ["x"]})
+        self.assertEqual(cache.get("abc"), {"errors": ["x"]})
+
+    def test_corrupt_entry_is_a_miss(self) -> None:
+        cache = JsonCache(self.directory)
+        cache.put("abc", [])
+        (self.directory / "abc.json").write_text("{not json", encoding="utf_8")
+        self.assertIsNone(cache.get("abc"))
+
+    def test_unwritable_directory_is_ignored(self) -> None:
+        file = Path(self.tempdir.name) / "file"
+        file.write_text("", encoding="utf_8")
+        cache = JsonCache(file / "cache")
+        cache.put("abc", [])
+        self.assertIsNone(cache.get("abc"))
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = JsonCache(self.directory, max_size=25)
+        cache.put("a", "0123456789")
+        cache.put("b", "0123456789")
+        os.utime(self.directory / "a.json", (1, 1))
+        os.utime(self.directory / "b.json", (2, 2))
+
+        # Reading "a" makes it the most recently used entry
+        cache.get("a")
+        cache.put("c", "0123456789")
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
@@ -1,34 +1,44 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import io
+import json
 import logging
 import os
+import typing as t
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
 
 import cdxev.log as log
+from cdxev.validator import customreports
 from cdxev.validator.customreports import GitLabCQReporter, WarningsNgReporter
 
 
 # noinspection PyUnresolvedReferences
 class WarningsNgTestCase(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls) -> None:
+    def setUp(self) -> None:
         formatter = log.LogMessageFormatter()
-        cls.logger = logging.getLogger(__name__)
-        cls.tempdir = TemporaryDirectory()
-        cls.expected_file = os.path.join(cls.tempdir.name, "bom.json")
-        cls.expected_target = os.path.join(cls.tempdir.name, "issues.json")
+        self.logger = logging.getLogger(__name__)
+        self.tempdir = TemporaryDirectory()
+        self.expected_file = os.path.join(self.tempdir.name, "bom.json")
+        self.expected_target = os.path.join(self.tempdir.name, "issues.json")
         warnings_ng_handler = WarningsNgReporter(
-            Path(cls.expected_file), Path(cls.expected_target)
+            Path(self.expected_file), Path(self.expected_target)
         )
         warnings_ng_handler.setFormatter(formatter)
-        cls.logger.addHandler(warnings_ng_handler)
+        self.logger.addHandler(warnings_ng_handler)
 
-    @classmethod
-    def tearDownClass(cls) -> None:
-        cls.tempdir.cleanup()
+    def tearDown(self) -> None:
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self.tempdir.cleanup()
+
+    def last_issue(self) -> dict:
+        self.logger.handlers[0].close()
+        with open(self.expected_target, encoding="utf_8") as f:
+            return json.load(f)["issues"][-1]
 
     def test_format_full(self) -> None:
         line_start = 10
@@ -52,7 +62,7 @@ class WarningsNgTestCase(unittest.TestCase):
             "description": description,
             "moduleName": module_name,
         }
-        self.assertDictEqual(self.logger.handlers[0].buffer["issues"][-1], expected_buffer)
+        self.assertDictEqual(self.last_issue(), expected_buffer)
 
     def test_format_without_line(self) -> None:
         line_start = None
@@ -76,7 +86,7 @@ class WarningsNgTestCase(unittest.TestCase):
             "moduleName": module_name,
             "lineStart": 0,
         }
-        self.assertDictEqual(self.logger.handlers[0].buffer["issues"][-1], expected_buffer)
+        self.assertDictEqual(self.last_issue(), expected_buffer)
 
     def test_format_without_module(self) -> None:
         line_start = 10
@@ -100,7 +110,7 @@ class WarningsNgTestCase(unittest.TestCase):
             "description": description,
             "moduleName": "",
         }
-        self.assertDictEqual(self.logger.handlers[0].buffer["issues"][-1], expected_buffer)
+        self.assertDictEqual(self.last_issue(), expected_buffer)
 
     def test_wrong_format(self) -> None:
         with self.assertRaises(TypeError) as exc:
@@ -114,9 +124,29 @@ class WarningsNgTestCase(unittest.TestCase):
         module_name = None
         msg_obj = log.LogMessage(message, description, module_name, line_start)
         self.logger.error(msg_obj)
-        with mock.patch("pathlib.Path.write_text", mock.mock_open()) as write_text_mocked:
-            self.logger.handlers[0].close()
-        self.assertIn('"origin": "CycloneDX Editor Validator"', write_text_mocked.call_args[0][0])
+        self.logger.handlers[0].close()
+        with open(self.expected_target, encoding="utf_8") as f:
+            self.assertIn('"origin": "CycloneDX Editor Validator"', f.read())
+
+    def test_close_without_issues(self) -> None:
+        self.logger.handlers[0].close()
+        with open(self.expected_target, encoding="utf_8") as f:
+            self.assertEqual(f.read(), json.dumps({"issues": []}, indent=4))
+
+    def test_output_equals_json_dumps(self) -> None:
+        for i in range(3):
+            self.logger.error(log.LogMessage("message", f"description {i}", "module", i))
+        self.logger.handlers[0].close()
+        with open(self.expected_target, encoding="utf_8") as f:
+            content = f.read()
+        self.assertEqual(content, json.dumps(json.loads(content), indent=4))
+        self.assertEqual(len(json.loads(content)["issues"]), 3)
+
+    def test_issues_are_written_before_close(self) -> None:
+        # Enough issues to exceed the write buffer
+        for i in range(100):
+            self.logger.error(log.LogMessage("message", "description " * 20, "module", i))
+        self.assertGreater(os.path.getsize(self.expected_target), 0)
 
     def test_file_path_missing(self) -> None:
         self.logger.handlers[0].file_path = None
@@ -139,27 +169,29 @@ class WarningsNgTestCase(unittest.TestCase):
             "description": description,
             "moduleName": "",
         }
-        self.assertDictEqual(self.logger.handlers[0].buffer["issues"][-1], expected_buffer)
-        self.logger.handlers[0].file_path = Path(self.expected_file)
+        self.assertDictEqual(self.last_issue(), expected_buffer)
 
 
 class TestGitLabCQReporter(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        cls.file_path = Path("test.log")
-        cls.target = mock.MagicMock()
-        cls.reporter = GitLabCQReporter(cls.file_path, cls.target)
+    def setUp(self):
+        self.file_path = Path("test.log")
+        self.target = io.StringIO()
+        self.reporter = GitLabCQReporter(self.file_path, self.target)
+
+    def issues(self, reporter: GitLabCQReporter) -> list:
+        reporter.close()
+        return json.loads(t.cast(io.StringIO, reporter.target).getvalue())
 
     def test_emit(self):
         record = mock.MagicMock()
         record.exc_info = None
         record.msg = log.LogMessage("Test Message", "test", "module", 10)
-        self.reporter.buffer = []
         self.reporter.emit(record)
-        self.assertEqual(len(self.reporter.buffer), 1)
-        self.assertEqual(self.reporter.buffer[0]["description"], "test")
-        self.assertEqual(self.reporter.buffer[0]["location"]["path"], "test.log")
-        self.assertEqual(self.reporter.buffer[0]["location"]["lines"]["begin"], 10)
+        issues = self.issues(self.reporter)
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0]["description"], "test")
+        self.assertEqual(issues[0]["location"]["path"], "test.log")
+        self.assertEqual(issues[0]["location"]["lines"]["begin"], 10)
 
     def test_type_error(self):
         record = mock.MagicMock()
@@ -171,7 +203,7 @@ class TestGitLabCQReporter(unittest.TestCase):
         self.assertEqual("GitLabFormatter cannot process string messages", exc.exception.args[0])
 
     def test_emit_with_frame(self):
-        handler = GitLabCQReporter(None, self.target)
+        handler = GitLabCQReporter(None, io.StringIO())
         record = mock.MagicMock()
         record.msg = log.LogMessage("Test Message", "test", "module", 10)
         record.exc_info = (None, None, mock.MagicMock())
@@ -180,15 +212,50 @@ class TestGitLabCQReporter(unittest.TestCase):
             mock_extract_tb.return_value = [mock.MagicMock(filename="test.py", lineno=30)]
             handler.emit(record)
 
-        self.assertEqual(len(handler.buffer), 1)
-        self.assertEqual(handler.buffer[0]["location"]["lines"]["begin"], 30)
-        self.assertEqual(handler.buffer[0]["location"]["path"], "test.py")
+        issues = self.issues(handler)
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0]["location"]["lines"]["begin"], 30)
+        self.assertEqual(issues[0]["location"]["path"], "test.py")
 
     def test_close(self):
-        self.reporter.buffer = [{"issue": "1"}, {"issue": "2"}]
+        for i in range(2):
+            record = mock.MagicMock()
+            record.exc_info = None
+            record.msg = log.LogMessage("Test Message", f"issue {i}", "module", i)
+            self.reporter.emit(record)
         self.reporter.close()
-        self.assertEqual(self.target.write.call_count, 1)
-        expected_output = (
-            '[\n    {\n        "issue": "1"\n    }' + ',\n    {\n        "issue": "2"\n    }\n]'
+        output = self.target.getvalue()
+        self.assertEqual(output, json.dumps(json.loads(output), indent=4))
+        self.assertEqual(
+            [issue["description"] for issue in json.loads(output)], ["issue 0", "issue 1"]
         )
-        self.assertEqual(self.target.write.call_args[0][0], expected_output)
+
+    def test_close_without_issues(self):
+        self.reporter.close()
+        self.reporter.close()
+        self.assertEqual(self.target.getvalue(), "[]")
+
+    def test_max_issues(self):
+        reporter = GitLabCQReporter(self.file_path, io.StringIO(), max_issues=2)
+        for i in range(5):
+            record = mock.MagicMock()
+            record.exc_info = None
+            record.msg = log.LogMessage("Test Message", f"issue {i}", "module", i)
+            reporter.emit(record)
+
+        self.assertEqual(reporter.written, 2)
+        self.assertEqual(reporter.omitted, 3)
+        self.assertEqual(
+            [issue["description"] for issue in self.issues(reporter)], ["issue 0", "issue 1"]
+        )
+
+
+class TestStreamingReporter(unittest.TestCase):
+    def test_format_record_is_required(self):
+        class IncompleteReporter(customreports._StreamingReporter):
+            _prefix = "["
+            _suffix = "]"
+            _depth = 1
+
+        with self.assertRaises(TypeError):
+            IncompleteReporter(Path("bom.json"), io.StringIO())  # type: ignore[abstract]
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import typing as t
+import unittest
+
+import jsonschema
+import referencing
+from jsonschema.exceptions import FormatError
+
+from cdxev.validator import keywords
+from cdxev.validator.keywords import json_key
+
+LARGE_ENUM = [f"value-{i}" for i in range(keywords.ENUM_LOOKUP_THRESHOLD)] + [
+    1,
+    True,
+    None,
+    ["a", 1],
+    {"a": 1},
+]
+
+
+def error_messages(schema: dict, instance: object, fast: bool) -> list[str]:
+    validator_cls = jsonschema.Draft202012Validator
+    if fast:
+        validator_cls = keywords.extend(validator_cls)  # type: ignore[assignment]
+    return sorted(e.message for e in validator_cls(schema).iter_errors(instance))
+
+
+class TestJsonKey(unittest.TestCase):
+    def test_bool_is_not_number(self) -> None:
+        self.assertNotEqual(json_key(True), json_key(1))
+        self.assertNotEqual(json_key(False), json_key(0))
+        self.assertNotEqual(json_key([True]), json_key([1]))
+
+    def test_int_equals_float(self) -> None:
+        self.assertEqual(json_key(1), json_key(1.0))
+
+    def test_string_is_not_number(self) -> None:
+        self.assertNotEqual(json_key("1"), json_key(1))
+
+    def test_object_member_order_is_insignificant(self) -> None:
+        self.assertEqual(json_key({"a": 1, "b": [2]}), json_key({"b": [2], "a": 1}))
+
+    def test_array_order_is_significant(self) -> None:
+        self.assertNotEqual(json_key([1, 2]), json_key([2, 1]))
+
+    def test_array_is_not_object(self) -> None:
+        self.assertNotEqual(json_key([]), json_key({}))
+
+
+class TestEnum(unittest.TestCase):
+    def test_matches_reference_implementation(self) -> None:
+        schema = {"enum": LARGE_ENUM}
+        for instance in [
+            "value-3",
+            "value",
+            1,
+            1.0,
+            True,
+            False,
+            0,
+            None,
+            ["a", 1],
+            ["a", True],
+            {"a": 1},
+            {"a": "1"},
+        ]:
+            with self.subTest(instance=instance):
+                self.assertEqual(
+                    error_messages(schema, instance, fast=True),
+                    error_messages(schema, instance, fast=False),
+                )
+
+    def test_small_enum(self) -> None:
+        schema = {"enum": ["a", "b"]}
+        self.assertEqual(error_messages(schema, "a", fast=True), [])
+        self.assertEqual(error_messages(schema, "c", fast=True), ["'c' is not one of ['a', 'b']"])
+
+
+class TestUniqueItems(unittest.TestCase):
+    def test_matches_reference_implementation(self) -> None:
+        schema = {"uniqueItems": True}
+        for instance in [
+            [],
+            [{"a": 1}, {"a": 2}],
+            [{"a": 1, "b": 2}, {"b": 2, "a": 1}],
+            [1, True],
+            [1, 1.0],
+            [[1], [True]],
+            [0, False, None],
+            "not an array",
+        ]:
+            with self.subTest(instance=instance):
+                self.assertEqual(
+                    error_messages(schema, instance, fast=True),
+                    error_messages(schema, instance, fast=False),
+                )
+
+    def test_disabled(self) -> None:
+        self.assertEqual(error_messages({"uniqueItems": False}, [1, 1], fast=True), [])
+
+
+class TestExtend(unittest.TestCase):
+    def test_other_dialects_are_extended(self) -> None:
+        validator_cls = keywords.extend(jsonschema.Draft202012Validator)
+        validator = validator_cls({})
+        evolved = validator.evolve(schema={"$schema": "http://json-schema.org/draft-07/schema#"})
+
+        self.assertEqual(type(evolved).META_SCHEMA, jsonschema.Draft7Validator.META_SCHEMA)
+        self.assertIsNot(
+            type(evolved).VALIDATORS["uniqueItems"],
+            jsonschema.Draft7Validator.VALIDATORS["uniqueItems"],
+        )
+        self.assertIs(validator.evolve(schema={}).__class__, validator_cls)
+
+    def test_validation_across_dialects(self) -> None:
+        registry = referencing.Registry().with_resource(
+            "spdx.schema.json",
+            referencing.Resource.from_contents(
+                {"$schema": "http://json-schema.org/draft-07/schema#", "enum": LARGE_ENUM}
+            ),
+        )
+        validator = keywords.extend(jsonschema.Draft202012Validator)(
+            {"items": {"$ref": "spdx.schema.json"}}, registry=registry
+        )
+        self.assertEqual(
+            [e.message for e in validator.iter_errors(["value-1", "foo"])],
+            [f"'foo' is not one of {LARGE_ENUM!r}"],
+        )
+
+
+class TestCachingFormatChecker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls: list[object] = []
+        self.checker = keywords.CachingFormatChecker()
+
+        @self.checker.checks("even", raises=ValueError)
+        def is_even(instance: object) -> bool:
+            self.calls.append(instance)
+            return int(t.cast(str, instance)) % 2 == 0
+
+    def test_outcome_is_remembered(self) -> None:
+        self.checker.check("2", "even")
+        self.checker.check("2", "even")
+        for _ in range(2):
+            with self.assertRaises(FormatError) as cm:
+                self.checker.check("3", "even")
+            self.assertEqual(cm.exception.message, "'3' is not a 'even'")
+
+        self.assertEqual(self.calls, ["2", "3"])
+
+    def test_cause_is_preserved(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(FormatError) as cm:
+                self.checker.check("x", "even")
+            self.assertIsInstance(cm.exception.cause, ValueError)
+
+    def test_non_strings_are_not_cached(self) -> None:
+        self.checker.check(2, "even")
+        self.checker.check(2, "even")
+        self.assertEqual(self.calls, [2, 2])
+
+    def test_unselected_formats_are_not_checked(self) -> None:
+        checker = keywords.CachingFormatChecker(["date-time", "no-such-format"])
+        self.assertEqual(list(checker.checkers), ["date-time"])
+        checker.check("not an email", "email")
+        with self.assertRaises(FormatError):
+            checker.check("not a date", "date-time")
+
+    def test_used_formats(self) -> None:
+        schemas = [
+            {"properties": {"a": {"format": "email"}, "format": {"type": "string"}}},
+            {"anyOf": [{"format": "uri"}, {"items": [{"format": "date-time"}]}]},
+        ]
+        self.assertEqual(keywords.used_formats(schemas), {"email", "uri", "date-time"})
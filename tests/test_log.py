@@ -74,3 +74,35 @@ class LogFormatterTestCase(unittest.TestCase):
         msg = self.log_stream.getvalue()
         expected = "INFO: message (at line 10) - description\n"
         self.assertEqual(expected, msg)
+
+
+class CollectMessagesTestCase(unittest.TestCase):
+    def test_messages_are_collected_and_attributed(self):
+        logger = logging.getLogger("cdxev.test_collect_messages")
+        logger.setLevel(logging.INFO)
+        attributed = log.LogMessage("Attributed", "description", "other.json")
+
+        with self.assertNoLogs(), log.collect_messages(logger, "input.json") as messages:
+            logger.info(log.LogMessage("Message", "description"))
+            logger.warning("Plain %s", "text")
+            logger.error(attributed)
+
+        self.assertEqual(
+            messages,
+            [
+                (logging.INFO, log.LogMessage("Message", "description", "input.json")),
+                (logging.WARNING, log.LogMessage("Plain text", "", "input.json")),
+                (logging.ERROR, attributed),
+            ],
+        )
+        self.assertEqual(logger.handlers, [])
+        self.assertTrue(logger.propagate)
+
+    def test_relay_messages(self):
+        logger = logging.getLogger("cdxev.test_collect_messages")
+        message = log.LogMessage("Message", "description", "input.json")
+
+        with self.assertLogs(logger, logging.INFO) as cm:
+            log.relay_messages(logger, [(logging.INFO, message)])
+
+        self.assertEqual([(r.levelno, r.msg) for r in cm.records], [(logging.INFO, message)])
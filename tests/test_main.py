@@ -9,10 +9,12 @@ from pathlib import Path
 from cdxev.__main__ import (
     InputFileError,
     _set_target_update_id,
+    create_parser,
     load_json,
     load_xml,
     read_sbom,
 )
+from cdxev.validator import SchemaSource
 
 
 class TestSupplements(unittest.TestCase):
@@ -46,6 +48,39 @@ class TestSupplements(unittest.TestCase):
         self.assertIn("XML files aren't supported", ie.exception.details.description)
 
 
+class TestValidateCli(unittest.TestCase):
+    def test_schemas_keep_command_line_order(self) -> None:
+        args = create_parser().parse_args(
+            [
+                "validate",
+                "--schema-type",
+                "custom",
+                "--schema-path",
+                "schema.json",
+                "--schema-type",
+                "default",
+                "bom.json",
+            ]
+        )
+
+        self.assertEqual(
+            args.schemas,
+            [
+                SchemaSource(schema_type="custom"),
+                SchemaSource(schema_path=Path("schema.json")),
+                SchemaSource(schema_type="default"),
+            ],
+        )
+        self.assertEqual(args.schema_type, ["custom", "default"])
+        self.assertEqual(args.schema_path, [Path("schema.json")])
+
+    def test_no_schemas(self) -> None:
+        args = create_parser().parse_args(["validate", "bom.json"])
+
+        self.assertEqual(args.schemas, [])
+        self.assertIsNone(args.schema_type)
+
+
 class TestSetCliHelpers(unittest.TestCase):
     def _base_set_args(self) -> Namespace:
         return Namespace(
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import io
+import json
+import typing as t
+import unittest
+from pathlib import Path
+
+import jsonschema
+from jsonschema.exceptions import ValidationError
+
+from cdxev.validator import keywords
+from cdxev.validator.profiling import ValidationProfile, phase
+from cdxev.validator.validate import validate_sbom
+from tests.test_validate import get_test_sbom
+
+
+class TestValidationProfile(unittest.TestCase):
+    def test_phases_accumulate(self) -> None:
+        profile = ValidationProfile()
+        for _ in range(2):
+            with profile.phase("a"):
+                pass
+        with phase(profile, "b"):
+            pass
+        with phase(None, "c"):
+            pass
+
+        self.assertEqual(list(profile.phases), ["a", "b"])
+        self.assertEqual(profile.phases["a"].calls, 2)
+
+    def test_wrapped_keyword_is_lazy(self) -> None:
+        profile = ValidationProfile()
+        produced = []
+
+        def keyword(*args: t.Any) -> t.Iterator[ValidationError]:
+            for i in range(3):
+                produced.append(i)
+                yield ValidationError(str(i))
+
+        schema = {"keyword": True}
+        errors = profile.wrap_keyword("keyword", keyword)(None, True, None, schema)
+        self.assertEqual(next(errors).message, "0")
+        self.assertEqual(produced, [0])
+        t.cast(t.Generator, errors).close()
+
+        self.assertEqual(profile.keywords["keyword"].calls, 1)
+        self.assertIn("<unknown>/keyword", profile.locations)
+
+    def test_locations(self) -> None:
+        profile = ValidationProfile()
+        schema = {"properties": {"a/b": {"enum": list(range(20))}}}
+        profile.add_schema("schema.json", schema)
+        validator = keywords.extend(jsonschema.Draft202012Validator, wrap=profile.wrap_keyword)(
+            schema
+        )
+
+        self.assertFalse(validator.is_valid({"a/b": 20}))
+        self.assertEqual(
+            set(profile.locations),
+            {"schema.json#/properties", "schema.json#/properties/a~1b/enum"},
+        )
+
+    def test_validate_sbom(self) -> None:
+        profile = ValidationProfile()
+        validate_sbom(
+            sbom=get_test_sbom(),
+            input_format="json",
+            file=Path("bom.json"),
+            report_format=None,
+            report_path=None,
+            schema_type="default",
+            filename_regex=None,
+            schema_path=None,
+            profile=profile,
+        )
+
+        for name in ("schema loading", "registry construction", "validation"):
+            self.assertIn(name, profile.phases)
+        self.assertIn("$ref", profile.keywords)
+
+        summary = profile.to_dict(top=2)
+        self.assertEqual(len(summary["keywords"]), 2)
+        self.assertGreaterEqual(summary["keywords"][0]["time"], summary["keywords"][1]["time"])
+
+    def test_write(self) -> None:
+        profile = ValidationProfile()
+        with profile.phase("validation"):
+            pass
+
+        text = io.StringIO()
+        profile.write(text, top=5, as_json=False)
+        self.assertIn("validation", text.getvalue())
+        self.assertIn("Top 5 keywords", text.getvalue())
+
+        as_json = io.StringIO()
+        profile.write(as_json, top=5, as_json=True)
+        self.assertEqual(json.loads(as_json.getvalue())["phases"][0]["phase"], "validation")
@@ -840,3 +840,18 @@ class TestDependencyFunctions(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestUniqueList(unittest.TestCase):
+    def test_append_keeps_order_and_skips_present_items(self) -> None:
+        items = ["a", "b", "a"]
+        unique = sbf.UniqueList(items)
+
+        self.assertTrue(unique.append("c"))
+        self.assertFalse(unique.append("b"))
+        unique.extend(["d", "c", "e", "d"])
+
+        self.assertIs(unique.items, items)
+        self.assertEqual(items, ["a", "b", "a", "c", "d", "e"])
+        self.assertIn("e", unique)
+        self.assertNotIn("f", unique)
@@ -1,9 +1,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import io
 import json
+import logging
 import pathlib
+import re
 import typing as t
 import unittest
+from unittest import mock
 
 import cdxev.error
 import cdxev.set
@@ -1617,3 +1621,405 @@ class TestVersionRange(unittest.TestCase):
         self.assertNotIn("copyright", sbom["components"][1])
         self.assertNotIn("copyright", sbom["components"][2])
         self.assertNotIn("copyright", sbom["components"][3]["components"][1])
+
+    def test_version_range_after_renaming_update(self) -> None:
+        sbom: dict[str, t.Any] = {
+            "components": [
+                {"name": "old-name", "group": "org.acme", "version": "1.0.0"},
+                {"name": "new-name", "group": "org.acme", "version": "2.0.0"},
+                {"name": "new-name", "group": "org.other", "version": "1.0.0"},
+            ]
+        }
+        updates = [
+            {
+                "id": {"name": "old-name", "group": "org.acme", "version": "1.0.0"},
+                "set": {"name": "new-name"},
+            },
+            {
+                "id": {
+                    "name": "new-name",
+                    "group": "org.acme",
+                    "version-range": "vers:pypi/<2.0.0",
+                },
+                "set": {"copyright": "range matched"},
+            },
+        ]
+        cfg = cdxev.set.SetConfig(True, True, [], None)
+
+        cdxev.set.run(sbom, updates, cfg)
+
+        self.assertEqual(sbom["components"][0].get("copyright"), "range matched")
+        self.assertNotIn("copyright", sbom["components"][1])
+        self.assertNotIn("copyright", sbom["components"][2])
+
+    def test_coordinates_index_matches_component_map(self) -> None:
+        ctx = cdxev.set.Context(cdxev.set.SetConfig(True, True, [], None), self.sbom_fixture)
+        ctx.component_map = cdxev.set._map_out_components(self.sbom_fixture)
+        ctx.coordinates_index = cdxev.set._index_coordinates(ctx.component_map)
+        component = self.sbom_fixture["components"][0]
+        update = {"id": ComponentIdentity.create(component, True), "set": {"group": "org.new"}}
+
+        cdxev.set._do_update(component, update, ctx)
+
+        expected = cdxev.set._index_coordinates(cdxev.set._map_out_components(self.sbom_fixture))
+        self.assertEqual(ctx.coordinates_index, expected)
+        self.assertIn((component["name"], "org.new"), ctx.coordinates_index)
+
+    def test_versions_are_parsed_once(self) -> None:
+        updates = [
+            {
+                "id": {
+                    "name": "web-framework",
+                    "group": "org.acme",
+                    "version-range": version_range,
+                },
+                "set": {"copyright": "1990 Acme Inc"},
+            }
+            for version_range in ("vers:pypi/>3.0.0", "vers:pypi/<6.0.0")
+        ]
+        cfg = cdxev.set.SetConfig(True, False, [], None)
+        versions = {
+            component["version"]
+            for component in self.sbom_fixture["components"]
+            if component["name"] == "web-framework"
+        }
+
+        cdxev.set._parse_version.cache_clear()
+        cdxev.set.run(self.sbom_fixture, updates, cfg)
+
+        self.assertEqual(cdxev.set._parse_version.cache_info().misses, len(versions))
+
+
+class TestComponentMap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom: dict[str, t.Any] = {
+            "metadata": {"component": {"name": "app", "version": "1.0.0"}},
+            "components": [
+                {
+                    "name": "parent",
+                    "version": "1.0.0",
+                    "components": [
+                        {"name": "child", "version": "1.0.0", "purl": "pkg:generic/child@1.0.0"},
+                        {
+                            "name": "child",
+                            "version": "2.0.0",
+                            "components": [{"name": "grandchild", "version": "1.0.0"}],
+                        },
+                    ],
+                },
+                {"name": "other", "group": "org.acme", "version": "1.0.0"},
+            ],
+        }
+        cfg = cdxev.set.SetConfig(True, True, [], None)
+        self.ctx = cdxev.set.Context(cfg, self.sbom)
+        self.ctx.component_map = cdxev.set._map_out_components(self.sbom)
+        self.ctx.coordinates_index = cdxev.set._index_coordinates(self.ctx.component_map)
+
+    def update(self, component: dict, update_set: dict) -> None:
+        update = {"id": ComponentIdentity.create(component, True), "set": update_set}
+        cdxev.set._do_update(component, update, self.ctx)
+
+    def assert_map_is_rebuilt(self) -> None:
+        def normalize(map: dict[Key, list[dict]]) -> dict[Key, list[int]]:
+            return {key: sorted(id(c) for c in components) for key, components in map.items()}
+
+        expected = cdxev.set._map_out_components(self.sbom)
+        self.assertEqual(normalize(self.ctx.component_map), normalize(expected))
+        self.assertEqual(self.ctx.coordinates_index, cdxev.set._index_coordinates(expected))
+
+    def test_replace_components(self) -> None:
+        parent = self.sbom["components"][0]
+        kept = parent["components"][1]
+        self.update(parent, {"components": [kept, {"name": "new-child", "version": "1.0.0"}]})
+
+        self.assert_map_is_rebuilt()
+        self.assertNotIn(Key.from_purl("pkg:generic/child@1.0.0"), self.ctx.component_map)
+        self.assertIn(
+            Key.from_coordinates(name="new-child", version="1.0.0"), self.ctx.component_map
+        )
+
+    def test_delete_components(self) -> None:
+        self.update(self.sbom["components"][0], {"components": None})
+
+        self.assert_map_is_rebuilt()
+        self.assertNotIn(
+            Key.from_coordinates(name="grandchild", version="1.0.0"), self.ctx.component_map
+        )
+
+    def test_merge_component(self) -> None:
+        self.update(
+            self.sbom["components"][0],
+            {"components": {"name": "other", "group": "org.acme", "version": "1.0.0"}},
+        )
+
+        self.assert_map_is_rebuilt()
+        key = Key.from_coordinates(name="other", group="org.acme", version="1.0.0")
+        self.assertEqual(len(self.ctx.component_map[key]), 2)
+
+    def test_add_components_to_leaf(self) -> None:
+        self.update(self.sbom["components"][1], {"components": [{"name": "leaf-child"}]})
+
+        self.assert_map_is_rebuilt()
+
+    def test_replace_components_and_rename(self) -> None:
+        self.update(
+            self.sbom["components"][0]["components"][1],
+            {"name": "renamed", "components": [{"name": "grandchild", "version": "2.0.0"}]},
+        )
+
+        self.assert_map_is_rebuilt()
+
+    def test_components_shared_by_several_targets(self) -> None:
+        # An update with several targets sets the same components on all of them
+        shared = [{"name": "shared", "version": "1.0.0"}]
+        for target in self.sbom["components"]:
+            self.update(target, {"components": shared})
+        self.assert_map_is_rebuilt()
+
+        self.update(self.sbom["components"][0], {"components": None})
+
+        self.assert_map_is_rebuilt()
+        self.assertEqual(
+            self.ctx.component_map[Key.from_coordinates(name="shared", version="1.0.0")], shared
+        )
+
+    def test_shared_components_can_be_updated_after_removal_from_one_target(self) -> None:
+        self.sbom["components"] = [
+            {"name": "p1", "version": "1"},
+            {"name": "p2", "version": "1"},
+        ]
+        updates = [
+            {
+                "id": {"namePattern": "p.", "version": "1"},
+                "set": {"components": [{"name": "child", "version": "1"}]},
+            },
+            {"id": {"name": "p1", "version": "1"}, "set": {"components": None}},
+            {"id": {"name": "child", "version": "1"}, "set": {"description": "x"}},
+        ]
+
+        cdxev.set.run(self.sbom, updates, self.ctx.config)
+
+        self.assertNotIn("components", self.sbom["components"][0])
+        self.assertEqual(self.sbom["components"][1]["components"][0]["description"], "x")
+
+    def test_remove_one_of_shared_occurrences(self) -> None:
+        child = {"name": "shared", "version": "1.0.0"}
+        self.update(self.sbom["components"][0], {"components": [child]})
+        self.update(self.sbom["components"][1], {"components": [child, child]})
+        self.assert_map_is_rebuilt()
+
+        self.update(self.sbom["components"][1], {"components": [child]})
+        self.assert_map_is_rebuilt()
+        self.update(self.sbom["components"][0], {"components": None})
+        self.assert_map_is_rebuilt()
+        self.assertEqual(
+            self.ctx.component_map[Key.from_coordinates(name="shared", version="1.0.0")], [child]
+        )
+
+    def test_many_updates(self) -> None:
+        parent = self.sbom["components"][0]
+        for i in range(5):
+            self.update(parent, {"components": [{"name": "child", "version": f"{i}.0.0"}]})
+            self.update(parent, {"components": {"name": "extra", "version": f"{i}.0.0"}})
+
+        self.assert_map_is_rebuilt()
+
+
+class TestRegexBatching(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom: dict[str, t.Any] = {
+            "components": [
+                {"name": "foo-core", "purl": "pkg:npm/foo-core@1.0.0"},
+                {"name": "foo-util", "purl": "pkg:npm/foo-util@1.0.0"},
+                {"name": "bar", "group": "org.acme", "purl": "pkg:maven/org.acme/bar@1.0.0"},
+                {"name": "aa", "components": [{"name": "abab"}]},
+            ]
+        }
+        self.cfg = cdxev.set.SetConfig(True, True, [], None)
+
+    def test_regex_updates_are_resolved_in_one_pass(self) -> None:
+        updates = [
+            {"id": {"namePattern": "foo-.*"}, "set": {"author": "foo"}},
+            {"id": {"purlPattern": "pkg:maven/.*"}, "set": {"author": "maven"}},
+            {"id": {"name": "bar", "group": "org.acme"}, "set": {"copyright": "Acme"}},
+            {"id": {"name": {"regex": "(a)b\\1b|aa"}}, "set": {"author": "backref"}},
+            {"id": {"namePattern": "foo-core"}, "set": {"description": "core"}},
+        ]
+        with mock.patch(
+            "cdxev.set.walk_components", wraps=cdxev.set.walk_components
+        ) as walk_components:
+            cdxev.set.run(self.sbom, updates, self.cfg)
+
+        # One walk to map out the components and one for all regex updates
+        self.assertEqual(walk_components.call_count, 2)
+        components = self.sbom["components"]
+        self.assertEqual([c.get("author") for c in components], ["foo", "foo", "maven", "backref"])
+        self.assertEqual(components[3]["components"][0]["author"], "backref")
+        self.assertEqual(components[0]["description"], "core")
+        self.assertNotIn("description", components[1])
+
+    def test_protected_update_ends_batch(self) -> None:
+        updates = [
+            {"id": {"namePattern": "foo-util"}, "set": {"name": "foo-helper"}},
+            {"id": {"namePattern": "foo-h.*"}, "set": {"author": "renamed"}},
+            {"id": {"namePattern": "foo-u.*"}, "set": {"author": "not renamed"}},
+        ]
+
+        cfg = cdxev.set.SetConfig(True, True, [], None, ignore_missing=True)
+
+        cdxev.set.run(self.sbom, updates, cfg)
+
+        # The later updates see the new name
+        self.assertEqual(self.sbom["components"][1]["author"], "renamed")
+
+    def test_combine_patterns(self) -> None:
+        patterns = [re.compile("^(?:foo-.*)$"), re.compile("^(?:bar)$")]
+        combined = cdxev.set._combine_patterns(patterns)
+        assert combined is not None
+        for value in ("foo-core", "bar", "barbar", "foo", "bar\n"):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    combined.fullmatch(value) is not None,
+                    any(p.fullmatch(value) for p in patterns),
+                )
+
+        self.assertIsNone(cdxev.set._combine_patterns([re.compile("(a)\\1"), patterns[0]]))
+        self.assertIsNone(cdxev.set._combine_patterns([patterns[0]]))
+
+
+class TestPlan(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom: dict[str, t.Any] = {
+            "components": [
+                {"name": "foo", "version": "1.0.0", "purl": "pkg:npm/foo@1.0.0"},
+                {"name": "foo", "version": "2.0.0"},
+                {"name": "bar", "version": "1.0.0"},
+            ]
+        }
+        self.updates: list[dict[str, t.Any]] = [
+            {"id": {"purl": "pkg:npm/foo@1.0.0"}, "set": {"author": "a"}},
+            {"id": {"name": "foo", "version-range": "vers:generic/*"}, "set": {"author": "b"}},
+            {"id": {"namePattern": "foo|bar"}, "set": {"author": "c"}},
+            {"id": {"namePattern": "foo|bar"}, "set": {"description": "d"}},
+            {"id": {"name": "baz"}, "set": {"author": "e"}},
+        ]
+        self.cfg = cdxev.set.SetConfig(True, False, [], None)
+
+    def test_plan(self) -> None:
+        original = json.loads(json.dumps(self.sbom))
+
+        plan = cdxev.set.plan(self.sbom, self.updates, self.cfg)
+
+        self.assertEqual(
+            plan.matches,
+            [
+                ("PURL[pkg:npm/foo@1.0.0]", 1),
+                ("COORDINATES[foo@vers:generic/*]", 2),
+                ("name[regex:foo|bar]", 3),
+                ("name[regex:foo|bar]", 3),
+                ("COORDINATES[baz]", 0),
+            ],
+        )
+        self.assertEqual(self.sbom, original)
+
+    def test_write(self) -> None:
+        plan = cdxev.set.UpdatePlan([("PURL[pkg:npm/foo@1.0.0]", 1), ("COORDINATES[baz]", 0)], {})
+        stream = io.StringIO()
+
+        plan.write(stream)
+
+        self.assertIn("COORDINATES[baz]                  0", stream.getvalue())
+        self.assertIn("2 updates, 1 with targets, 1 without targets", stream.getvalue())
+
+    def test_identical_identifiers_are_resolved_once(self) -> None:
+        cdxev.set._compile_updates(self.updates, self.cfg)
+        ctx = cdxev.set._prepare(self.sbom, self.cfg)
+
+        with mock.patch(
+            "cdxev.set._get_regex_targets", wraps=cdxev.set._get_regex_targets
+        ) as get_regex_targets:
+            targets = cdxev.set._resolve_targets(self.updates, ctx, 0)
+
+        self.assertEqual(len(get_regex_targets.call_args.args[1]), 1)
+        self.assertEqual(targets[2], targets[3])
+        self.assertIsNot(targets[2], targets[3])
+
+
+class TestRunMany(unittest.TestCase):
+    def test_updates_are_applied_to_every_sbom(self) -> None:
+        updates = [
+            {"id": {"name": "foo"}, "set": {"licenses": {"license": {"id": "MIT"}}}},
+            {"id": {"namePattern": "f.*"}, "set": {"licenses": {"license": {"id": "BSD"}}}},
+        ]
+        sboms = {
+            "a.json": {"components": [{"name": "foo", "licenses": []}]},
+            "b.json": {"components": [{"name": "foo", "licenses": []}]},
+            "missing.json": {"components": []},
+        }
+        written: dict[str, dict] = {}
+
+        def read_sbom(path: pathlib.Path) -> tuple[dict, str]:
+            return json.loads(json.dumps(sboms[path.name])), "json"
+
+        def write_sbom(sbom: dict, path: pathlib.Path) -> None:
+            written[path.name] = sbom
+
+        files = [(pathlib.Path(name), pathlib.Path("out", name)) for name in sboms]
+        cfg = cdxev.set.SetConfig(True, False, [], None)
+        with mock.patch("cdxev.set.write_sbom", write_sbom):
+            with self.assertRaises(cdxev.error.AppError) as cm:
+                cdxev.set.run_many(files, updates, cfg, read_sbom)
+
+        self.assertEqual(cm.exception.details.module_name, "missing.json")
+        self.assertEqual(list(written), ["a.json", "b.json"])
+        for sbom in written.values():
+            self.assertEqual(
+                sbom["components"][0]["licenses"],
+                [{"license": {"id": "MIT"}}, {"license": {"id": "BSD"}}],
+            )
+
+    def test_messages_are_reported_per_file(self) -> None:
+        updates = [{"id": {"name": "foo"}, "set": {"copyright": "Acme"}}]
+        files = [(pathlib.Path("in", "missing.json"), pathlib.Path("out", "missing.json"))]
+        cfg = cdxev.set.SetConfig(True, False, [], None, ignore_missing=True)
+
+        def read_sbom(path: pathlib.Path) -> tuple[dict, str]:
+            return {"components": []}, "json"
+
+        with mock.patch("cdxev.set.write_sbom"):
+            with self.assertLogs() as logs:
+                cdxev.set.run_many(files, updates, cfg, read_sbom)
+                # Worker processes return the messages of their files instead of logging them
+                messages, error = cdxev.set._apply_to_file(*files[0], updates, cfg, read_sbom)
+
+        self.assertIsNone(error)
+        self.assertEqual(
+            [(level, msg.message, msg.module_name) for level, msg in messages],
+            [(logging.INFO, "Set not performed", str(files[0][0]))],
+        )
+        self.assertEqual(
+            [(r.levelno, r.msg.message, r.msg.module_name) for r in logs.records],
+            [(logging.INFO, "Set not performed", str(files[0][0]))],
+        )
+
+
+class TestCompileCache(unittest.TestCase):
+    def test_expressions_are_compiled_once(self) -> None:
+        updates: list[dict[str, t.Any]] = [
+            {"id": {"namePattern": "foo.*", "version-range": "vers:generic/<2"}, "set": {}}
+            for _ in range(3)
+        ] + [{"id": {"name": "bar", "version-range": "vers:generic/<2"}, "set": {}}]
+        cfg = cdxev.set.SetConfig(True, False, [], None)
+        cdxev.set._compile_regex.cache_clear()
+        cdxev.set._parse_version_range.cache_clear()
+
+        cdxev.set._compile_updates(updates, cfg)
+        with self.assertLogs("cdxev.set", "DEBUG") as logs:
+            cdxev.set._log_compile_cache_info()
+
+        self.assertEqual(cdxev.set._compile_regex.cache_info().misses, 1)
+        self.assertEqual(cdxev.set._compile_regex.cache_info().hits, 2)
+        self.assertEqual(cdxev.set._parse_version_range.cache_info().misses, 1)
+        self.assertEqual(cdxev.set._parse_version_range.cache_info().hits, 3)
+        self.assertIs(updates[0]["id"].name_pattern, updates[2]["id"].name_pattern)
+        self.assertIn("regular expressions 2 hits, 1 misses", logs.output[-1])
@@ -1,15 +1,21 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import copy
 import json
 import logging
 import os
 import typing as t
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import Mock, patch
 
+import jsonschema
+
+import cdxev.validator.validate as validate_module
 from cdxev.error import AppError
 from cdxev.validator.helper import validate_filename
+from cdxev.validator.profiling import ValidationProfile
 from cdxev.validator.validate import validate_sbom
 
 path_to_folder_with_test_sboms = "tests/auxiliary/test_validate_sboms/"
@@ -1326,3 +1332,365 @@ class TestValidateFilename(unittest.TestCase):
             with self.subTest(regex=regex):
                 with self.assertRaises(AppError):
                     validate_filename("bom.json", regex, self.sbom, "default")
+
+
+@patch("cdxev.validator.validate.logger")
+class TestValidationCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = TemporaryDirectory()
+        self.cache_dir = Path(self.tempdir.name)
+        self.sbom = get_test_sbom()
+        self.sbom["metadata"].pop("authors")
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def _validate(self, sbom: dict, **kwargs: t.Any) -> int:
+        args: dict[str, t.Any] = {
+            "input_format": "json",
+            "file": Path(path_to_sbom),
+            "report_format": None,
+            "report_path": None,
+            "schema_type": "custom",
+            "filename_regex": "",
+            "schema_path": None,
+            "cache_dir": self.cache_dir,
+        }
+        args.update(kwargs)
+        return validate_sbom(sbom, **args)
+
+    def test_result_is_reused(self, mock_logger: Mock) -> None:
+        first = self._validate(self.sbom)
+        first_errors = mock_logger.error.call_args_list.copy()
+        mock_logger.reset_mock()
+
+        with patch("cdxev.validator.validate._validate") as mock_validate:
+            second = self._validate(self.sbom)
+
+        mock_validate.assert_not_called()
+        self.assertEqual(first, 1)
+        self.assertEqual(second, 1)
+        self.assertEqual(mock_logger.error.call_args_list, first_errors)
+
+    def test_result_is_not_reused_when_profiling(self, mock_logger: Mock) -> None:
+        self._validate(self.sbom)
+        profile = ValidationProfile()
+
+        with patch("cdxev.validator.validate._validate", wraps=validate_module._validate) as v:
+            result = self._validate(self.sbom, profile=profile)
+
+        v.assert_called_once()
+        self.assertEqual(result, 1)
+        self.assertIn("validation", profile.phases)
+        self.assertTrue(profile.keywords)
+
+    def test_warnings_are_replayed(self, mock_logger: Mock) -> None:
+        self._validate(self.sbom, schema_type="default", file=Path("invalid_name.json"))
+        first_warnings = mock_logger.warning.call_args_list.copy()
+        mock_logger.reset_mock()
+
+        with patch("cdxev.validator.validate._validate") as mock_validate:
+            self._validate(self.sbom, schema_type="default", file=Path("invalid_name.json"))
+
+        mock_validate.assert_not_called()
+        self.assertNotEqual(first_warnings, [])
+        self.assertEqual(mock_logger.warning.call_args_list, first_warnings)
+
+    def test_changed_inputs_are_validated_again(self, mock_logger: Mock) -> None:
+        self._validate(self.sbom)
+        changed_sbom = get_test_sbom()
+        variants: list[tuple[dict, dict[str, t.Any]]] = [
+            (changed_sbom, {}),
+            (self.sbom, {"schema_type": "default"}),
+            (self.sbom, {"filename_regex": "other"}),
+            (self.sbom, {"filename_regex": None}),
+            (self.sbom, {"file": Path("bom.json")}),
+        ]
+        for sbom, kwargs in variants:
+            with self.subTest(kwargs=kwargs):
+                with patch(
+                    "cdxev.validator.validate._validate", wraps=validate_module._validate
+                ) as mock_validate:
+                    self._validate(sbom, **kwargs)
+                mock_validate.assert_called_once()
+
+    def test_custom_schema_is_keyed_by_content(self, mock_logger: Mock) -> None:
+        schema_path = self.cache_dir / "schema.json"
+        schema_path.write_text('{"type": "object"}', encoding="utf_8")
+        self.assertEqual(self._validate(self.sbom, schema_type=None, schema_path=schema_path), 0)
+
+        schema_path.write_text('{"required": ["missing"]}', encoding="utf_8")
+        self.assertEqual(self._validate(self.sbom, schema_type=None, schema_path=schema_path), 1)
+
+    def test_builtin_schema_is_keyed_by_content(self, mock_logger: Mock) -> None:
+        self._validate(self.sbom)
+
+        original = validate_module._bundled_schema_hash
+        with (
+            patch(
+                "cdxev.validator.validate._bundled_schema_hash",
+                lambda filename: "changed" if filename.startswith("bom-") else original(filename),
+            ),
+            patch(
+                "cdxev.validator.validate._validate", wraps=validate_module._validate
+            ) as mock_validate,
+        ):
+            self._validate(self.sbom)
+
+        mock_validate.assert_called_once()
+
+    def test_library_versions_are_part_of_key(self, mock_logger: Mock) -> None:
+        self._validate(self.sbom)
+
+        environment = {**validate_module._cache_environment(), "jsonschema": "0.0.0"}
+        with (
+            patch("cdxev.validator.validate._cache_environment", return_value=environment),
+            patch(
+                "cdxev.validator.validate._validate", wraps=validate_module._validate
+            ) as mock_validate,
+        ):
+            self._validate(self.sbom)
+
+        mock_validate.assert_called_once()
+
+    def test_sbom_is_hashed_once(self, mock_logger: Mock) -> None:
+        baseline = copy.deepcopy(self.sbom)
+        with patch(
+            "cdxev.validator.validate.hash_json", wraps=validate_module.hash_json
+        ) as mock_hash:
+            self._validate(
+                self.sbom,
+                baseline=baseline,
+                additional_schemas=[validate_module.SchemaSource(schema_type="default")],
+            )
+
+        hashed = [call.args[0] for call in mock_hash.call_args_list]
+        self.assertEqual(sum(obj is self.sbom for obj in hashed), 1)
+        self.assertEqual(sum(obj is baseline for obj in hashed), 1)
+
+    def test_no_cache(self, mock_logger: Mock) -> None:
+        self._validate(self.sbom, cache_dir=None)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    def test_schema_check_is_cached(self, mock_logger: Mock) -> None:
+        schema_path = self.cache_dir / "schema.json"
+        schema_path.write_text('{"type": "object"}', encoding="utf_8")
+        check_schema = Mock(wraps=jsonschema.Draft202012Validator.check_schema)
+
+        with patch.object(jsonschema.Draft202012Validator, "check_schema", check_schema):
+            for i in range(2):
+                # A different SBOM each time, so the result isn't served from the cache
+                self.sbom["version"] = i + 1
+                self._validate(self.sbom, schema_type=None, schema_path=schema_path)
+            self.assertEqual(check_schema.call_count, 1)
+
+            schema_path.write_text('{"type": "object", "required": []}', encoding="utf_8")
+            self._validate(self.sbom, schema_type=None, schema_path=schema_path)
+            self.assertEqual(check_schema.call_count, 2)
+
+            self._validate(self.sbom, schema_type=None, schema_path=schema_path, cache_dir=None)
+            self.assertEqual(check_schema.call_count, 3)
+
+    def test_invalid_schema_is_not_cached(self, mock_logger: Mock) -> None:
+        schema_path = self.cache_dir / "schema.json"
+        schema_path.write_text('{"type": 1}', encoding="utf_8")
+        for _ in range(2):
+            with self.assertRaises(AppError):
+                self._validate(self.sbom, schema_type=None, schema_path=schema_path)
+
+
+@patch("cdxev.validator.validate.logger")
+class TestIncrementalValidation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = TemporaryDirectory()
+        self.cache_dir = Path(self.tempdir.name)
+        self.baseline = get_test_sbom()
+        # One invalid component which stays unchanged
+        self.baseline["components"][1]["licenses"] = [{"license": {"id": "no SPDX id"}}]
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def _errors(
+        self,
+        mock_logger: Mock,
+        sbom: dict,
+        baseline: t.Optional[dict] = None,
+        cache_dir: t.Optional[Path] = None,
+    ) -> list:
+        mock_logger.reset_mock()
+        validate_sbom(
+            sbom,
+            "json",
+            Path(path_to_sbom),
+            None,
+            None,
+            "custom",
+            None,
+            None,
+            cache_dir=cache_dir,
+            baseline=baseline,
+        )
+        return mock_logger.error.call_args_list
+
+    def _validated_component_count(self, mock_logger: Mock) -> t.Optional[int]:
+        for call in mock_logger.debug.call_args_list:
+            if call.args[0].startswith("Validating %d of %d components"):
+                return call.args[1]  # type: ignore[no-any-return]
+        return None
+
+    def test_same_result_as_full_validation(self, mock_logger: Mock) -> None:
+        self._errors(mock_logger, self.baseline, cache_dir=self.cache_dir)
+
+        sbom = get_test_sbom()
+        sbom["components"][1] = self.baseline["components"][1]
+        sbom["components"][0].pop("supplier")
+        del sbom["components"][3]
+        sbom["components"].append({"type": "library", "bom-ref": "new", "name": "new"})
+
+        expected = self._errors(mock_logger, sbom)
+        actual = self._errors(mock_logger, sbom, self.baseline, self.cache_dir)
+
+        self.assertEqual(self._validated_component_count(mock_logger), 2)
+        self.assertEqual(sorted(map(str, actual)), sorted(map(str, expected)))
+        self.assertTrue(search_for_word_issues("persistence", actual))
+        self.assertTrue(search_for_word_issues("web-framework", actual))
+        self.assertTrue(search_for_word_issues("new", actual))
+
+    def test_duplicates_of_unchanged_components_are_detected(self, mock_logger: Mock) -> None:
+        self._errors(mock_logger, self.baseline, cache_dir=self.cache_dir)
+
+        sbom = copy.deepcopy(self.baseline)
+        sbom["components"].append(copy.deepcopy(sbom["components"][0]))
+        actual = self._errors(mock_logger, sbom, self.baseline, self.cache_dir)
+
+        self.assertEqual(self._validated_component_count(mock_logger), 0)
+        self.assertTrue(search_for_word_issues("non-unique elements", actual))
+
+    def test_positional_results_are_not_reused(self, mock_logger: Mock) -> None:
+        self.baseline["components"][1].pop("bom-ref")
+        self.baseline["components"][1].pop("name")
+        self._errors(mock_logger, self.baseline, cache_dir=self.cache_dir)
+
+        sbom = copy.deepcopy(self.baseline)
+        sbom["components"].insert(0, sbom["components"].pop(1))
+        expected = self._errors(mock_logger, sbom)
+        actual = self._errors(mock_logger, sbom, self.baseline, self.cache_dir)
+
+        self.assertEqual(self._validated_component_count(mock_logger), 1)
+        self.assertEqual(sorted(map(str, actual)), sorted(map(str, expected)))
+
+    def test_array_keywords_in_root_applicators(self, mock_logger: Mock) -> None:
+        schema_path = self.cache_dir / "schema.json"
+        schema_path.write_text(
+            json.dumps(
+                {
+                    "properties": {"components": {"type": "array"}},
+                    "allOf": [{"properties": {"components": {"maxItems": 1}}}],
+                }
+            ),
+            encoding="utf_8",
+        )
+        baseline = {"specVersion": "1.6", "components": [{"name": "a"}, {"name": "b"}]}
+        sbom = {**copy.deepcopy(baseline), "version": 2}
+
+        def errors(sbom: dict, baseline: t.Optional[dict], cache_dir: t.Optional[Path]) -> list:
+            mock_logger.reset_mock()
+            validate_sbom(
+                sbom,
+                "json",
+                Path(path_to_sbom),
+                None,
+                None,
+                None,
+                None,
+                schema_path,
+                cache_dir=cache_dir,
+                baseline=baseline,
+            )
+            return mock_logger.error.call_args_list
+
+        errors(baseline, None, self.cache_dir)
+        expected = errors(sbom, None, None)
+        actual = errors(sbom, baseline, self.cache_dir)
+
+        self.assertTrue(search_for_word_issues("too long", expected))
+        self.assertEqual(actual, expected)
+
+    def test_builtin_schemas_allow_incremental_validation(self, mock_logger: Mock) -> None:
+        schema_dir = Path(validate_module.__file__).parent.parent / "auxiliary" / "schema"
+        for schema_file in schema_dir.glob("bom-*.schema.json"):
+            with self.subTest(schema=schema_file.name):
+                schema = json.loads(schema_file.read_text(encoding="utf_8_sig"))
+                self.assertTrue(validate_module._is_blind_to_components(schema, is_root=True))
+
+    def test_unknown_baseline(self, mock_logger: Mock) -> None:
+        sbom = get_test_sbom()
+        expected = self._errors(mock_logger, sbom)
+        actual = self._errors(mock_logger, sbom, self.baseline, self.cache_dir)
+
+        self.assertIsNone(self._validated_component_count(mock_logger))
+        self.assertEqual(actual, expected)
+        mock_logger.info.assert_any_call(
+            "No validation results have been recorded for the baseline SBOM. "
+            "Validating all components."
+        )
+
+
+@patch("cdxev.validator.validate.logger")
+class TestMultipleSchemas(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = get_test_sbom()
+        self.sbom["metadata"].pop("authors")
+
+    def _descriptions(self, mock_logger: Mock, **kwargs: t.Any) -> list[str]:
+        mock_logger.reset_mock()
+        validate_sbom(
+            self.sbom,
+            "json",
+            Path(path_to_sbom),
+            None,
+            None,
+            "custom",
+            None,
+            None,
+            **kwargs,
+        )
+        return [c.args[0].description for c in mock_logger.error.call_args_list]
+
+    def test_messages_are_tagged(self, mock_logger: Mock) -> None:
+        single = self._descriptions(mock_logger)
+        multiple = self._descriptions(
+            mock_logger, additional_schemas=[validate_module.SchemaSource(schema_type="default")]
+        )
+
+        self.assertTrue(single)
+        self.assertFalse(any(d.startswith("[") for d in single))
+        self.assertEqual(sorted(d for d in multiple if d.startswith("[custom] ")), multiple)
+        self.assertEqual(sorted(d.removeprefix("[custom] ") for d in multiple), sorted(single))
+
+    def test_errors_of_all_schemas_are_reported(self, mock_logger: Mock) -> None:
+        with TemporaryDirectory() as tmp:
+            schema_path = Path(tmp) / "schema.json"
+            schema_path.write_text(json.dumps({"required": ["does-not-exist"]}))
+            descriptions = self._descriptions(
+                mock_logger,
+                additional_schemas=[validate_module.SchemaSource(schema_path=schema_path)],
+            )
+
+        self.assertIn(f"[{schema_path}] 'does-not-exist' is a required property", descriptions)
+        self.assertIn("[custom] 'authors' is a required property", descriptions)
+
+    def test_registry_is_built_once(self, mock_logger: Mock) -> None:
+        with patch.object(
+            validate_module, "_create_registry", wraps=validate_module._create_registry
+        ) as create_registry:
+            self._descriptions(
+                mock_logger,
+                additional_schemas=[
+                    validate_module.SchemaSource(schema_type="default"),
+                    validate_module.SchemaSource(schema_type="strict"),
+                ],
+            )
+
+        self.assertEqual(create_registry.call_count, 1)